@@ -9,258 +9,357 @@ Author: Generated for Alot1z GitHub Repository Wiki System
 License: MIT License
 """
 
+import argparse
 import json
-import time
+import os
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional
+
+from category_shards import ranked, remove_stale_shards, shard_filename, shard_navigation, shard_slices
+from classifier import CATEGORIES, RepositoryClassifier
+from crawl_checkpoint import CrawlCheckpoint
+from fetch_engine import PageFetcher
+from fragment_cache import FragmentCache
+from http_cache import ResponseCache
+from quality_scoring import score_batch
+from render_manifest import PageWriter, RenderManifest, content_hash, write_if_changed
+from repository_enrichment import RepositoryEnricher, api_url_for, topic_tags
+from repository_filter import RepositoryFilter
+from repository_log import RepositoryLog
+from repository_model import Repository
+from repository_sources import ListingPageSource, PagedSource, create_source, default_source, starred_at
+from repository_store import RepositoryStore, changed_fields, repository_key
+from run_metrics import PROFILE_MODES, RunMetrics, profiled
+from search_index import SearchIndexBuilder
+from similar_repositories import SimilarityIndex
+from star_history import StarHistory
+from update_daemon import DEFAULT_DEBOUNCE, DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, run_daemon
+from wiki_settings import WikiSettings, load_settings
+
+# Bump when the markdown of a category entry changes so cached fragments are re-rendered
+ENTRY_TEMPLATE_VERSION = 1
+ENTRY_FIELDS = ('name', 'url', 'description', 'language', 'license', 'last_updated', 'stars', 'quality_score')
 
 class RepositoryUpdater:
-    def __init__(self, data_file: str, wiki_dir: str):
+    def __init__(self, data_file: str, wiki_dir: str, username: str = "Alot1z",
+                 base_url: str = "https://github.com", max_workers: int = 4,
+                 source: Optional[PagedSource] = None, full_sync_hours: float = 168.0,
+                 enrich: bool = False, settings: Optional[WikiSettings] = None):
         self.data_file = Path(data_file)
+        self.settings = settings or load_settings()
         self.wiki_dir = Path(wiki_dir)
-        self.repositories = []
+        self.username = username
+        self.source = source or ListingPageSource(username, base_url)
+        self.max_workers = max_workers
+        self.repositories = RepositoryStore()
+        self.log = RepositoryLog(self.data_file.parent)
+        self.classifier = RepositoryClassifier()
+        self.filter = RepositoryFilter.from_settings(self.settings)
         self.session = requests.Session()
-        
+        self.cache = ResponseCache(self.data_file.parent / "http_cache.json",
+                                   encode=Repository.to_dict, decode=Repository.from_dict)
+        self.fetcher = PageFetcher(self.session, max_workers=max_workers, cache=self.cache)
+        self.source.configure(self.session)
+        self.fragments = FragmentCache()
+        self.enricher = (RepositoryEnricher(self.fetcher, self.data_file.parent / "enrichment_cache.json",
+                                            api_url_for(self.source)) if enrich else None)
+        self.last_fetch_complete = False
+        self.full_sync_hours = full_sync_hours
+        self.sync_state_file = self.data_file.parent / "sync_state.json"
+        self.sync_state = self._load_sync_state()
+        self.star_history = StarHistory(self.data_file.parent / "star_history")
+        self.search_index = SearchIndexBuilder(self.wiki_dir / "static" / "search-index",
+                                               self.data_file.parent / "search_index_state.json")
+        self.similar = SimilarityIndex(self.wiki_dir / "static" / "similar",
+                                       self.data_file.parent / "similar_index_state.json")
+        self.start_metrics()
+        
+    def start_metrics(self):
+        """Begin a fresh set of run metrics"""
+        self.metrics = RunMetrics('updater', self.data_file.parent / "run_metrics.json")
+        self.source.metrics = self.metrics
+    
+    def save_metrics(self):
+        """Record the fetch and cache statistics and append this run to the metrics file"""
+        self.metrics.count('repositories', len(self.repositories))
+        self.metrics.record('fetcher', self.fetcher.stats())
+        self.metrics.record('http_cache', self.cache.stats())
+        self.metrics.record('filters', self.filter.stats())
+        return self.metrics.save()
+    
     def load_existing_data(self):
-        """Load existing repository data from JSON file"""
+        """Load existing repository data from the repository log"""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.repositories = data.get('repositories', [])
+            with self.metrics.stage('load'):
+                if not self.log.exists():
+                    # First run on the log store: seed it from the exported JSON
+                    self.log.import_json(self.data_file)
+                self.repositories = RepositoryStore(self.log.iter_records())
             print(f"✅ Loaded {len(self.repositories)} existing repositories")
             return True
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"⚠️ Could not load existing data: {e}")
             return False
     
-    def check_for_updates(self) -> Dict[str, Any]:
-        """Check for repository updates since last crawl"""
+    def _load_sync_state(self) -> Dict[str, Any]:
+        """Load the high-water mark and the time of the last full sync"""
+        try:
+            with open(self.sync_state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'high_water_mark': None, 'last_full_sync': None}
+    
+    def save_sync_state(self):
+        """Persist the sync state once the data it describes has been saved"""
+        write_if_changed(self.sync_state_file, json.dumps(self.sync_state, indent=2, sort_keys=True))
+    
+    def full_sync_due(self) -> bool:
+        """Check whether the slow pass for removals and metadata refresh should run"""
+        last_full_sync = self.sync_state.get('last_full_sync')
+        if last_full_sync is None:
+            return True
+        return datetime.now() - datetime.fromisoformat(last_full_sync) >= timedelta(hours=self.full_sync_hours)
+    
+    def _advance_high_water_mark(self, repositories: List[Repository]):
+        """Move the high-water mark up to the newest star seen"""
+        marks = [mark for mark in map(starred_at, repositories) if mark]
+        if marks:
+            self.sync_state['high_water_mark'] = max(marks + [self.sync_state.get('high_water_mark') or ''])
+    
+    def check_for_updates(self, full: Optional[bool] = None) -> Dict[str, Any]:
+        """Check for repository updates since last crawl.
+        
+        The incremental sync reads the newest-first listing only until it reaches known stars, so it finds
+        new repositories in about one request. A full pass, run every ``full_sync_hours`` or on request,
+        also detects removals and refreshes metadata. Sources whose listing is not ordered by star time,
+        such as the HTML repositories tab, can put new repositories on any page, so they always get a
+        full pass.
+        """
         updates = {
             'new_repositories': [],
             'updated_repositories': [],
-            'removed_repositories': []
+            'removed_repositories': [],
+            'changed_fields': {}
         }
         
         if not self.repositories:
             return updates
         
-        # Get current starred repositories
-        current_repos = self.get_current_starred_repositories()
-        current_urls = {repo['url'] for repo in current_repos}
-        existing_urls = {repo['url'] for repo in self.repositories}
-        
-        # Find new repositories
-        for repo in current_repos:
-            if repo['url'] not in existing_urls:
-                updates['new_repositories'].append(repo)
+        if full is None:
+            full = self.full_sync_due()
+        if not full and not self.source.ordered_by_star_time:
+            print(f"ℹ️ The {self.source.name} listing is not ordered by star time; running a full sync")
+            full = True
+        
+        if not full:
+            print("⚡ Incremental sync since the last known star")
+            current_repos = self.get_new_starred_repositories()
+            updates['new_repositories'] = [repo for repo in current_repos if repo.url not in self.repositories]
+            self._advance_high_water_mark(current_repos)
+            return updates
         
-        # Find removed repositories
-        for repo in self.repositories:
-            if repo['url'] not in current_urls:
-                updates['removed_repositories'].append(repo)
+        # Get current starred repositories and diff them in a single pass
+        print("🐢 Full sync: checking every page for removals and metadata changes")
+        current_repos = self.get_current_starred_repositories()
+        with self.metrics.stage('diff'):
+            diff = self.repositories.diff(current_repos)
         
-        # Find updated repositories
-        for current_repo in current_repos:
-            for existing_repo in self.repositories:
-                if (current_repo['url'] == existing_repo['url'] and 
-                    self._has_significant_update(current_repo, existing_repo)):
-                    updates['updated_repositories'].append(current_repo)
+        updates['new_repositories'] = diff.added
+        if self.last_fetch_complete:
+            updates['removed_repositories'] = diff.removed
+            self.sync_state['last_full_sync'] = datetime.now().isoformat()
+        else:
+            # Repositories on pages that failed to load are not really gone
+            print("⚠️ Listing incomplete, skipping removal detection this run")
+        for repo, fields in diff.changed:
+            updates['updated_repositories'].append(repo)
+            updates['changed_fields'][repo.url] = fields
+        if self.enricher is not None:
+            self._queue_enrichment_refresh(current_repos, updates)
+        self._advance_high_water_mark(current_repos)
         
         return updates
     
-    def get_current_starred_repositories(self) -> List[Dict[str, Any]]:
-        """Get current list of starred repositories"""
-        repositories = []
-        page = 1
-        
-        while True:
-            url = f"https://github.com/Alot1z?page={page}&tab=repositories"
-            
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse current repositories
-                page_repos = self._parse_repositories_page(response.text)
-                
-                if not page_repos:
-                    break
-                    
-                repositories.extend(page_repos)
-                page += 1
-                
-                time.sleep(1)  # Rate limiting
-                
-            except requests.exceptions.RequestException as e:
-                print(f"Error checking updates: {e}")
-                break
-        
+    def _queue_enrichment_refresh(self, current_repos: List[Repository], updates: Dict[str, Any]):
+        """Mark repositories pushed since their details were fetched, or never enriched, as updated"""
+        for repo in current_repos:
+            if repo.url in updates['changed_fields']:
+                continue
+            stored = self.repositories.get(repo.url)
+            if stored is not None and (stored.last_updated != repo.last_updated or self.enricher.needs_refresh(stored)):
+                updates['updated_repositories'].append(repo)
+                updates['changed_fields'][repo.url] = ['details']
+        if self.last_fetch_complete and self.enricher.cache.prune(repo.url for repo in current_repos):
+            self.enricher.cache.save()
+    
+    def _prepare_repositories(self, repositories: List[Repository]) -> List[Repository]:
+        """Enrich fetched repositories and derive their tags, purpose and quality score"""
+        if self.enricher is not None and repositories:
+            with self.metrics.stage('enrich'):
+                stats = self.enricher.enrich(repositories)
+            self.metrics.record('enrichment', stats)
+            print(f"🔎 Enrichment: {stats['cached']} cached, {stats['fetched']} fetched, "
+                  f"{stats['missing']} missing, {stats['failed']} failed")
+            # Details can reveal forks the listing did not mark
+            with self.metrics.stage('filter'):
+                repositories = self.filter.apply(repositories)
+        with self.metrics.stage('classify'):
+            classifications = self.classifier.classify_batch(repositories)
+        with self.metrics.stage('score'):
+            scores = score_batch(repositories, self.settings.scoring)
+            for repo, classification, score in zip(repositories, classifications, scores):
+                repo.set_tags(classification.tags + topic_tags(repo))
+                repo.set_purpose(classification.purpose)
+                repo.quality_score = score
         return repositories
     
-    def _parse_repositories_page(self, html_content: str) -> List[Dict[str, Any]]:
-        """Parse repositories from GitHub HTML page (simplified version)"""
-        repositories = []
-        
-        # Extract repository blocks
-        repo_blocks = re.findall(
-            r'<a[^>]*href="(/[^"]*)"[^>]*>([^<]*)</a>.*?'
-            r'<p[^>]*>(.*?)</p>.*?'
-            r'<span[^>]*item-prop="main-language"[^>]*>([^<]*)</span>.*?'
-            r'<span[^>]*item-prop="license"[^>]*>([^<]*)</span>',
-            html_content,
-            re.DOTALL
-        )
-        
-        for block in repo_blocks:
-            repo = self._extract_repo_from_block(block)
-            if repo:
-                repositories.append(repo)
-        
+    def get_new_starred_repositories(self) -> List[Repository]:
+        """Fetch the newest-first listing until it reaches repositories that are already known"""
+        mark = self.sync_state.get('high_water_mark')
+        
+        def caught_up(page: List[Repository]) -> bool:
+            # Past the high-water mark, or a page holding nothing new
+            if mark and any(starred_at(repo) and starred_at(repo) <= mark for repo in page):
+                return True
+            return all(repo.url in self.repositories for repo in page)
+        
+        with self.metrics.stage('fetch'):
+            repositories = self.source.fetch_until(self.fetcher, caught_up)
+            self.cache.save()
+        # Filtered after the walk, since caught_up has to see every repository on a page
+        with self.metrics.stage('filter'):
+            repositories = self.filter.apply(repositories)
+        print(self.filter.report())
         return repositories
     
-    def _extract_repo_from_block(self, block: str) -> Dict[str, Any]:
-        """Extract repository information from HTML block"""
-        repo = {}
-        
-        # Extract URL and name
-        url_match = re.search(r'href="(/[^"]*)"', block)
-        name_match = re.search(r'>([^<]*)</a>', block)
-        
-        if url_match and name_match:
-            repo['url'] = f"https://github.com{url_match.group(1)}"
-            repo['name'] = name_match.group(1).strip()
-            
-            # Extract description
-            desc_match = re.search(r'<p[^>]*>(.*?)</p>', block)
-            repo['description'] = desc_match.group(1).strip() if desc_match else ""
-            
-            # Extract language
-            lang_match = re.search(r'item-prop="main-language"[^>]*>([^<]*)</span>', block)
-            repo['language'] = lang_match.group(1).strip() if lang_match else "Unknown"
-            
-            # Extract license
-            license_match = re.search(r'item-prop="license"[^>]*>([^<]*)</span>', block)
-            repo['license'] = license_match.group(1).strip() if license_match else "Unknown"
-            
-            # Extract update date
-            date_match = re.search(r'>([^<]*)</[^>]*>([^<]*)</[^>]*>', block)
-            repo['last_updated'] = date_match.group(2).strip() if date_match else "Unknown"
-            
-            return repo
-        
-        return {}
+    def get_current_starred_repositories(self) -> List[Repository]:
+        """Get current list of starred repositories"""
+        checkpoint = CrawlCheckpoint()
+        with self.metrics.stage('fetch'):
+            repositories = self.source.fetch_repositories(self.fetcher, checkpoint, self._filter_page)
+            self.cache.save()
+        self.last_fetch_complete = checkpoint.complete
+        
+        stats = self.cache.stats()
+        print(f"🗄️ Page cache: {stats['hits']} unchanged, {stats['misses']} downloaded")
+        print(self.filter.report())
+        return repositories
     
-    def _has_significant_update(self, current: Dict[str, Any], existing: Dict[str, Any]) -> bool:
+    def _filter_page(self, repositories: List[Repository]) -> List[Repository]:
+        """Drop the repositories excluded by the crawler settings as each page is parsed"""
+        with self.metrics.stage('filter', per_thread=True):
+            return self.filter.apply(repositories)
+    
+    def _parse_repositories_page(self, html_content: str) -> List[Repository]:
+        """Parse repositories from GitHub HTML page (simplified version)"""
+        return self._filter_page(ListingPageSource(self.username).parse(html_content))
+    
+    def _has_significant_update(self, current: Repository, existing: Repository) -> bool:
         """Check if repository has significant updates"""
-        # Different update methods to check
-        # For now, check if description or language has changed
-        current_desc = current.get('description', '')
-        existing_desc = existing.get('description', '')
-        current_lang = current.get('language', '')
-        existing_lang = existing.get('language', '')
-        
-        return (current_desc != existing_desc or 
-                current_lang != existing_lang or
-                current.get('stars', 0) != existing.get('stars', 0))
-    
-    def update_repository_data(self, repo: Dict[str, Any]) -> None:
+        # For now, check if description, language or stars have changed
+        return bool(changed_fields(current, existing))
+    
+    def update_repository_data(self, repo: Repository) -> None:
         """Update or add repository data"""
-        # Find existing repository
-        for i, existing_repo in enumerate(self.repositories):
-            if existing_repo['url'] == repo['url']:
-                self.repositories[i] = repo
-                return
-        
-        # Add new repository
-        self.repositories.append(repo)
-    
-    def save_updated_data(self):
-        """Save updated repository data"""
-        data = {
-            'total_repositories': len(self.repositories),
-            'last_updated': datetime.now().isoformat(),
-            'categories': self._categorize_repositories(),
-            'repositories': self.repositories
-        }
-        
-        with open(self.data_file, 'w', encoding='-utf-8') as f:
-            json.dump(data, f, indent=2)
-        
+        self.repositories.upsert(repo)
+    
+    def save_updated_data(self, upserts: List[Repository] = None, removals: List[str] = None):
+        """Save updated repository data.
+        
+        With no arguments the whole store is written as a fresh snapshot;
+        otherwise only the given changes are appended to the log. The site's
+        repositories.json is exported separately, when the wiki is regenerated.
+        """
+        with self.metrics.stage('write'):
+            if upserts is None and removals is None:
+                self.log.write_snapshot(self.repositories)
+            else:
+                appended = self.log.append(upserts or [], removals or [])
+                print(f"📝 Appended {appended} changes to the repository log")
+                if self.log.maybe_compact(len(self.repositories)):
+                    print("🗜️ Compacted repository log into a new snapshot")
+        with self.metrics.stage('history'):
+            self.star_history.record(self.repositories)
         print(f"💾 Updated repository database with {len(self.repositories)} repositories")
     
-    def _categorize_repositories(self) -> Dict[str, List[Dict[str, Any]]]:
+    def export_data(self):
+        """Export the store as the repositories.json the site reads, from the records already in memory"""
+        with self.metrics.stage('export'):
+            self.log.export_json(self.data_file, self._determine_category, self.repositories)
+    
+    def _categorize_repositories(self) -> Dict[str, List[Repository]]:
         """Categorize all repositories"""
-        categories = {
-            'mcp-servers': [],
-            'ai-ml-tools': [],
-            'development-tools': [],
-            'mobile-tools': [],
-            'security-tools': [],
-            'utilities': []
-        }
+        categories = {category: [] for category in CATEGORIES}
         
-        for repo in self.repositories:
-            category = self._determine_category(repo)
-            if category in categories:
-                categories[category].append(repo)
-            else:
-                categories['utilities'].append(repo)
+        repos = self.repositories.records()
+        for repo, classification in zip(repos, self.classifier.classify_batch(repos)):
+            categories.get(classification.category, categories['utilities']).append(repo)
         
         # Remove empty categories
         return {k: v for k, v in categories.items() if v}
     
-    def _determine_category(self, repo: Dict[str, Any]) -> str:
+    def _determine_category(self, repo: Repository) -> str:
         """Determine repository category based on content and tags"""
-        name = repo.get('name', '').lower()
-        description = repo.get('description', '').lower()
-        
-        # Priority categories in order of specificity
-        category_map = {
-            'mcp': 'mcp-servers',
-            'ai': 'ai-ml-tools',
-            'ml': 'ai-ml-tools',
-            'ocr': 'ai-ml-tools',
-            'development': 'development-tools',
-            'mobile': 'mobile-tools',
-            'ios': 'mobile-tools',
-            'android': 'mobile-tools',
-            'security': 'security-tools',
-            'malware': 'security-tools',
-            'reverse': 'security-tools',
-            'cheat': 'security-tools',
-            'game': 'mobile-tools',
-            'game-development': 'mobile-tools',
-            'utility': 'utilities',
-            'file': 'utilities',
-            'monitoring': 'utilities',
-            'automation': 'utilities'
-        }
-        
-        for keyword, category in category_map.items():
-            if keyword in name or keyword in description:
-                return category
-        
-        return 'utilities'
+        return self.classifier.classify(repo).category
     
     def regenerate_wiki_pages(self):
         """Regenerate all wiki pages from updated repository data"""
         print("🔄 Regenerating wiki documentation...")
-        
-        categories = self._categorize_repositories()
-        
-        # Generate main index page
-        self._generate_main_index(categories)
-        
-        # Generate category pages
-        for category, repos in categories.items():
-            self._generate_category_page(category, repos)
-        
-        print("✅ Wiki pages regenerated successfully")
+        self.export_data()
+        
+        if self.settings.recommendations_engine:
+            # Category pages list each repository's neighbours, so they are brought up to date first
+            with self.metrics.stage('similar'):
+                similar_stats = self.similar.build(self.repositories, self._determine_category)
+            self.metrics.record('similar', similar_stats)
+            print(f"🧭 Similar repositories: {similar_stats['recomputed']} lists recomputed, "
+                  f"{similar_stats['displaced']} displaced, {similar_stats['files_written']} files written")
+        
+        with self.metrics.stage('render'):
+            categories = self._categorize_repositories()
+            manifest = RenderManifest(self.data_file.parent / "render_manifest.json", self.wiki_dir)
+            self.fragments.reset_stats()
+            
+            # Generate main index page
+            self._generate_main_index(categories, manifest)
+            
+            # Render category pages in parallel, skipping shards whose inputs are unchanged
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                shard_pages = list(executor.map(lambda item: self._generate_category_page(item[0], item[1], manifest),
+                                                categories.items()))
+            
+            manifest.prune([self.wiki_dir / "index.md"] + [page for pages in shard_pages for page in pages])
+            manifest.save()
+            self.fragments.prune(repo.url for repo in self.repositories)
+        
+        with self.metrics.stage('search_index'):
+            search_stats = self.search_index.build(self.repositories, self._determine_category)
+        print(f"🔍 Search index: {search_stats['reindexed']} repositories re-indexed, "
+              f"{search_stats['files_written']} files written")
+        
+        stats = manifest.stats()
+        fragment_stats = self.fragments.stats()
+        self.metrics.record('render_manifest', stats)
+        self.metrics.record('fragments', fragment_stats)
+        self.metrics.record('search_index', search_stats)
+        print(f"✅ Wiki pages regenerated successfully "
+              f"({stats['written']} written, {stats['skipped']} unchanged; "
+              f"{fragment_stats['misses']} of {fragment_stats['hits'] + fragment_stats['misses']} entries re-rendered)")
     
-    def _generate_main_index(self, categories: Dict[str, List[Dict[str, Any]]):
+    def _generate_main_index(self, categories: Dict[str, List[Repository]], manifest: RenderManifest):
         """Generate main index page"""
+        index_path = self.wiki_dir / "index.md"
+        counts = {category: len(repos) for category, repos in categories.items()}
+        trending = self._trending_repositories()
+        inputs_hash = content_hash(['index', len(self.repositories), counts,
+                                    [(repo.url, trend) for repo, trend in trending]])
+        if manifest.is_current(index_path, inputs_hash):
+            return
+        
         index_content = f"""# Alot1z's GitHub Repository Wiki
 
 Welcome to the comprehensive documentation of all {len(self.repositories)} starred GitHub repositories by Alot1z. This wiki automatically updates when new repositories are starred or existing ones are updated.
@@ -276,13 +375,21 @@ Welcome to the comprehensive documentation of all {len(self.repositories)} starr
 """
         
         for category, repos in categories.items():
-            category_name = categories[category]['name']
+            category_name = CATEGORIES[category]['name']
             count = len(repos)
-            description = categories[category]['description']
+            description = CATEGORIES[category]['description']
             
             index_content += f"### [{category_name}]({category.lower()}/) - {count} repositories\n"
             index_content += f"{description}\n\n"
         
+        if trending:
+            index_content += "## 📈 Trending This Week\n\n"
+            for repo, trend in trending:
+                rising = " 🚀" if trend.acceleration and trend.acceleration > 0 else ""
+                index_content += (f"- [{repo.name}]({repo.url}) - ⭐ {trend.stars} "
+                                  f"(+{trend.gain} this week, {trend.velocity:.1f}/day){rising}\n")
+            index_content += "\n"
+        
         index_content += """
 ## Recent Updates
 
@@ -310,37 +417,70 @@ This wiki uses a quality scoring system (1-10) based on:
 ---
 *Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"""
         
-        index_path = self.wiki_dir / "index.md"
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        written = write_if_changed(index_path, index_content)
+        manifest.record(index_path, inputs_hash, (), written)
         
-        print(f"📄 Generated main index: {index_path}")
+        if written:
+            print(f"📄 Generated main index: {index_path}")
     
-    def _generate_category_page(self, category: str, repos: List[Dict[str, Any]]):
-        """Generate category page"""
-        category_name = categories[category]['name']
-        description = categories[category]['description']
+    def _trending_repositories(self, limit: int = 10) -> List[tuple]:
+        """Pair the week's fastest-rising repositories in the star history with their records"""
+        by_key = {repository_key(repo.url): repo for repo in self.repositories}
+        return [(by_key[trend.key], trend) for trend in self.star_history.trending(limit * 2)
+                if trend.key in by_key][:limit]
+    
+    def _generate_category_page(self, category: str, repos: List[Repository], manifest: RenderManifest) -> List[Path]:
+        """Generate the shards of a category page, returning their paths"""
+        category_dir = self.wiki_dir / "docs" / category
         
-        category_content = f"""# {category_name}
+        # Rank best first with a stable tie-break, so unchanged slices keep their shard
+        sorted_repos = ranked(repos)
+        
+        # Reuse cached blocks of unchanged repositories; each shard hash covers exactly what it renders
+        entries = self.fragments.render('updater-category-entry', ENTRY_TEMPLATE_VERSION, ENTRY_FIELDS,
+                                        sorted_repos, self._format_category_entry)
+        if self.settings.recommendations_engine:
+            entries = [self._append_similar(repo, entry) for repo, entry in zip(sorted_repos, entries)]
+        slices = shard_slices(len(entries), self.settings.max_repositories_per_category)
+        
+        pages = []
+        for index, (start, end) in enumerate(slices):
+            category_path = category_dir / shard_filename(index)
+            pages.append(category_path)
+            inputs_hash = content_hash(['updater', category, index, len(slices), entries[start:end]])
+            if manifest.is_current(category_path, inputs_hash):
+                continue
+            written = self._write_category_shard(category, category_path, index, len(slices), entries[start:end])
+            manifest.record(category_path, inputs_hash,
+                            (repository_key(repo.url) for repo in sorted_repos[start:end]), written)
+        
+        for path in remove_stale_shards(category_dir, len(slices)):
+            print(f"🗑️ Removed stale category page: {path}")
+        return pages
+    
+    def _write_category_shard(self, category: str, category_path: Path, index: int, total: int,
+                              entries: List[str]) -> bool:
+        """Stream one shard of a category page to disk, returning whether its bytes changed"""
+        category_name = CATEGORIES[category]['name']
+        description = CATEGORIES[category]['description']
+        title = category_name if index == 0 else f"{category_name} (page {index + 1} of {total})"
+        navigation = shard_navigation(index, total)
+        
+        # Stream the page to disk; the file is only replaced if its bytes changed
+        with PageWriter(category_path) as page:
+            page.write(f"""# {title}
 
 {description}
 
 ## Repository List
 
-"""
-        
-        # Sort by quality score
-        sorted_repos = sorted(repos, key=lambda x: x.get('quality_score', 0), reverse=True)
-        
-        for repo in sorted_repos:
-            quality_emoji = "⭐" if repo.get('quality_score', 0) >= 8 else "📖"
+""")
             
-            category_content += f"{quality_emoji} [{repo['name']}]({repo['url']})\n"
-            category_content += f"**Language**: {repo['language']} | **License**: {repo['license']}\n"
-            category_content += f"**Stars**: {repo['stars']} | **Updated**: {repo['last_updated']}\n"
-            category_content += f"{repo.get('description', 'No description available')}\n\n"
-        
-        category_content += f"""
+            page.write(navigation)
+            page.writelines(entries)
+            page.write(navigation)
+            
+            page.write(f"""
 ---
 *Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 
@@ -353,69 +493,162 @@ Repositories are scored 1-10 based on:
 - Star count and community engagement
 - Description quality and completeness
 
-"""
-        
-        category_dir = self.wiki_dir / "docs" / category
-        category_dir.mkdir(parents=True, exist_ok=True)
+""")
         
-        category_path = category_dir / "README.md"
-        with open(category_path, 'w', encoding='utf-8') as f:
-            f.write(category_content)
+        if page.written:
+            print(f"📄 Generated category page: {category_path}")
+        return page.written
+    
+    def _format_category_entry(self, repo: Repository) -> str:
+        """Format the markdown block of one repository on a category page"""
+        quality_emoji = "⭐" if repo.quality_score >= 8 else "📖"
+        return (f"{quality_emoji} [{repo.name}]({repo.url})\n"
+                f"**Language**: {repo.language} | **License**: {repo.license}\n"
+                f"**Stars**: {repo.stars} | **Updated**: {repo.last_updated}\n"
+                f"{repo.description}\n\n")
+    
+    def _append_similar(self, repo: Repository, entry: str) -> str:
+        """Add a line linking a repository's most similar neighbours to its category entry"""
+        links = []
+        for key, _ in self.similar.neighbours_of(repo.url):
+            neighbour = self.repositories.get(key)
+            if neighbour is not None:
+                links.append(f"[{neighbour.name}]({neighbour.url})")
+        if not links:
+            return entry
+        return f"{entry.rstrip()}\n🔗 **Similar**: {' · '.join(links)}\n\n"
+    
+    def apply_updates(self, updates: Dict[str, Any]) -> bool:
+        """Apply detected updates to the store and save the changes, returning whether anything changed"""
+        if not any(updates.values()):
+            return False
         
-        print(f"📄 Generated category page: {category_path}")
+        print("🔄 Updates detected:")
+        if updates['new_repositories']:
+            print(f"  🆕 New repositories: {len(updates['new_repositories'])}")
+        if updates['updated_repositories']:
+            print(f"  🔄 Updated repositories: {len(updates['updated_repositories'])}")
+        if updates['removed_repositories']:
+            print(f"  🗑️ Removed repositories: {len(updates['removed_repositories'])}")
+        
+        prepared = self._prepare_repositories(updates['new_repositories'] + updates['updated_repositories'])
+        if len(prepared) < len(updates['new_repositories']) + len(updates['updated_repositories']):
+            # Enrichment revealed forks; stored ones are removed like any other exclusion
+            kept = {repo.url for repo in prepared}
+            updates['removed_repositories'] += [repo for repo in updates['updated_repositories']
+                                                if repo.url not in kept]
+            updates['new_repositories'] = [repo for repo in updates['new_repositories'] if repo.url in kept]
+            updates['updated_repositories'] = [repo for repo in updates['updated_repositories']
+                                               if repo.url in kept]
+        
+        # Update repository data
+        for repo in updates['new_repositories']:
+            self.update_repository_data(repo)
+        
+        for repo in updates['updated_repositories']:
+            self.update_repository_data(repo)
+        
+        # Remove deleted repositories
+        for repo in updates['removed_repositories']:
+            self.repositories.remove(repo.url)
+        
+        # Save only the changes
+        self.save_updated_data(
+            updates['new_repositories'] + updates['updated_repositories'],
+            [repo.url for repo in updates['removed_repositories']]
+        )
+        return True
     
-    def run_scheduled_update(self):
+    def rescore(self) -> int:
+        """Recompute every stored quality score with the configured weights, offline, and re-render"""
+        self.start_metrics()
+        if not self.load_existing_data():
+            return 0
+        
+        repositories = self.repositories.records()
+        started = time.perf_counter()
+        with self.metrics.stage('score'):
+            scores = score_batch(repositories, self.settings.scoring)
+        changed = []
+        for repo, score in zip(repositories, scores):
+            if repo.quality_score != score:
+                repo.quality_score = score
+                changed.append(repo)
+        print(f"🎯 Rescored {len(repositories)} repositories in {(time.perf_counter() - started) * 1000:.0f} ms; "
+              f"{len(changed)} scores changed")
+        
+        if changed:
+            self.save_updated_data(changed, [])
+            self.regenerate_wiki_pages()
+        self.save_metrics()
+        return len(changed)
+    
+    def run_scheduled_update(self, full: Optional[bool] = None):
         """Run the complete update process"""
         print("🔄 Starting scheduled repository update...")
+        self.start_metrics()
         
         # Load existing data
         if not self.load_existing_data():
             print("⚠️ No existing data found, performing initial crawl")
-            repositories = self.crawl_repositories()
-            self.repositories = repositories
+            repositories = self._prepare_repositories(self.get_current_starred_repositories())
+            self.repositories = RepositoryStore(repositories)
             self.save_updated_data()
+            self.export_data()
+            self._advance_high_water_mark(repositories)
+            if self.last_fetch_complete:
+                self.sync_state['last_full_sync'] = datetime.now().isoformat()
         else:
             # Check for updates
-            updates = self.check_for_updates()
+            updates = self.check_for_updates(full)
             
-            if any(updates.values()):
-                print(f"🔄 Updates detected:")
-                if updates['new_repositories']:
-                    print(f"  🆕 New repositories: {len(updates['new_repositories'])}")
-                if updates['updated_repositories']:
-                    print(f"  🔄 Updated repositories: {len(updates['updated_repositories'])}")
-                if updates['removed_repositories']:
-                    print(f"  🗑️ Removed repositories: {len(updates['removed_repositories')}")
-                
-                # Update repository data
-                for repo in updates['new_repositories']:
-                    self.update_repository_data(repo)
-                
-                for repo in updates['updated_repositories']:
-                    self.update_repository_data(repo)
-                
-                # Remove deleted repositories
-                for repo in updates['removed_repositories']:
-                    self.repositories = [r for r in self.repositories if r['url'] != repo['url']]
-                
-                # Save updated data
-                self.save_updated_data()
+            if self.apply_updates(updates):
                 self.regenerate_wiki_pages()
-                
                 print(f"✅ Update completed: {len(self.repositories)} repositories")
             else:
                 print("✅ No updates detected")
                 print("✅ Repository database is up to date")
         
+        self.save_sync_state()
         print(f"📊 Database contains {len(self.repositories)} repositories")
+        self.save_metrics()
 
 def main():
     """Main update function"""
+    parser = argparse.ArgumentParser(description="Update the repository wiki")
+    parser.add_argument('--full', action='store_true', help="run the full sync even if it is not due yet")
+    parser.add_argument('--daemon', action='store_true', help="keep running and poll for changes")
+    parser.add_argument('--rescore', action='store_true',
+                        help="recompute quality scores from the stored data and re-render, without fetching")
+    parser.add_argument('--min-interval', type=float, default=DEFAULT_MIN_INTERVAL, help="seconds between polls after a change")
+    parser.add_argument('--max-interval', type=float, default=DEFAULT_MAX_INTERVAL, help="longest back-off between polls")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE, help="quiet seconds before regenerating")
+    parser.add_argument('--status-port', type=int, default=8766, help="local status endpoint port")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                        help="profile the run: cprofile (main thread) or sample (all threads)")
+    args = parser.parse_args()
+    
     data_file = "G:/GITHUB-REPOs/Alot1z.github.io/data/repositories.json"
     wiki_dir = "G:/GITHUB-REPOs/Alot1z.github.io"
     
-    updater = RepositoryUpdater(data_file, wiki_dir)
-    updater.run_scheduled_update()
+    # Source backend: html, rest or graphql, defaulting to the one for config.ini's profile tab;
+    # GITHUB_SOURCE_URL points it at a replay server
+    source = create_source(os.environ.get("GITHUB_SOURCE", default_source(load_settings())), "Alot1z", os.environ.get("GITHUB_SOURCE_URL"))
+    
+    # Per-repository enrichment is on by default when a token is available; GITHUB_ENRICH=0/1 overrides it
+    enrich = os.environ.get("GITHUB_ENRICH", "1" if os.environ.get("GITHUB_TOKEN") else "0") == "1"
+    
+    updater = RepositoryUpdater(data_file, wiki_dir, source=source, enrich=enrich)
+    if args.rescore:
+        updater.rescore()
+        return
+    if args.daemon:
+        run_daemon(updater, min_interval=args.min_interval, max_interval=args.max_interval,
+                   debounce=args.debounce, status_port=args.status_port)
+        return
+    profile_prefix = Path(data_file).parent / "profiles" / f"updater-{datetime.now():%Y%m%d-%H%M%S}"
+    with profiled(args.profile, profile_prefix):
+        updater.run_scheduled_update(full=True if args.full else None)
 
-if __name__name__ == "__main__":
+if __name__ == "__main__":
     main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Alot1z GitHub Repository Wiki System
+
+Generates synthetic GitHub listing pages, serves them from a local stand-in
+HTTP server that simulates latency and rate limiting, and times every
+pipeline stage separately: fetch, parse, classify, score, diff, render and
+persist. Results are written to a JSON file that can be compared against a
+previous run to catch performance regressions before deploying.
+
+Usage:
+    python scripts/benchmark.py suite --sizes 100 1000 10000 --output bench_results.json
+    python scripts/benchmark.py suite --compare baseline.json --threshold 0.2
+    python scripts/benchmark.py parser --sizes 100 1000 5000 10000
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from auto_updater import RepositoryUpdater
+from fetch_engine import TokenBucket
+from github_crawler import GitHubRepoCrawler
+from listing_parser import parse_listing_page
+from repository_log import RepositoryLog
+from repository_model import Repository
+from repository_store import RepositoryStore
+from wiki_settings import load_settings
+
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'C#', 'Swift', 'Shell']
+LICENSES = ['MIT License', 'Apache License 2.0', 'GNU General Public License v3.0']
+WORDS = ['mcp', 'server', 'ai', 'llm', 'web', 'scraper', 'mobile', 'ios', 'security', 'reverse',
+         'engineering', 'tool', 'automation', 'game', 'static', 'analysis', 'utility', 'framework']
+STAGES = ['fetch', 'parse', 'classify', 'score', 'diff', 'render', 'persist']
+
+
+def synthetic_listing_page(num_repos: int, seed: int = 0, owner: str = "Alot1z", start: int = 0) -> str:
+    """Build a GitHub-style repository listing page holding num_repos items"""
+    rng = random.Random(seed)
+    parts = ['<html><body><div id="user-repositories-list"><ul>']
+    for i in range(start, start + num_repos):
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+        description = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 16)))
+        parts.append(
+            f'<li class="col-12 d-flex flex-justify-between width-full py-4 border-bottom" '
+            f'itemprop="owns" itemscope itemtype="http://schema.org/Code">'
+            f'<div class="col-10 col-lg-9 d-inline-block"><div class="d-inline-block mb-1">'
+            f'<h3 class="wb-break-all"><a href="/{owner}/{name}" itemprop="name codeRepository">'
+            f'{name}</a></h3></div>'
+            f'<div><p class="col-9 d-inline-block color-fg-muted mb-2 pr-4" itemprop="description">'
+            f'{description}</p></div>'
+            f'<div class="f6 color-fg-muted mt-2"><span class="ml-0 mr-3">'
+            f'<span class="repo-language-color"></span>'
+            f'<span itemprop="programmingLanguage">{rng.choice(LANGUAGES)}</span></span>'
+            f'<a class="Link--muted mr-3" href="/{owner}/{name}/stargazers"><svg class="octicon"></svg> '
+            f'{rng.randint(0, 5000):,}</a>'
+            f'<span class="mr-3" itemprop="license">{rng.choice(LICENSES)}</span>'
+            f'Updated <relative-time datetime="2025-10-19T12:00:00Z" class="no-wrap">'
+            f'Oct {rng.randint(1, 28)}, 2025</relative-time></div></div></li>'
+        )
+    parts.append('</ul></div></body></html>')
+    return ''.join(parts)
+
+
+class SyntheticGitHubServer:
+    """Local stand-in for github.com listing pages.
+
+    Serves ``total_repos`` synthetic repositories ``page_size`` at a time,
+    sleeps ``latency`` seconds per request, answers 429 with Retry-After once
+    more than ``rate_limit`` requests arrive in a second, and honours
+    If-None-Match with 304 responses.
+    """
+
+    def __init__(self, total_repos: int, page_size: int = 30, latency: float = 0.0,
+                 rate_limit: Optional[float] = None, owner: str = "Alot1z"):
+        self.total_repos = total_repos
+        self.page_size = page_size
+        self.latency = latency
+        self.owner = owner
+        self.limiter = TokenBucket(rate=rate_limit, capacity=rate_limit, max_rate=rate_limit) if rate_limit else None
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page_html(self, page: int) -> str:
+        """Render the HTML for a listing page (empty past the last repository)"""
+        start = (page - 1) * self.page_size
+        count = max(0, min(self.page_size, self.total_repos - start))
+        return synthetic_listing_page(count, seed=page, owner=self.owner, start=start)
+
+    def _allow(self) -> bool:
+        """Apply the simulated rate limit without blocking"""
+        return self.limiter is None or self.limiter.try_acquire()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if not server._allow():
+                    with server._lock:
+                        server.throttled += 1
+                    self.send_response(429)
+                    self.send_header('Retry-After', '1')
+                    self.end_headers()
+                    return
+
+                page = int(parse_qs(urlparse(self.path).query).get('page', ['1'])[0])
+                etag = f'"{server.total_repos}-{server.page_size}-{page}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                body = server.page_html(page).encode('utf-8')
+                with server._lock:
+                    server.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self) -> 'SyntheticGitHubServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _OfflineUpdater(RepositoryUpdater):
+    """Updater whose listing comes from memory, so the diff is timed alone"""
+
+    def __init__(self, wiki_dir: str, existing: List[Repository], current: List[Repository]):
+        super().__init__(Path(wiki_dir) / "data" / "repositories.json", wiki_dir, settings=unfiltered_settings())
+        self.repositories = RepositoryStore(existing)
+        self.current = current
+        self.last_fetch_complete = True
+
+    def get_current_starred_repositories(self) -> List[Repository]:
+        return self.current
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of fn over repeat runs, with output silenced"""
+    best = float('inf')
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def mutate(repositories: List[Repository], seed: int = 1) -> List[Repository]:
+    """Simulate a daily update: ~1% changed, ~0.5% added and ~0.5% removed"""
+    rng = random.Random(seed)
+    current = []
+    for repo in repositories:
+        roll = rng.random()
+        if roll < 0.005:
+            continue
+        copy = Repository.from_dict(repo.to_dict())
+        if roll < 0.015:
+            copy.stars += 1
+        current.append(copy)
+    for i in range(max(1, len(repositories) // 200)):
+        current.append(Repository(f"https://github.com/Alot1z/new-repo-{i}", f"new-repo-{i}", "new mcp tool"))
+    return current
+
+
+def unfiltered_settings():
+    """Settings from config.ini with the crawler filters off, so every generated repository is measured"""
+    return load_settings()._replace(include_forks=True, min_stars=0)
+
+
+def bench_size(size: int, stages: List[str], repeat: int, page_size: int,
+               latency: float, rate_limit: Optional[float]) -> Dict[str, Any]:
+    """Time each requested stage for one dataset size"""
+    server = SyntheticGitHubServer(size, page_size=page_size, latency=latency, rate_limit=rate_limit)
+    pages = [server.page_html(page) for page in range(1, (size + page_size - 1) // page_size + 1)]
+    timings: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = GitHubRepoCrawler("Alot1z", Path(tmp) / "data", settings=unfiltered_settings())
+        repositories = [repo for html in pages for repo in crawler._parse_repositories_page(html)]
+        crawler.repositories = repositories
+
+        if 'fetch' in stages:
+            with server:
+                fetch_dir = Path(tmp) / "fetch"
+                fetcher_crawler = GitHubRepoCrawler("Alot1z", fetch_dir / "data", base_url=server.base_url,
+                                                    settings=unfiltered_settings())
+                fetcher_crawler.fetcher.limiter = TokenBucket(rate=50.0, capacity=8.0, max_rate=1000.0)
+                fetcher_crawler.fetcher.retry_backoff = 0.1
+                timings['fetch'] = best_time(fetcher_crawler.crawl_repositories, 1)
+                timings['fetch_requests'] = server.requests
+                timings['fetch_throttled'] = server.throttled
+                timings['fetch_bytes'] = server.bytes_sent
+                if len(fetcher_crawler.repositories) != size:
+                    raise RuntimeError(f"fetch returned {len(fetcher_crawler.repositories)} of {size} repositories")
+
+        if 'parse' in stages:
+            timings['parse'] = best_time(lambda: [crawler._parse_repositories_page(html) for html in pages], repeat)
+
+        if 'classify' in stages:
+            timings['classify'] = best_time(lambda: crawler.classifier.classify_batch(repositories), repeat)
+
+        if 'score' in stages:
+            timings['score'] = best_time(lambda: [crawler._calculate_quality_score(repo) for repo in repositories],
+                                         repeat)
+
+        if 'diff' in stages:
+            current = mutate(repositories)
+            updater = _OfflineUpdater(tmp, repositories, current)
+            timings['diff'] = best_time(updater.check_for_updates, repeat)
+
+        if 'render' in stages:
+            def render():
+                with tempfile.TemporaryDirectory() as out:
+                    crawler.data_dir = Path(out) / "data"
+                    crawler.generate_category_pages(out)
+            timings['render'] = best_time(render, repeat)
+
+        if 'persist' in stages:
+            def persist():
+                with tempfile.TemporaryDirectory() as out:
+                    crawler.log = RepositoryLog(out)
+                    crawler.save_to_json(Path(out) / "repositories.json")
+            timings['persist'] = best_time(persist, repeat)
+
+    return timings
+
+
+def run_suite(sizes: List[int], stages: List[str], repeat: int, page_size: int,
+              latency: float, rate_limit: Optional[float]) -> Dict[str, Any]:
+    """Run every stage at every size and collect machine-readable results"""
+    results = {
+        'created': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'config': {'repeat': repeat, 'page_size': page_size, 'latency': latency, 'rate_limit': rate_limit},
+        'results': {}
+    }
+    for size in sizes:
+        print(f"⏱️ Benchmarking {size} repositories...")
+        results['results'][str(size)] = bench_size(size, stages, repeat, page_size, latency, rate_limit)
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """List the stage timings that got slower than baseline by more than threshold"""
+    regressions = []
+    for size, timings in current['results'].items():
+        previous = baseline.get('results', {}).get(size, {})
+        for stage in STAGES:
+            if stage not in timings or stage not in previous or previous[stage] <= 0:
+                continue
+            ratio = timings[stage] / previous[stage]
+            if ratio > 1.0 + threshold:
+                regressions.append(f"{stage} @ {size} repos: {previous[stage]:.4f}s -> "
+                                   f"{timings[stage]:.4f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def bench_parser(sizes: List[int], repeat: int = 3) -> List[Dict[str, float]]:
+    """Time parse_listing_page on synthetic pages of increasing size"""
+    results = []
+    for size in sizes:
+        page = synthetic_listing_page(size)
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            records = parse_listing_page(page)
+            best = min(best, time.perf_counter() - start)
+        assert len(records) == size, f"expected {size} records, parsed {len(records)}"
+        results.append({
+            'repositories': size,
+            'bytes': len(page),
+            'seconds': best,
+            'us_per_repo': best / size * 1e6
+        })
+    return results
+
+
+def main():
+    """Run the selected benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Benchmark the repository wiki pipeline")
+    parser.add_argument('mode', choices=['suite', 'parser'])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--page-size', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.005, help="simulated seconds per request")
+    parser.add_argument('--rate-limit', type=float, default=200.0, help="simulated requests per second")
+    parser.add_argument('--output', default="bench_results.json")
+    parser.add_argument('--compare', help="previous results file to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    if args.mode == 'parser':
+        results = bench_parser(args.sizes, args.repeat)
+        print(f"{'repos':>8} {'bytes':>12} {'seconds':>10} {'us/repo':>10}")
+        for row in results:
+            print(f"{row['repositories']:>8} {row['bytes']:>12} {row['seconds']:>10.4f} {row['us_per_repo']:>10.2f}")
+
+        # Linear scaling keeps the per-repo cost flat across sizes
+        ratio = results[-1]['us_per_repo'] / results[0]['us_per_repo']
+        print(f"📈 Per-repo cost ratio (largest/smallest page): {ratio:.2f}")
+        return
+
+    results = run_suite(args.sizes, args.stages, args.repeat, args.page_size, args.latency, args.rate_limit)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'repos':>8} " + ' '.join(f"{stage:>10}" for stage in args.stages))
+    for size, timings in results['results'].items():
+        print(f"{size:>8} " + ' '.join(f"{timings.get(stage, 0):>10.4f}" for stage in args.stages))
+    print(f"💾 Saved benchmark results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print("❌ Performance regressions detected:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("✅ No performance regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Category Page Shards for Alot1z GitHub Repository Wiki System
+
+Splits a category's ranked repository list into fixed-size pages, so page
+weight stays constant however large the star list grows. The first shard
+keeps the category's README.md URL and the rest follow as page-2.md,
+page-3.md and so on. Each shard links to its neighbours and a window of
+nearby pages. Shards are rendered and hashed one by one, so a change only
+rewrites the pages whose slice it touches.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import re
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+from repository_model import Repository
+from repository_store import repository_key
+
+SHARD_PATTERN = re.compile(r'^page-(\d+)\.md$')
+NAVIGATION_WINDOW = 2
+
+
+def ranked(repos: Sequence[Repository]) -> List[Repository]:
+    """Order repositories best first, breaking ties by key so the order is stable across runs"""
+    return sorted(repos, key=lambda repo: (-repo.quality_score, repository_key(repo.url)))
+
+
+def shard_slices(count: int, shard_size: int) -> List[Tuple[int, int]]:
+    """Return the [start, end) bounds of each shard of a ranked list"""
+    return [(start, min(start + shard_size, count)) for start in range(0, max(count, 1), shard_size)]
+
+
+def shard_filename(index: int) -> str:
+    """File name of a shard; the first one is the category's README"""
+    return "README.md" if index == 0 else f"page-{index + 1}.md"
+
+
+def shard_navigation(index: int, total: int) -> str:
+    """Markdown links to the previous and next shard and a window of nearby ones"""
+    if total <= 1:
+        return ""
+    links = []
+    if index > 0:
+        links.append(f"[« Previous](./{shard_filename(index - 1)})")
+
+    shown = {0, total - 1} | set(range(max(0, index - NAVIGATION_WINDOW), min(total, index + NAVIGATION_WINDOW + 1)))
+    previous = None
+    for page in sorted(shown):
+        if previous is not None and page > previous + 1:
+            links.append("…")
+        links.append(f"**{page + 1}**" if page == index else f"[{page + 1}](./{shard_filename(page)})")
+        previous = page
+
+    if index < total - 1:
+        links.append(f"[Next »](./{shard_filename(index + 1)})")
+    return f"Page {index + 1} of {total}: " + " · ".join(links) + "\n\n"
+
+
+def remove_stale_shards(category_dir: Path, total: int) -> List[Path]:
+    """Delete shard files beyond the current page count, returning their paths"""
+    stale = []
+    if category_dir.is_dir():
+        for path in category_dir.iterdir():
+            match = SHARD_PATTERN.match(path.name)
+            if match and int(match.group(1)) > total:
+                path.unlink()
+                stale.append(path)
+    return stale
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Repository Classifier for Alot1z GitHub Repository Wiki System
+
+One rule table drives tags, purpose and category for both the crawler and
+the auto-updater. The keywords are compiled once into a word-level matcher:
+each repository's text is split into words in a single pass through a byte
+translation table, one hash-set intersection finds every keyword, and the
+matched keywords map to signals that the rules test against.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple
+
+from repository_model import Repository
+
+CATEGORIES = {
+    'mcp-servers': {
+        'name': 'MCP (Model Context Protocol) Servers',
+        'description': 'Servers for Model Context Protocol integration with AI tools'
+    },
+    'ai-ml-tools': {
+        'name': 'AI & Machine Learning Tools',
+        'description': 'Tools and frameworks for artificial intelligence and machine learning development'
+    },
+    'development-tools': {
+        'name': 'Development Tools & Frameworks',
+        'description': 'Tools for software development, building, and deployment'
+    },
+    'mobile-tools': {
+        'name': 'Mobile Development Tools',
+        'description': 'Tools for mobile app development and iOS/Android platforms'
+    },
+    'security-tools': {
+        'name': 'Security & Reverse Engineering Tools',
+        'description': 'Tools for security research, reverse engineering, and vulnerability analysis'
+    },
+    'utilities': {
+        'name': 'System Utilities & Automation',
+        'description': 'General purpose utilities and automation tools'
+    }
+}
+
+DEFAULT_CATEGORY = 'utilities'
+DEFAULT_PURPOSE = 'General Purpose'
+
+# Signal -> keywords. Keywords match whole words (plus a plural "s") in the
+# lowercased repository name, description, existing tags and GitHub topics; hyphens and
+# punctuation separate words.
+SIGNAL_KEYWORDS = {
+    'mcp': ('mcp', 'model context protocol', 'model-context-protocol'),
+    'ai': ('ai', 'llm', 'ml', 'machine learning', 'machine-learning', 'nlp', 'transformer', 'ocr', 'gpt'),
+    'automation': ('automation',),
+    'security': ('security', 'malware', 'cheat', 'cheat-engine', 'vulnerability', 'proximity'),
+    'web': ('web',),
+    'game-development': ('game', 'game-development'),
+    'mobile': ('mobile', 'ios', 'android', 'swift'),
+    'reverse-engineering': ('reverse', 'reverse engineering', 'reverse-engineering'),
+    'static-analysis': ('static analysis', 'static-analysis', 'semgrep'),
+    'development': ('development', 'fastapi', 'docusaurus'),
+    'tooling': ('tool',),
+    'utility': ('utility', 'utilities', 'file', 'monitoring')
+}
+
+# Bytes that separate words: everything except ASCII letters, digits and
+# the bytes of multi-byte UTF-8 characters
+WORD_BYTES = bytes(b if (48 <= b <= 57 or 97 <= b <= 122 or b >= 128) else 32 for b in range(256))
+
+# Signals that are emitted as tags
+TAG_SIGNALS = ('mcp', 'ai', 'automation', 'security', 'web', 'game-development', 'mobile',
+               'reverse-engineering', 'static-analysis')
+
+# First matching rule wins
+PURPOSE_RULES = (
+    ('MCP Integration', {'mcp'}),
+    ('AI/ML Development', {'ai'}),
+    ('Web Development', {'web'}),
+    ('Game Development', {'game-development'}),
+    ('Mobile Development', {'mobile'}),
+    ('Security Research', {'security', 'reverse-engineering'}),
+    ('Development Tools', {'development', 'tooling'}),
+    ('System Utilities', {'utility'})
+)
+
+CATEGORY_RULES = (
+    ('mcp-servers', {'mcp'}),
+    ('ai-ml-tools', {'ai'}),
+    ('development-tools', {'development', 'static-analysis'}),
+    ('mobile-tools', {'mobile', 'game-development'}),
+    ('security-tools', {'security', 'reverse-engineering'}),
+    ('utilities', {'utility', 'automation'})
+)
+
+
+class Classification(NamedTuple):
+    tags: List[str]
+    purpose: str
+    category: str
+
+
+class RepositoryClassifier:
+    def __init__(self):
+        # Single words (and their plurals) resolve with one hash-set
+        # intersection; multi-word keywords are checked only when their
+        # first word occurs in the text.
+        self.word_signals: Dict[bytes, str] = {}
+        self.phrases: Dict[bytes, List[tuple]] = {}
+        for signal, keywords in SIGNAL_KEYWORDS.items():
+            for keyword in keywords:
+                words = keyword.encode('utf-8').translate(WORD_BYTES).split()
+                if len(words) == 1:
+                    self.word_signals[words[0]] = signal
+                    self.word_signals[words[0] + b's'] = signal
+                else:
+                    phrase = b' ' + b' '.join(words) + b' '
+                    self.phrases.setdefault(words[0], []).append((phrase, signal))
+        self.vocabulary = frozenset(self.word_signals) | frozenset(self.phrases)
+        self._cache: Dict[tuple, Classification] = {}
+
+    def signals(self, repo: Repository) -> FrozenSet[str]:
+        """Scan a repository's name, description, tags and topics once for signals"""
+        topics = repo.extra.get('topics') or () if repo.extra else ()
+        text = f"{repo.name} {repo.description} {' '.join(repo.tags)} {' '.join(topics)}"
+        words = text.lower().encode('utf-8').translate(WORD_BYTES).split()
+        hits = self.vocabulary.intersection(words)
+        if not hits:
+            return frozenset()
+
+        signals = set()
+        padded = None
+        for word in hits:
+            signal = self.word_signals.get(word)
+            if signal is not None:
+                signals.add(signal)
+            for phrase, signal in self.phrases.get(word, ()):
+                if padded is None:
+                    padded = b' ' + b' '.join(words) + b' '
+                if phrase in padded:
+                    signals.add(signal)
+        return frozenset(signals)
+
+    def classify(self, repo: Repository) -> Classification:
+        """Derive tags, purpose and category for a single repository"""
+        # Repositories sharing a signal set and language classify identically
+        key = (self.signals(repo), repo.language)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._classify_signals(*key)
+            self._cache[key] = result
+        return result
+
+    def classify_batch(self, repos: Iterable[Repository]) -> List[Classification]:
+        """Classify a whole repository list"""
+        return [self.classify(repo) for repo in repos]
+
+    @staticmethod
+    def _classify_signals(signals: frozenset, language: str) -> Classification:
+        """Apply the rule tables to a set of signals"""
+        tags = {signal for signal in TAG_SIGNALS if signal in signals}
+        if language != 'Unknown':
+            tags.add(language.lower())
+        tags = sorted(tags)
+        purpose = next((purpose for purpose, required in PURPOSE_RULES if signals & required),
+                       DEFAULT_PURPOSE)
+        category = next((category for category, required in CATEGORY_RULES if signals & required),
+                        DEFAULT_CATEGORY)
+        return Classification(tags, purpose, category)
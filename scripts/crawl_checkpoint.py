@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Crawl Checkpoints for Alot1z GitHub Repository Wiki System
+
+Records the progress of a paginated crawl as it happens: every completed
+page with the records parsed from it, every failed page, and the page that
+marked the end of the listing. Cursor-paginated sources also store the cursor
+that follows each page. The checkpoint is an append-only NDJSON file,
+so saving after each page costs only that page. A rerun loads it, skips the
+completed pages and retries only what is missing.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+class CrawlCheckpoint:
+    def __init__(self, checkpoint_file: Optional[str] = None, crawl_key: str = "",
+                 encode: Optional[Callable[[Any], Any]] = None, decode: Optional[Callable[[Any], Any]] = None,
+                 max_age_hours: float = 24.0):
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self.crawl_key = crawl_key
+        self.encode = encode
+        self.decode = decode
+        self.max_age_hours = max_age_hours
+        self.pages: Dict[int, List[Any]] = {}
+        self.failed: Dict[int, int] = {}
+        self.cursors: Dict[int, str] = {}
+        self.end_page: Optional[int] = None
+        self.resumed = False
+        self.load()
+
+    @property
+    def cursor(self) -> int:
+        """The first page that has not been reached yet"""
+        reached = set(self.pages) | set(self.failed)
+        return max(reached) + 1 if reached else 1
+
+    @property
+    def complete(self) -> bool:
+        """True once the end of the listing is known and no page is missing"""
+        return self.end_page is not None and not self.failed
+
+    def load(self):
+        """Resume from the checkpoint file if it belongs to this crawl and is fresh"""
+        if self.checkpoint_file is None or not self.checkpoint_file.exists():
+            return
+
+        entries = []
+        with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash mid-append leaves at most one partial line
+                    continue
+
+        header = entries[0] if entries else {}
+        age_hours = (time.time() - header.get('started', 0)) / 3600
+        if header.get('crawl') != self.crawl_key or age_hours > self.max_age_hours:
+            self.clear()
+            return
+
+        for entry in entries[1:]:
+            page = entry.get('page')
+            if 'records' in entry:
+                records = entry['records']
+                if self.decode is not None:
+                    records = [self.decode(record) for record in records]
+                self.pages[page] = records
+                self.failed.pop(page, None)
+                if entry.get('cursor') is not None:
+                    self.cursors[page] = entry['cursor']
+            elif 'failed' in entry:
+                self.failed[page] = entry['failed']
+            elif 'end' in entry:
+                self.end_page = entry['end']
+        self.resumed = bool(self.pages or self.failed)
+
+    def _append(self, entry: Dict[str, Any]):
+        """Append one entry to the checkpoint file, writing the header first"""
+        if self.checkpoint_file is None:
+            return
+
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.checkpoint_file.exists()
+        with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write(json.dumps({'crawl': self.crawl_key, 'started': time.time()}) + '\n')
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def mark_done(self, page: int, records: List[Any], cursor: Optional[str] = None):
+        """Record a completed page, the records parsed from it and the cursor that follows it"""
+        self.pages[page] = records
+        self.failed.pop(page, None)
+        encoded = [self.encode(record) for record in records] if self.encode is not None else records
+        entry = {'page': page, 'records': encoded}
+        if cursor is not None:
+            self.cursors[page] = cursor
+            entry['cursor'] = cursor
+        self._append(entry)
+
+    def mark_failed(self, page: int):
+        """Record a page that could not be fetched"""
+        self.failed[page] = self.failed.get(page, 0) + 1
+        self._append({'page': page, 'failed': self.failed[page]})
+
+    def mark_end(self, page: int):
+        """Record the first empty page, which ends the listing"""
+        self.end_page = page
+        self.failed = {p: attempts for p, attempts in self.failed.items() if p < page}
+        self._append({'page': page, 'end': page})
+
+    def records(self) -> List[Any]:
+        """Return every parsed record in page order"""
+        results = []
+        for page in sorted(self.pages):
+            if self.end_page is None or page < self.end_page:
+                results.extend(self.pages[page])
+        return results
+
+    def clear(self):
+        """Forget all progress and delete the checkpoint file"""
+        self.pages = {}
+        self.failed = {}
+        self.cursors = {}
+        self.end_page = None
+        if self.checkpoint_file is not None and self.checkpoint_file.exists():
+            self.checkpoint_file.unlink()
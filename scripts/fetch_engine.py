@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Concurrent Page Fetch Engine for Alot1z GitHub Repository Wiki System
+
+Shared by the crawler and the auto-updater. Listing pages are fetched by a
+bounded thread pool and paced by an adaptive token bucket that reacts to
+429/403 responses and GitHub rate-limit headers instead of sleeping blindly.
+With a ResponseCache attached, pages are revalidated with conditional
+requests and unchanged pages skip parsing. Streamed pages are decompressed
+and decoded chunk by chunk and fed to an incremental parser while they are
+still downloading. Crawl progress is recorded in a
+CrawlCheckpoint so failed pages are retried instead of ending the crawl.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import codecs
+import threading
+import time
+import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from crawl_checkpoint import CrawlCheckpoint
+from http_cache import ResponseCache
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """Raised when a page is still throttled after all retries"""
+
+
+class TokenBucket:
+    def __init__(self, rate: float = 2.0, capacity: float = 4.0,
+                 min_rate: float = 0.2, max_rate: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = capacity
+        self.paused_until = 0.0
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill"""
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1.0:
+                        self.tokens -= 1.0
+                        return
+                    wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available now, without waiting"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return False
+            self._refill(now)
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+    def on_success(self, headers: Dict[str, str]):
+        """Speed up after a clean response, honouring any rate-limit headers"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + 0.5)
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset = headers.get('X-RateLimit-Reset')
+            if remaining is None or reset is None:
+                return
+            try:
+                remaining = int(remaining)
+                seconds_left = max(float(reset) - time.time(), 1.0)
+            except ValueError:
+                return
+            if remaining <= 0:
+                self.paused_until = time.monotonic() + seconds_left
+                self.tokens = 0.0
+            else:
+                # Spread the remaining quota evenly over the reset window
+                self.rate = max(self.min_rate, min(self.rate, remaining / seconds_left))
+
+    def on_throttle(self, retry_after: Optional[float]):
+        """Back off after a 429/403 throttling response"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+
+class PageFetcher:
+    def __init__(self, session: requests.Session, limiter: Optional[TokenBucket] = None,
+                 max_workers: int = 4, max_retries: int = 3, timeout: int = 30,
+                 cache: Optional[ResponseCache] = None, retry_backoff: float = 2.0,
+                 chunk_size: int = 16 * 1024):
+        self.session = session
+        self.limiter = limiter or TokenBucket()
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.retry_backoff = retry_backoff
+        self.chunk_size = chunk_size
+        self.max_consecutive_failures = max(2 * max_workers, 5)
+        self.counters = Counter()
+        self._counter_lock = threading.Lock()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                json_body: Any = None, stream: bool = False) -> requests.Response:
+        """Send a single request, retrying while the server throttles us"""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            response = self.session.request(method, url, headers=headers, json=json_body,
+                                            timeout=self.timeout, stream=stream)
+            self._count('requests')
+            if self._is_throttled(response):
+                self._count('throttled')
+                response.close()
+                self.limiter.on_throttle(self._retry_after(response))
+                continue
+            if stream and response.status_code >= 400:
+                response.close()
+            if response.status_code >= 400:
+                self._count('errors')
+            response.raise_for_status()
+            self.limiter.on_success(response.headers)
+            if not stream:
+                self._count('bytes', self._wire_bytes(response))
+            return response
+
+        raise RateLimitExceeded(f"Still rate limited after {self.max_retries} retries: {url}")
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False) -> requests.Response:
+        """Fetch a single URL, retrying while the server throttles us"""
+        return self.request('GET', url, headers, stream=stream)
+
+    def iter_text(self, response: requests.Response) -> Iterator[str]:
+        """Yield the decoded text of a streamed response chunk by chunk.
+
+        iter_content() undoes gzip/deflate (and brotli when it is installed)
+        as the bytes arrive; an incremental decoder keeps multi-byte
+        characters that straddle chunk boundaries intact.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        try:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+        finally:
+            self._count('bytes', self._wire_bytes(response))
+            response.close()
+
+    def _count(self, name: str, amount: int = 1):
+        """Add to one of the fetch counters"""
+        with self._counter_lock:
+            self.counters[name] += amount
+
+    @staticmethod
+    def _wire_bytes(response: requests.Response) -> int:
+        """Bytes read off the wire for a response body, before decompression"""
+        try:
+            return response.raw.tell()
+        except (AttributeError, OSError, ValueError):
+            return 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return request, byte, throttle and retry counters for reporting"""
+        with self._counter_lock:
+            counters = dict(self.counters)
+        return {name: counters.get(name, 0) for name in
+                ('requests', 'bytes', 'not_modified', 'throttled', 'errors', 'page_failures', 'page_retries')}
+
+    def fetch_pages(self, url_for_page: Callable[[int], str], parse: Callable[[Any], List[Any]],
+                    checkpoint: Optional[CrawlCheckpoint] = None, stream: bool = False,
+                    prepare: Optional[Callable[[List[Any]], List[Any]]] = None) -> List[Any]:
+        """Fetch numbered pages concurrently until the first empty page.
+
+        At most ``max_workers`` pages are in flight. Progress is recorded in
+        the checkpoint after every page, so a resumed crawl skips completed
+        pages. Failed pages do not stop the crawl; they are retried with
+        exponential backoff once the end of the listing is found. Results are
+        returned in page order. With ``stream`` set, parse receives an
+        iterator of text chunks instead of the whole page. ``prepare`` runs on
+        each page's parsed records after the cache, so filters and scores
+        always reflect the current settings, and a page it empties does not
+        end the listing.
+        """
+        if checkpoint is None:
+            checkpoint = CrawlCheckpoint()
+        elif checkpoint.resumed:
+            print(f"♻️ Resuming crawl: {len(checkpoint.pages)} pages done, "
+                  f"{len(checkpoint.failed)} to retry")
+
+        if checkpoint.end_page is None:
+            self._walk_pages(url_for_page, parse, checkpoint, stream, prepare)
+
+        for attempt in range(self.max_retries):
+            if not checkpoint.failed or checkpoint.end_page is None:
+                break
+            delay = self.retry_backoff * (2 ** attempt)
+            print(f"🔁 Retrying {len(checkpoint.failed)} failed pages in {delay:.0f}s...")
+            self._count('page_retries', len(checkpoint.failed))
+            time.sleep(delay)
+            self._fetch_page_set(sorted(checkpoint.failed), url_for_page, parse, checkpoint, stream, prepare)
+
+        return checkpoint.records()
+
+    def _fetch_page(self, url: str, parse: Callable[[Any], List[Any]], stream: bool = False,
+                    prepare: Optional[Callable[[List[Any]], List[Any]]] = None) -> Tuple[bool, List[Any]]:
+        """Fetch and prepare one page, returning whether it listed anything and the prepared records"""
+        records = self.fetch_parsed(url, parse, stream)
+        if not records or prepare is None:
+            return bool(records), records
+        return True, prepare(records)
+
+    def _walk_pages(self, url_for_page: Callable[[int], str], parse: Callable[[Any], List[Any]],
+                    checkpoint: CrawlCheckpoint, stream: bool = False,
+                    prepare: Optional[Callable[[List[Any]], List[Any]]] = None):
+        """Walk forward from the checkpoint cursor until the first empty page"""
+        in_flight = {}
+        next_page = checkpoint.cursor
+        current = next_page
+        consecutive_failures = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                while len(in_flight) < self.max_workers:
+                    in_flight[next_page] = pool.submit(self._fetch_page, url_for_page(next_page), parse, stream, prepare)
+                    next_page += 1
+
+                future = in_flight.pop(current)
+                try:
+                    listed, page_items = future.result()
+                except requests.exceptions.RequestException as e:
+                    print(f"❌ Error fetching page {current}: {e}")
+                    self._count('page_failures')
+                    checkpoint.mark_failed(current)
+                    consecutive_failures += 1
+                    if consecutive_failures >= self.max_consecutive_failures:
+                        print(f"⛔ {consecutive_failures} consecutive failures, stopping; rerun to resume")
+                        break
+                    current += 1
+                    continue
+
+                consecutive_failures = 0
+                # The end of the listing is an empty page, not a page the filters emptied
+                if not listed:
+                    checkpoint.mark_end(current)
+                    break
+
+                print(f"📄 Fetched page {current} ({len(page_items)} repositories)")
+                checkpoint.mark_done(current, page_items)
+                current += 1
+
+            for pending in in_flight.values():
+                pending.cancel()
+
+    def _fetch_page_set(self, pages: List[int], url_for_page: Callable[[int], str],
+                        parse: Callable[[Any], List[Any]], checkpoint: CrawlCheckpoint, stream: bool = False,
+                        prepare: Optional[Callable[[List[Any]], List[Any]]] = None):
+        """Fetch a fixed set of pages concurrently, recording each outcome"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {page: pool.submit(self._fetch_page, url_for_page(page), parse, stream, prepare)
+                       for page in pages}
+            for page, future in futures.items():
+                try:
+                    checkpoint.mark_done(page, future.result()[1])
+                    print(f"📄 Recovered page {page}")
+                except requests.exceptions.RequestException as e:
+                    print(f"❌ Error fetching page {page}: {e}")
+                    checkpoint.mark_failed(page)
+
+    def fetch_parsed(self, url: str, parse: Callable[[Any], List[Any]], stream: bool = False) -> List[Any]:
+        """Fetch and parse a URL, reusing cached records when it is unchanged.
+
+        With ``stream`` set, parse is fed an iterator of decoded text chunks
+        while the body downloads, so a page is never held in memory whole.
+        """
+        headers = self.cache.conditional_headers(url) if self.cache is not None else None
+        response = self.fetch(url, headers, stream)
+        if response.status_code == 304:
+            self._count('not_modified')
+            response.close()
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+            response = self.fetch(url, stream=stream)
+
+        records = parse(self.iter_text(response) if stream else response.text)
+        if self.cache is not None:
+            self.cache.store(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), records)
+        return records
+
+    @staticmethod
+    def _is_throttled(response: requests.Response) -> bool:
+        """Check whether a response is a rate-limit rejection"""
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            return (response.headers.get('X-RateLimit-Remaining') == '0'
+                    or 'Retry-After' in response.headers)
+        return False
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Work out how long the server asked us to wait"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        reset = response.headers.get('X-RateLimit-Reset')
+        if reset is not None:
+            try:
+                return max(float(reset) - time.time(), 1.0)
+            except ValueError:
+                pass
+        return None
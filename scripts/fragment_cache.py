@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Markdown Fragment Cache for Alot1z GitHub Repository Wiki System
+
+Keeps the rendered markdown block of every repository, keyed by the values
+of the fields the block is rendered from and the version of its template.
+Pages that list the same repository reuse its block, and a long-running
+updater only formats the repositories that changed since its last pass.
+Entries for repositories that are no longer tracked are pruned.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import threading
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+
+class FragmentCache:
+    def __init__(self):
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def render(self, template: str, version: int, fields: Sequence[str], repos: Iterable[Any],
+               render: Callable[[Any], str]) -> List[str]:
+        """Return each repository's block for a template, formatting only those whose fields changed"""
+        with self._lock:
+            section = self.templates.get(template)
+            if section is None or section['version'] != version:
+                # A new template version invalidates every fragment rendered with the old one
+                section = self.templates[template] = {'version': version, 'entries': {}}
+            entries = section['entries']
+
+        # Comparing the field values directly is exact and cheaper than hashing them
+        values_of = attrgetter(*fields)
+        fragments = []
+        updates = {}
+        hits = 0
+        for repo in repos:
+            values = values_of(repo)
+            entry = entries.get(repo.url)
+            if entry is not None and entry[0] == values:
+                fragments.append(entry[1])
+                hits += 1
+            else:
+                text = render(repo)
+                updates[repo.url] = (values, text)
+                fragments.append(text)
+
+        with self._lock:
+            entries.update(updates)
+            self.hits += hits
+            self.misses += len(updates)
+        return fragments
+
+    def prune(self, live_urls: Iterable[str]) -> int:
+        """Evict the fragments of repositories that are no longer tracked"""
+        live = set(live_urls)
+        evicted = 0
+        with self._lock:
+            for section in self.templates.values():
+                entries = section['entries']
+                stale = [url for url in entries if url not in live]
+                for url in stale:
+                    del entries[url]
+                evicted += len(stale)
+            self.evictions += evicted
+        return evicted
+
+    def reset_stats(self):
+        """Zero the counters before a render pass"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for reporting"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': sum(len(section['entries']) for section in self.templates.values())
+        }
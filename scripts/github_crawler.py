@@ -9,355 +9,307 @@ Author: Generated for Alot1z GitHub Repository Wiki System
 License: MIT License
 """
 
-import json
-import time
+import argparse
+import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
-import re
-from urllib.parse import urljoin, urlparse
+from typing import List, Optional
+
+from category_shards import ranked, remove_stale_shards, shard_filename, shard_navigation, shard_slices
+from classifier import CATEGORIES, Classification, RepositoryClassifier
+from crawl_checkpoint import CrawlCheckpoint
+from fetch_engine import PageFetcher
+from fragment_cache import FragmentCache
+from http_cache import ResponseCache
+from quality_scoring import score_batch
+from render_manifest import PageWriter, RenderManifest, content_hash
+from repository_enrichment import RepositoryEnricher, api_url_for, calculate_quality_score, topic_tags
+from repository_filter import RepositoryFilter
+from repository_log import RepositoryLog
+from repository_model import Repository
+from repository_sources import ListingPageSource, PagedSource, create_source, default_source
+from repository_store import repository_key
+from run_metrics import PROFILE_MODES, RunMetrics, profiled
+from star_history import StarHistory
+from wiki_settings import WikiSettings, load_settings
+
+# Bump when the markdown of a category entry changes so cached fragments are re-rendered
+ENTRY_TEMPLATE_VERSION = 1
+ENTRY_FIELDS = ('name', 'url', 'description', 'language', 'license', 'last_updated', 'stars', 'tags',
+                'quality_score')
 
 class GitHubRepoCrawler:
-    def __init__(self, username: str, data_dir: str):
+    def __init__(self, username: str, data_dir: str, max_workers: int = 4,
+                 base_url: str = "https://github.com", source: Optional[PagedSource] = None,
+                 enrich: bool = False, settings: Optional[WikiSettings] = None):
         self.username = username
+        self.settings = settings or load_settings()
+        self.source = source or ListingPageSource(username, base_url)
         self.data_dir = Path(data_dir)
+        self.max_workers = max_workers
         self.session = requests.Session()
         self.repositories = []
-        self.rate_limit_delay = 1.0
-        
-    def crawl_repositories(self) -> List[Dict[str, Any]]:
+        self.classifier = RepositoryClassifier()
+        self.filter = RepositoryFilter.from_settings(self.settings)
+        self.log = RepositoryLog(self.data_dir)
+        self.cache = ResponseCache(self.data_dir / "http_cache.json",
+                                   encode=Repository.to_dict, decode=Repository.from_dict)
+        self.fetcher = PageFetcher(self.session, max_workers=max_workers, cache=self.cache)
+        self.source.configure(self.session)
+        self.fragments = FragmentCache()
+        self.star_history = StarHistory(self.data_dir / "star_history")
+        self.enricher = (RepositoryEnricher(self.fetcher, self.data_dir / "enrichment_cache.json",
+                                            api_url_for(self.source)) if enrich else None)
+        self.metrics = RunMetrics('crawler', self.data_dir / "run_metrics.json")
+        self.source.metrics = self.metrics
+        
+    def crawl_repositories(self) -> List[Repository]:
         """Crawl all repositories from user's starred repositories page"""
         print(f"🚀 Starting to crawl repositories for {self.username}...")
         
-        page = 1
-        repositories = []
+        checkpoint = CrawlCheckpoint(self.data_dir / "crawl_checkpoint.ndjson", self.source.crawl_key,
+                                     encode=Repository.to_dict, decode=Repository.from_dict)
+        with self.metrics.stage('fetch'):
+            repositories = self.source.fetch_repositories(self.fetcher, checkpoint, self._prepare_repositories)
         
-        while True:
-            print(f"📄 Crawling page {page}...")
-            
-            # Construct URL for current page
-            url = f"https://github.com/{self.username}?page={page}&tab=repositories"
-            
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse repositories from page
-                page_repos = self._parse_repositories_page(response.text)
-                
-                if not page_repos:
-                    break
-                    
-                repositories.extend(page_repos)
-                page += 1
-                
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
-                
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Error crawling page {page}: {e}")
-                break
+        self.cache.save()
+        
+        if self.enricher is not None:
+            repositories = self.enrich_repositories(repositories, prune=checkpoint.complete)
         
         self.repositories = repositories
-        print(f"✅ Successfully crawled {len(repositories)} repositories")
+        self.metrics.record('filters', self.filter.stats())
+        print(self.filter.report())
+        stats = self.cache.stats()
+        if checkpoint.complete:
+            checkpoint.clear()
+            print(f"✅ Successfully crawled {len(repositories)} repositories")
+        else:
+            print(f"⚠️ Crawled {len(repositories)} repositories; pages still missing: "
+                  f"{sorted(checkpoint.failed)}. Rerun to resume from the checkpoint.")
+        print(f"🗄️ Page cache: {stats['hits']} unchanged, {stats['misses']} downloaded")
         return repositories
     
-    def _parse_repositories_page(self, html_content: str) -> List[Dict[str, Any]]:
+    def enrich_repositories(self, repositories: List[Repository], prune: bool = False) -> List[Repository]:
+        """Fetch per-repository details and re-derive tags, purpose and score from them"""
+        with self.metrics.stage('enrich'):
+            stats = self.enricher.enrich(repositories)
+        self.metrics.record('enrichment', stats)
+        if prune:
+            self.enricher.cache.prune(repo.url for repo in repositories)
+            self.enricher.cache.save()
+        print(f"🔎 Enrichment: {stats['cached']} cached, {stats['fetched']} fetched, "
+              f"{stats['missing']} missing, {stats['failed']} failed")
+        # Details can reveal forks the listing did not mark, so the filters run again
+        return self._prepare_repositories(repositories)
+    
+    def _parse_repositories_page(self, html_content: str) -> List[Repository]:
         """Parse repositories from GitHub HTML page"""
-        repositories = []
-        
-        # Regex pattern to extract repository information
-        repo_pattern = r'<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>'
-        
-        # Extract basic repository information using regex
-        repo_links = re.findall(r'<a[^>]*href="(/[^"]*)"[^>]*>([^<]*)</a>', html_content)
-        
-        # More detailed extraction
-        detailed_pattern = r'<a[^>]*href="(/[^"]*)"[^>]*>([^<]*)</a>\s*<[^<]*>([^<]*)</[^<]*>\s*(<[^>]*>([^<]*)</[^>]*>)'
-        
-        # Extract structured information
-        repo_blocks = re.findall(
-            r'<li[^>]*data-testid="repo-list-item"[^>]*>.*?<a[^>]*href="(/[^"]*)"[^>]*>([^<]*)</a>.*?'
-            r'<p[^>]*>(.*?)</p>.*?'
-            r'<span[^>]*item-prop="main-language"[^>]*>([^<]*)</span>.*?'
-            r'<span[^>]*item-prop="license"[^>]*>([^<]*)</span>',
-            html_content,
-            re.DOTALL
-        )
-        
-        for block in repo_blocks:
-            repo = self._extract_repository_info(block)
-            if repo:
-                repositories.append(repo)
-        
+        return self._prepare_repositories(ListingPageSource(self.username).parse(html_content))
+    
+    def _prepare_repositories(self, repositories: List[Repository]) -> List[Repository]:
+        """Filter, classify and score one page of fetched repositories"""
+        # Pages are prepared on the fetch workers, so CPU time is measured per thread
+        with self.metrics.stage('filter', per_thread=True):
+            repositories = self.filter.apply(repositories)
+        with self.metrics.stage('classify', per_thread=True):
+            classifications = self.classifier.classify_batch(repositories)
+        with self.metrics.stage('score', per_thread=True):
+            scores = score_batch(repositories, self.settings.scoring)
+            for repo, classification, score in zip(repositories, classifications, scores):
+                self._extract_repository_info(repo, classification, score)
         return repositories
     
-    def _extract_repository_info(self, repo_block: str) -> Dict[str, Any]:
-        """Extract detailed repository information from HTML block"""
-        repo = {}
+    def _extract_repository_info(self, repo: Repository, classification: Optional[Classification] = None,
+                                 quality_score: Optional[float] = None) -> Repository:
+        """Add derived tags, purpose and quality score to a parsed repository"""
+        if classification is None:
+            classification = self.classifier.classify(repo)
         
-        # Extract URL and name
-        url_match = re.search(r'href="([^"]*)"', repo_block)
-        name_match = re.search(r'>([^<]*)</a>', repo_block)
+        repo.set_tags(classification.tags + topic_tags(repo))
+        repo.set_purpose(classification.purpose)
+        repo.quality_score = self._calculate_quality_score(repo) if quality_score is None else quality_score
         
-        if url_match and name_match:
-            repo['url'] = f"https://github.com{url_match.group(1)}"
-            repo['name'] = name_match.group(1).strip()
-            
-            # Extract description
-            desc_match = re.search(r'<p[^>]*>(.*?)</p>', repo_block)
-            if desc_match:
-                repo['description'] = desc_match.group(1).strip()
-            else:
-                repo['description'] = ""
-            
-            # Extract language
-            lang_match = re.search(r'item-prop="main-language"[^>]*>([^<]*)</span>', repo_block)
-            if lang_match:
-                repo['language'] = lang_match.group(1).strip()
-            else:
-                repo['language'] = "Unknown"
-            
-            # Extract license
-            license_match = re.search(r'item-prop="license"[^>]*>([^<]*)</span>', repo_block)
-            if license_match:
-                repo['license'] = license_match.group(1).strip()
-            else:
-                repo['license'] = "Unknown"
-            
-            # Extract update date
-            date_match = re.search(r'>([^<]*)</[^>]*>([^<]*)</[^>]*>', repo_block)
-            if date_match:
-                repo['last_updated'] = date_match.group(2).strip()
-            else:
-                repo['last_updated'] = "Unknown"
-            
-            # Extract stars
-            stars_match = re.search(r'star.*?"([^"]*)"[^>]*>"([^<]*)</a>', repo_block)
-            if stars_match:
-                try:
-                    repo['stars'] = int(stars_match.group(2).strip())
-                except ValueError:
-                    repo['stars'] = 0
-            else:
-                repo['stars'] = 0
-            
-            # Extract tags from description and name
-            repo['tags'] = self._generate_tags(repo)
-            repo['purpose'] = self._determine_purpose(repo)
-            repo['quality_score'] = self._calculate_quality_score(repo)
-            
-            return repo
-        
-        return {}
+        return repo
     
-    def _generate_tags(self, repo: Dict[str, Any]) -> List[str]:
+    def _generate_tags(self, repo: Repository) -> List[str]:
         """Generate tags based on repository content"""
-        tags = []
-        
-        # Add language tag
-        if repo.get('language') != 'Unknown':
-            tags.append(repo['language'].lower())
-        
-        # Add tags from description
-        description = repo.get('description', '').lower()
-        if 'mcp' in description:
-            tags.append('mcp')
-        if 'ai' in description or 'llm' in description:
-            tags.append('ai')
-        if 'automation' in description:
-            tags.append('automation')
-        if 'security' in description:
-            tags.append('security')
-        if 'web' in description:
-            tags.append('web')
-        if 'game' in description:
-            tags.append('game-development')
-        if 'mobile' in description or 'ios' in description:
-            tags.append('mobile')
-        if 'reverse' in description:
-            tags.append('reverse-engineering')
-        if 'static analysis' in description:
-            tags.append('static-analysis')
-        
-        # Add tags from name
-        name = repo.get('name', '').lower()
-        if 'mcp' in name:
-            tags.append('mcp')
-        
-        return list(set(tags))
+        return self.classifier.classify(repo).tags
     
-    def _determine_purpose(self, repo: Dict[str, Any]) -> str:
+    def _determine_purpose(self, repo: Repository) -> str:
         """Determine the primary purpose of the repository"""
-        description = repo.get('description', '').lower()
-        name = repo.get('name', '').lower()
-        
-        if 'mcp' in name or 'mcp' in description:
-            return "MCP Integration"
-        elif 'ai' in description or 'llm' in description:
-            return "AI/ML Development"
-        elif 'web' in description:
-            return "Web Development"
-        elif 'game' in description:
-            return "Game Development"
-        elif 'mobile' in description or 'ios' in description:
-            return "Mobile Development"
-        elif 'security' in description or 'reverse' in description:
-            return "Security Research"
-        elif 'development' in description or 'tool' in description:
-            return "Development Tools"
-        elif 'utility' in description:
-            return "System Utilities"
-        else:
-            return "General Purpose"
+        return self.classifier.classify(repo).purpose
     
-    def _calculate_quality_score(self, repo: Dict[str, Any]) -> float:
-        """Calculate quality score based on repository metrics"""
-        score = 5.0  # Base score
-        
-        # Language popularity bonus
-        popular_languages = ['python', 'javascript', 'typescript', 'go', 'rust', 'java', 'c#', 'swift']
-        if repo.get('language', '').lower() in popular_languages:
-            score += 1.0
-        
-        # MIT license bonus
-        if 'MIT' in repo.get('license', ''):
-            score += 1.0
-        
-        # Recent update bonus
-        if '2025' in repo.get('last_updated', ''):
-            score += 0.5
-        
-        # Stars bonus
-        score += min(repo.get('stars', 0) * 0.001)
-        
-        return round(min(score, 10.0), 1)
+    def _calculate_quality_score(self, repo: Repository) -> float:
+        """Calculate quality score based on repository metrics and enriched details"""
+        return calculate_quality_score(repo, weights=self.settings.scoring)
     
     def save_to_json(self, filename: str = None):
-        """Save repositories data to JSON file"""
+        """Save repositories to the repository log and export them to JSON"""
         if filename is None:
             filename = self.data_dir / "repositories.json"
         else:
             filename = Path(filename)
         
-        # Create data directory if it doesn't exist
-        filename.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save to JSON
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'total_repositories': len(self.repositories),
-                'last_updated': datetime.now().isoformat(),
-                'repositories': self.repositories
-            }, f, indent=2, ensure_ascii=False)
+        # A full crawl replaces the snapshot; repositories.json is exported from it
+        with self.metrics.stage('write'):
+            self.log.write_snapshot(self.repositories)
+            self.log.export_json(filename, self._categorize_repository)
+        with self.metrics.stage('history'):
+            self.star_history.record(self.repositories)
         
         print(f"💾 Saved repository data to {filename}")
         return filename
     
     def generate_category_pages(self, output_dir: str):
         """Generate individual category pages"""
-        output_path = Path(output_dir)
+        with self.metrics.stage('render'):
+            self._generate_category_pages(Path(output_dir))
+    
+    def _generate_category_pages(self, output_path: Path):
+        """Group repositories by category and render each page"""
         
         # Group repositories by category
         categories = {}
-        for repo in self.repositories:
-            category = self._categorize_repository(repo)
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(repo)
-        
-        # Generate markdown pages for each category
-        for category, repos in categories.items():
-            if category != "other":
-                self._generate_category_page(category, repos, output_path)
-        
-        print(f"📄 Generated {len(categories)} category pages")
+        for repo, classification in zip(self.repositories, self.classifier.classify_batch(self.repositories)):
+            categories.setdefault(classification.category, []).append(repo)
+        
+        # Render categories in parallel, skipping unchanged shards
+        manifest = RenderManifest(self.data_dir / "render_manifest.json", output_path)
+        self.fragments.reset_stats()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda item: self._generate_category_page(item[0], item[1], output_path, manifest),
+                              [(category, repos) for category, repos in categories.items() if category != "other"]))
+        manifest.save()
+        self.fragments.prune(repo.url for repo in self.repositories)
+        
+        stats = manifest.stats()
+        fragment_stats = self.fragments.stats()
+        self.metrics.record('render_manifest', stats)
+        self.metrics.record('fragments', fragment_stats)
+        print(f"📄 Generated {len(categories)} category pages "
+              f"({stats['written']} written, {stats['skipped']} unchanged; "
+              f"{fragment_stats['misses']} of {fragment_stats['hits'] + fragment_stats['misses']} entries re-rendered)")
     
-    def _categorize_repository(self, repo: Dict[str, Any]) -> str:
+    def _categorize_repository(self, repo: Repository) -> str:
         """Categorize repository based on its content and purpose"""
-        purpose = repo.get('purpose', '').lower()
-        tags = repo.get('tags', [])
-        
-        if 'mcp' in tags or 'mcp' in repo.get('name', '').lower():
-            return "mcp-servers"
-        elif any(tag in ['ai', 'llm', 'machine-learning', 'nlp', 'transformers', 'ocr'] for tag in tags):
-            return "ai-ml-tools"
-        elif any(tag in ['development', 'static-analysis', 'semgrep', 'fastapi', 'docusaurus'] for tag in tags):
-            return "development-tools"
-        elif any(tag in ['mobile', 'ios', 'android', 'swift'] for tag in tags):
-            return "mobile-tools"
-        elif any(tag in ['security', 'malware', 'cheat-engine', 'proximity'] for tag in tags):
-            return "security-tools"
-        else:
-            return "utilities"
+        return self.classifier.classify(repo).category
     
-    def _generate_category_page(self, category: str, repos: List[Dict[str, Any]], output_path: Path):
-        """Generate markdown page for a specific category"""
-        # Create category directory
+    def _generate_category_page(self, category: str, repos: List[Repository], output_path: Path,
+                                manifest: RenderManifest) -> List[Path]:
+        """Generate the shards of a category page, returning their paths"""
         category_dir = output_path / "docs" / category
-        category_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate markdown content
-        content = f"# {category.replace('-', ' ').title()}\n\n"
-        content += f"**Total Repositories**: {len(repos)}\n\n"
-        content += f"**Description**: {self._get_category_description(category)}\n\n"
-        content += "## Repositories\n\n"
-        
-        # Sort repositories by quality score
-        sorted_repos = sorted(repos, key=lambda x: x.get('quality_score', 0), reverse=True)
-        
-        for repo in sorted_repos:
-            content += f"### [{repo['name']}]({repo['url']})\n\n"
-            content += f"**Description**: {repo.get('description', 'No description available')}\n\n"
-            content += f"**Language**: {repo.get('language', 'Unknown')}\n"
-            content += f"**License**: {repo.get('license', 'Unknown')}\n"
-            content += f"**Last Updated**: {repo.get('last_updated', 'Unknown')}\n"
-            content += f"**Stars**: {repo.get('stars', 0)}\n"
-            content += f"**Tags**: {', '.join(repo.get('tags', []))}\n"
-            content += f"**Quality Score**: {repo.get('quality_score', 0)}/10\n\n"
-            content += "---\n\n"
-        
-        # Save to file
-        filename = category_dir / "README.md"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Sort repositories by quality score, with a stable tie-break so unchanged slices keep their shard
+        sorted_repos = ranked(repos)
+        
+        # Reuse cached blocks of unchanged repositories; each shard hash covers exactly what it renders
+        entries = self.fragments.render('crawler-category-entry', ENTRY_TEMPLATE_VERSION, ENTRY_FIELDS,
+                                        sorted_repos, self._format_category_entry)
+        slices = shard_slices(len(entries), self.settings.max_repositories_per_category)
+        
+        pages = []
+        for index, (start, end) in enumerate(slices):
+            filename = category_dir / shard_filename(index)
+            pages.append(filename)
+            # Only the first shard shows the category total, so adding a repository leaves later shards alone
+            header_total = len(repos) if index == 0 else None
+            inputs_hash = content_hash(['crawler', category, index, len(slices), header_total, entries[start:end]])
+            if manifest.is_current(filename, inputs_hash):
+                continue
+            written = self._write_category_shard(category, filename, index, len(slices), header_total,
+                                                 entries[start:end])
+            manifest.record(filename, inputs_hash, (repository_key(repo.url) for repo in sorted_repos[start:end]),
+                            written)
+        
+        for path in remove_stale_shards(category_dir, len(slices)):
+            print(f"🗑️ Removed stale category page: {path}")
+        return pages
+    
+    def _write_category_shard(self, category: str, filename: Path, index: int, total: int,
+                              header_total: Optional[int], entries: List[str]) -> bool:
+        """Stream one shard of a category page to disk, returning whether its bytes changed"""
+        title = category.replace('-', ' ').title()
+        navigation = shard_navigation(index, total)
+        
+        # Stream the markdown to disk; the file is only replaced if its bytes changed
+        with PageWriter(filename) as page:
+            if index == 0:
+                page.write(f"# {title}\n\n")
+                page.write(f"**Total Repositories**: {header_total}\n\n")
+            else:
+                page.write(f"# {title} (page {index + 1} of {total})\n\n")
+            page.write(f"**Description**: {self._get_category_description(category)}\n\n")
+            page.write("## Repositories\n\n")
+            
+            page.write(navigation)
+            page.writelines(entries)
+            page.write(navigation)
         
-        print(f"📄 Generated {filename}")
+        if page.written:
+            print(f"📄 Generated {filename}")
+        return page.written
+    
+    def _format_category_entry(self, repo: Repository) -> str:
+        """Format the markdown block of one repository on a category page"""
+        return (f"### [{repo.name}]({repo.url})\n\n"
+                f"**Description**: {repo.description}\n\n"
+                f"**Language**: {repo.language}\n"
+                f"**License**: {repo.license}\n"
+                f"**Last Updated**: {repo.last_updated}\n"
+                f"**Stars**: {repo.stars}\n"
+                f"**Tags**: {', '.join(repo.tags)}\n"
+                f"**Quality Score**: {repo.quality_score}/10\n\n"
+                "---\n\n")
     
     def _get_category_description(self, category: str) -> str:
         """Get description for a category"""
-        descriptions = {
-            "mcp-servers": "Servers for Model Context Protocol integration with AI tools",
-            "ai-ml-tools": "Tools and frameworks for artificial intelligence and machine learning development",
-            "development-tools": "Tools for software development, building, and deployment",
-            "mobile-tools": "Tools for mobile app development and iOS/Android platforms",
-            "security-tools": "Tools for security research, reverse engineering, and vulnerability analysis",
-            "utilities": "General purpose utilities and automation tools"
-        }
-        return descriptions.get(category, "Uncategorized repositories")
+        return CATEGORIES.get(category, {}).get('description', "Uncategorized repositories")
+    
+    def save_metrics(self):
+        """Record the fetch and cache statistics and append this run to the metrics file"""
+        self.metrics.count('repositories', len(self.repositories))
+        self.metrics.record('fetcher', self.fetcher.stats())
+        self.metrics.record('http_cache', self.cache.stats())
+        return self.metrics.save()
 
 def main():
     """Main function to run the crawler"""
+    parser = argparse.ArgumentParser(description="Crawl repositories and generate the wiki")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                        help="profile the run: cprofile (main thread) or sample (all threads)")
+    args = parser.parse_args()
+    
     # Configuration
     username = "Alot1z"
     data_dir = "G:/GITHUB-REPOs/Alot1z.github.io/data"
     
-    # Initialize crawler
-    crawler = GitHubRepoCrawler(username, data_dir)
-    
-    # Crawl repositories
-    repositories = crawler.crawl_repositories()
+    # Source backend: html, rest or graphql, defaulting to the one for config.ini's profile tab;
+    # GITHUB_SOURCE_URL points it at a replay server
+    source = create_source(os.environ.get("GITHUB_SOURCE", default_source(load_settings())), username, os.environ.get("GITHUB_SOURCE_URL"))
     
-    # Save data
-    json_file = crawler.save_to_json()
+    # Initialize crawler
+    # Per-repository enrichment is on by default when a token is available; GITHUB_ENRICH=0/1 overrides it
+    enrich = os.environ.get("GITHUB_ENRICH", "1" if os.environ.get("GITHUB_TOKEN") else "0") == "1"
+    crawler = GitHubRepoCrawler(username, data_dir, source=source, enrich=enrich)
     
-    # Generate category pages
-    crawler.generate_category_pages("G:/GITHUB-REPOs/Alot1z.github.io")
+    profile_prefix = Path(data_dir) / "profiles" / f"crawler-{datetime.now():%Y%m%d-%H%M%S}"
+    with profiled(args.profile, profile_prefix):
+        # Crawl repositories
+        crawler.crawl_repositories()
+        
+        # Save data
+        json_file = crawler.save_to_json()
+        
+        # Generate category pages
+        crawler.generate_category_pages("G:/GITHUB-REPOs/Alot1z.github.io")
     
+    crawler.save_metrics()
     print("🎉 Repository crawling and documentation generation complete!")
     print(f"📊 Data saved to: {json_file}")
-    print(f"📁 Category pages generated in: G:/GITHUB-REPOs/Alot1z.github.io/docs")
+    print("📁 Category pages generated in: G:/GITHUB-REPOs/Alot1z.github.io/docs")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Conditional-Request Response Cache for Alot1z GitHub Repository Wiki System
+
+Persists the validators (ETag / Last-Modified) of every listing page next to
+the parsed records it produced. Revalidated pages come back as 304 and reuse
+the stored records, so unchanged pages are neither downloaded nor parsed.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ResponseCache:
+    def __init__(self, cache_file: str, max_entries: int = 2000, max_bytes: int = 32 * 1024 * 1024,
+                 encode: Optional[Callable[[Any], Any]] = None, decode: Optional[Callable[[Any], Any]] = None):
+        self.cache_file = Path(cache_file)
+        self.encode = encode
+        self.decode = decode
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load cached entries from disk, oldest first"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        for url, entry in data.get('entries', []):
+            self.entries[url] = entry
+            self.total_bytes += len(entry['body'])
+        self._evict()
+
+    def save(self):
+        """Write the cache back to disk in LRU order"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {'entries': list(self.entries.items())}
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        with self._lock:
+            entry = self.entries.get(url)
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get(self, url: str) -> Optional[List[Any]]:
+        """Return the cached records for a revalidated URL"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+            self.entries.move_to_end(url)
+            self.hits += 1
+            body = entry['body']
+        records = json.loads(body)
+        if self.decode is not None:
+            records = [self.decode(record) for record in records]
+        return records
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], records: List[Any]):
+        """Remember the validators and parsed records of a full response"""
+        with self._lock:
+            self.misses += 1
+            previous = self.entries.pop(url, None)
+            if previous is not None:
+                self.total_bytes -= len(previous['body'])
+            if not etag and not last_modified:
+                return
+
+            if self.encode is not None:
+                records = [self.encode(record) for record in records]
+            body = json.dumps(records, ensure_ascii=False)
+            self.entries[url] = {'etag': etag, 'last_modified': last_modified, 'body': body}
+            self.total_bytes += len(body)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its bounds"""
+        while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, entry = self.entries.popitem(last=False)
+            self.total_bytes -= len(entry['body'])
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for reporting"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.total_bytes
+        }
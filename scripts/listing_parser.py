@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Streaming Listing Page Parser for Alot1z GitHub Repository Wiki System
+
+Tokenizes a GitHub repository listing page in a single pass with
+html.parser and emits one record per repository item as soon as its closing
+tag is seen. Used by both the crawler and the auto-updater; pages can be fed
+whole or chunk by chunk straight from a streaming download.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from repository_model import Repository
+
+LANGUAGE_PROPS = {'main-language', 'programmingLanguage'}
+LICENSE_PROPS = {'license'}
+
+
+class ListingPageParser(HTMLParser):
+    def __init__(self, on_record: Optional[Callable[[Repository], None]] = None):
+        super().__init__(convert_charrefs=True)
+        self.on_record = on_record
+        self.records = []
+        self._item = None
+        self._li_depth = 0
+        self._field = None
+        self._field_tag = None
+        self._field_depth = 0
+        self._text = []
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]):
+        attrs = dict(attrs)
+
+        if tag == 'li':
+            if self._item is not None:
+                self._li_depth += 1
+            elif self._is_repo_item(attrs):
+                # The repositories tab marks forks with a 'fork' class on the item
+                self._item = {'fork': True} if 'fork' in (attrs.get('class') or '').split() else {}
+                self._li_depth = 1
+            return
+
+        if self._item is None:
+            return
+
+        if self._field is not None:
+            if tag == self._field_tag:
+                self._field_depth += 1
+            return
+
+        prop = attrs.get('item-prop') or attrs.get('itemprop') or ''
+        href = attrs.get('href') or ''
+
+        if tag == 'a':
+            if 'url' not in self._item and href.startswith('/') and href.count('/') == 2:
+                self._item['url'] = f"https://github.com{href}"
+                self._start_field('name', tag)
+            elif href.endswith('/stargazers') and 'stars' not in self._item:
+                self._start_field('stars', tag)
+        elif tag == 'p' and 'description' not in self._item:
+            self._start_field('description', tag)
+        elif tag == 'span' and prop in LANGUAGE_PROPS:
+            self._start_field('language', tag)
+        elif tag == 'span' and prop in LICENSE_PROPS:
+            self._start_field('license', tag)
+        elif tag == 'relative-time':
+            # The text is for display; the machine-readable time is in the datetime attribute
+            if attrs.get('datetime'):
+                self._item['updated_at'] = attrs['datetime']
+            self._start_field('last_updated', tag)
+
+    def handle_endtag(self, tag: str):
+        if self._item is None:
+            return
+
+        if self._field is not None and tag == self._field_tag:
+            if self._field_depth:
+                self._field_depth -= 1
+            else:
+                self._item[self._field] = ' '.join(''.join(self._text).split())
+                self._field = None
+            return
+
+        if tag == 'li':
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                self._finish_item()
+
+    def handle_data(self, data: str):
+        if self._field is not None:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        if self._item is not None:
+            self._finish_item()
+
+    def pop_records(self) -> List[Repository]:
+        """Return and clear the records completed so far"""
+        records, self.records = self.records, []
+        return records
+
+    def _start_field(self, field: str, tag: str):
+        """Begin collecting the text of the current tag into a field"""
+        self._field = field
+        self._field_tag = tag
+        self._field_depth = 0
+        self._text = []
+
+    def _finish_item(self):
+        """Normalize the current item and emit it"""
+        item, self._item = self._item, None
+        self._field = None
+        if 'url' not in item or not item.get('name'):
+            return
+
+        extra = {key: item[key] for key in ('fork', 'updated_at') if item.get(key)}
+        if not item.get('stars', '').strip():
+            # Told apart from a count of zero so the star filter can keep it
+            extra['stars_unknown'] = True
+        record = Repository(
+            url=item['url'],
+            name=item['name'],
+            description=item.get('description', ''),
+            language=item.get('language') or 'Unknown',
+            license=item.get('license') or 'Unknown',
+            last_updated=item.get('last_updated') or 'Unknown',
+            stars=parse_count(item.get('stars', '')),
+            extra=extra
+        )
+        if self.on_record is not None:
+            self.on_record(record)
+        self.records.append(record)
+
+    @staticmethod
+    def _is_repo_item(attrs: Dict[str, Any]) -> bool:
+        """Check whether an <li> starts a repository entry"""
+        if attrs.get('data-testid') == 'repo-list-item':
+            return True
+        return 'owns' in (attrs.get('itemprop') or '').split()
+
+
+def parse_count(text: str) -> int:
+    """Parse star counts such as '42', '1,204' or '3.1k'"""
+    text = text.strip().lower().replace(',', '')
+    if not text:
+        return 0
+    multiplier = 1
+    if text.endswith('k'):
+        multiplier, text = 1000, text[:-1]
+    try:
+        return int(float(text) * multiplier)
+    except ValueError:
+        return 0
+
+
+def parse_listing_page(html_content: str) -> List[Repository]:
+    """Parse every repository record from a listing page"""
+    parser = ListingPageParser()
+    parser.feed(html_content)
+    parser.close()
+    return parser.pop_records()
+
+
+def parse_listing_chunks(chunks: Iterable[str], on_record: Optional[Callable[[Repository], None]] = None) -> List[Repository]:
+    """Parse a listing page that arrives as a stream of text chunks"""
+    parser = ListingPageParser(on_record)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.pop_records()
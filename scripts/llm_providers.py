@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+LLM Provider Query Engine for Alot1z GitHub Repository Wiki System
+
+Loads the provider reports in data/llm_providers/*.json and normalizes
+their different nesting into flat provider, model and endpoint records.
+Reports are parsed lazily, on the first query or raw access, and the
+normalized records are saved to a compiled index file keyed by each
+report's size and modification time. A later load reads that file instead
+of parsing the JSON, and re-parses only reports that changed. Queries are
+answered from in-memory indexes by provider, model name, capability and
+local-versus-cloud deployment, so they are set intersections rather than
+walks over the reports.
+
+Usage:
+    python scripts/llm_providers.py --local --capability openai-compatible
+    python scripts/llm_providers.py --model llama
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import json
+import pickle
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+INDEX_VERSION = 2
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "llm_providers"
+PROVIDER_CONTAINERS = ('providers', 'llm_providers')
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '0.0.0.0', '[::1]', '::1'})
+URL_PATTERN = re.compile(r'https?://[^\s"\')]+')
+OPENAI_PATH_PATTERN = re.compile(r'/openai/|/v1/(chat/)?completions|/v1/embeddings')
+# URLs count as API addresses only under keys like these, and never under the second set
+API_URL_KEYS = ('url', 'endpoint', 'api', 'base')
+NON_API_URL_KEYS = ('documentation', 'source', 'website', 'github', 'community', 'docs', 'pricing', 'blog',
+                    'install', 'example', 'key')
+MODEL_NAME_KEYS = ('model_id', 'name', 'model', 'id')
+MODEL_LIST_KEYS = ('models', 'model_types', 'supported_models', 'popular_models', 'available_models')
+CAPABILITY_PATTERNS = {
+    'streaming': r'\bstream',
+    'embeddings': r'embed',
+    'vision': r'\bvision\b|image input|image understanding',
+    'function-calling': r'function[ _-]?calling|tool[ _-]?(use|calling)|\btools\b',
+    'fine-tuning': r'fine[ _-]?tun',
+    'image-generation': r'image[ _-]?generation|text[ _-]?to[ _-]?image|create_image|diffusion',
+    'audio': r'\baudio\b|speech|transcri',
+    'quantization': r'quantiz|\bgguf\b',
+    'gpu-acceleration': r'\bgpus?\b|\bcuda\b',
+    'batch': r'\bbatch',
+    'json-mode': r'json[ _-]mode|response_format|structured output',
+    'rag': r'\brag\b|retrieval',
+    'multimodal': r'multi[ _-]?modal'
+}
+CAPABILITY_REGEXES = {name: re.compile(pattern) for name, pattern in CAPABILITY_PATTERNS.items()}
+
+
+class ProviderRecord(NamedTuple):
+    id: str
+    key: str
+    dataset: str
+    name: str
+    deployment: Tuple[str, ...]
+    base_urls: Tuple[str, ...]
+    capabilities: Tuple[str, ...]
+    models: Tuple[str, ...]
+
+
+class ModelRecord(NamedTuple):
+    provider: str
+    name: str
+    model_id: str
+    modality: str
+    context_length: Optional[int]
+
+
+class EndpointRecord(NamedTuple):
+    provider: str
+    name: str
+    method: str
+    path: str
+    openai_compatible: bool
+
+
+RECORD_TYPES = {'providers': ProviderRecord, 'models': ModelRecord, 'endpoints': EndpointRecord}
+
+
+def _to_rows(records: Dict[str, List[Any]]) -> Dict[str, List[tuple]]:
+    """Strip records to plain tuples for the compiled index, so it unpickles without this module's classes"""
+    return {kind: [tuple(record) for record in rows] for kind, rows in records.items()}
+
+
+def _from_rows(rows: Dict[str, List[tuple]]) -> Dict[str, List[Any]]:
+    """Rebuild the records of a compiled index entry"""
+    return {kind: [RECORD_TYPES[kind](*row) for row in kind_rows] for kind, kind_rows in rows.items()}
+
+
+def normalize_name(value: str) -> str:
+    """Lowercase a provider or model name and collapse its punctuation"""
+    return re.sub(r'[^a-z0-9.]+', '-', value.lower()).strip('-')
+
+
+def _leaves(node: Any, path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield every scalar in a nested report along with the keys leading to it"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from _leaves(value, path + (str(key),))
+    elif isinstance(node, list):
+        for value in node:
+            yield from _leaves(value, path)
+    else:
+        yield path, node
+
+
+def _is_local_url(url: str) -> bool:
+    """Whether a URL points at the machine the provider runs on"""
+    return (urlparse(url).hostname or '') in LOCAL_HOSTS
+
+
+def _extract_endpoints(record_id: str, report: Dict[str, Any]) -> List[EndpointRecord]:
+    """Collect endpoint paths, whether listed as objects or as name/path pairs"""
+    endpoints = []
+
+    def visit(node: Any, path: Tuple[str, ...]):
+        under_endpoints = any('endpoint' in key or key == 'api_details' for key in path)
+        if isinstance(node, dict):
+            if under_endpoints and isinstance(node.get('path'), str):
+                endpoint_path = node['path']
+                features = ' '.join(map(str, node.get('features') or [])).lower()
+                endpoints.append(EndpointRecord(record_id, path[-1] if path else '', str(node.get('method', '')),
+                                                endpoint_path,
+                                                bool(OPENAI_PATH_PATTERN.search(endpoint_path)) or
+                                                any('openai' in key for key in path) or 'openai' in features))
+                return
+            for key, value in node.items():
+                visit(value, path + (str(key),))
+        elif isinstance(node, list):
+            for value in node:
+                visit(value, path)
+        elif under_endpoints and isinstance(node, str) and node.startswith('/'):
+            endpoints.append(EndpointRecord(record_id, path[-1], '', node,
+                                            bool(OPENAI_PATH_PATTERN.search(node)) or
+                                            any('openai' in key for key in path)))
+
+    visit(report, ())
+    return endpoints
+
+
+def _extract_models(record_id: str, report: Dict[str, Any]) -> List[ModelRecord]:
+    """Collect models from model lists, whether entries are objects or bare names"""
+    models = []
+    seen = set()
+
+    def add(name: str, model_id: str = '', modality: str = '', context_length: Any = None):
+        normalized = normalize_name(model_id or name)
+        if not normalized or normalized in seen:
+            return
+        seen.add(normalized)
+        if not isinstance(context_length, int):
+            context_length = None
+        models.append(ModelRecord(record_id, name, model_id or name, modality, context_length))
+
+    def visit(node: Any, key: str):
+        if isinstance(node, dict):
+            for child_key, value in node.items():
+                visit(value, str(child_key))
+        elif isinstance(node, list) and (key in MODEL_LIST_KEYS or key.endswith('_models')):
+            for item in node:
+                if isinstance(item, str):
+                    add(item)
+                elif isinstance(item, dict):
+                    name = next((item[k] for k in MODEL_NAME_KEYS if isinstance(item.get(k), str)), None)
+                    if name:
+                        add(name, str(item.get('model_id', '')), str(item.get('modality', '')),
+                            item.get('context_length', item.get('context_window')))
+
+    visit(report, '')
+    return models
+
+
+def _normalize_provider(dataset: str, key: str, report: Dict[str, Any]) -> Tuple[ProviderRecord, List[ModelRecord], List[EndpointRecord]]:
+    """Flatten one provider's section of a report"""
+    record_id = f"{dataset}/{key}"
+    name = report.get('provider_name') or report.get('name') or key.replace('_', ' ').title()
+    base_urls = []
+    flags = []
+    text = []
+    for path, value in _leaves(report):
+        text.append(' '.join(path).replace('_', ' '))
+        if isinstance(value, bool):
+            if value and any('openai' in part for part in path):
+                flags.append('openai')
+            continue
+        if not isinstance(value, str):
+            continue
+        text.append(value)
+        if not any(marker in part for part in path for marker in API_URL_KEYS) or \
+                any(marker in part for part in path for marker in NON_API_URL_KEYS):
+            continue
+        for url in URL_PATTERN.findall(value):
+            url = url.rstrip('/.,')
+            if url not in base_urls:
+                base_urls.append(url)
+
+    endpoints = _extract_endpoints(record_id, report)
+    models = _extract_models(record_id, report)
+    blob = '\n'.join(text).lower()
+
+    capabilities = {capability for capability, regex in CAPABILITY_REGEXES.items() if regex.search(blob)}
+    if flags or 'openai compatib' in blob or 'openai-compatib' in blob or any(e.openai_compatible for e in endpoints):
+        capabilities.add('openai-compatible')
+
+    local_urls = [url for url in base_urls if _is_local_url(url)]
+    deployment = set()
+    # Self-hosted servers often document only relative paths, so the report's own grouping counts too
+    if local_urls or dataset.startswith('local'):
+        deployment.add('local')
+    if len(local_urls) < len(base_urls) or not deployment:
+        deployment.add('cloud')
+
+    provider = ProviderRecord(record_id, key, dataset, name, tuple(sorted(deployment)), tuple(base_urls),
+                              tuple(sorted(capabilities)), tuple(model.name for model in models))
+    return provider, models, endpoints
+
+
+def normalize_report(dataset: str, report: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Flatten every provider in a report into provider, model and endpoint records"""
+    container = next((report[key] for key in PROVIDER_CONTAINERS if isinstance(report.get(key), dict)), {})
+    records = {'providers': [], 'models': [], 'endpoints': []}
+    for key, section in container.items():
+        if not isinstance(section, dict):
+            continue
+        provider, models, endpoints = _normalize_provider(dataset, key, section)
+        records['providers'].append(provider)
+        records['models'].extend(models)
+        records['endpoints'].extend(endpoints)
+    return records
+
+
+class ProviderIndex:
+    def __init__(self, data_dir: Optional[str] = None, index_file: Optional[str] = None):
+        self.data_dir = Path(data_dir) if data_dir else DATA_DIR
+        self.index_file = Path(index_file) if index_file else self.data_dir.parent / "llm_providers.index"
+        self.loaded = False
+        self.parsed_files = 0
+        self.providers: Dict[str, ProviderRecord] = {}
+        self.models: List[ModelRecord] = []
+        self.endpoints: List[EndpointRecord] = []
+        self.by_provider: Dict[str, Set[str]] = defaultdict(set)
+        self.by_model: Dict[str, Set[str]] = defaultdict(set)
+        self.by_capability: Dict[str, Set[str]] = defaultdict(set)
+        self.by_deployment: Dict[str, Set[str]] = defaultdict(set)
+        self._raw: Dict[str, Any] = {}
+
+    def raw(self, dataset: str) -> Any:
+        """Return a report's original JSON, parsing it on first access"""
+        if dataset not in self._raw:
+            with open(self.data_dir / f"{dataset}.json", 'r', encoding='utf-8') as f:
+                self._raw[dataset] = json.load(f)
+        return self._raw[dataset]
+
+    def _load_compiled(self) -> Dict[str, Any]:
+        """Read the compiled index, ignoring it if it is missing or from another version"""
+        try:
+            with open(self.index_file, 'rb') as f:
+                compiled = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return {}
+        if not isinstance(compiled, dict) or compiled.get('version') != INDEX_VERSION:
+            return {}
+        return compiled.get('files', {})
+
+    def load(self):
+        """Build the in-memory indexes, parsing only reports newer than the compiled index"""
+        if self.loaded:
+            return
+        compiled = self._load_compiled()
+        files = {}
+        for path in sorted(self.data_dir.glob('*.json')):
+            stat = path.stat()
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            entry = compiled.get(path.stem)
+            if entry is None or entry['fingerprint'] != fingerprint:
+                try:
+                    entry = {'fingerprint': fingerprint,
+                             'records': _to_rows(normalize_report(path.stem, self.raw(path.stem)))}
+                except json.JSONDecodeError as e:
+                    print(f"⚠️ Skipping malformed provider report {path.name}: {e}")
+                    continue
+                self.parsed_files += 1
+            files[path.stem] = entry
+
+        for dataset in sorted(files):
+            records = _from_rows(files[dataset]['records'])
+            for provider in records['providers']:
+                self._add_provider(provider)
+            self.models.extend(records['models'])
+            self.endpoints.extend(records['endpoints'])
+        for model in self.models:
+            self.by_model[normalize_name(model.name)].add(model.provider)
+            self.by_model[normalize_name(model.model_id)].add(model.provider)
+
+        if self.parsed_files or set(files) != set(compiled):
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'wb') as f:
+                pickle.dump({'version': INDEX_VERSION, 'files': files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.loaded = True
+
+    def _add_provider(self, provider: ProviderRecord):
+        """Register a provider in every index"""
+        self.providers[provider.id] = provider
+        self.by_provider[normalize_name(provider.key)].add(provider.id)
+        self.by_provider[normalize_name(provider.name)].add(provider.id)
+        for capability in provider.capabilities:
+            self.by_capability[capability].add(provider.id)
+        for deployment in provider.deployment:
+            self.by_deployment[deployment].add(provider.id)
+
+    def query(self, provider: Optional[str] = None, model: Optional[str] = None,
+              capability: Union[str, Iterable[str], None] = None,
+              local: Optional[bool] = None) -> List[ProviderRecord]:
+        """Return the providers matching every given criterion"""
+        self.load()
+        candidates = []
+        if provider is not None:
+            candidates.append(self.by_provider.get(normalize_name(provider), set()))
+        if model is not None:
+            candidates.append(self.by_model.get(normalize_name(model), set()))
+        if capability is not None:
+            for name in ([capability] if isinstance(capability, str) else capability):
+                candidates.append(self.by_capability.get(name, set()))
+        if local is not None:
+            candidates.append(self.by_deployment.get('local' if local else 'cloud', set()))
+
+        if not candidates:
+            matches = set(self.providers)
+        else:
+            candidates.sort(key=len)
+            matches = set(candidates[0]).intersection(*candidates[1:])
+        return [self.providers[record_id] for record_id in sorted(matches)]
+
+    def find_models(self, text: str) -> List[ModelRecord]:
+        """Return models whose name or id contains the given text"""
+        self.load()
+        needle = normalize_name(text)
+        return [model for model in self.models
+                if needle in normalize_name(model.name) or needle in normalize_name(model.model_id)]
+
+    def provider_endpoints(self, record_id: str, openai_compatible: Optional[bool] = None) -> List[EndpointRecord]:
+        """Return the endpoints of one provider"""
+        self.load()
+        return [endpoint for endpoint in self.endpoints if endpoint.provider == record_id and
+                (openai_compatible is None or endpoint.openai_compatible == openai_compatible)]
+
+    def stats(self) -> Dict[str, int]:
+        """Describe the loaded index"""
+        self.load()
+        return {
+            'providers': len(self.providers),
+            'models': len(self.models),
+            'endpoints': len(self.endpoints),
+            'capabilities': len(self.by_capability),
+            'parsed_files': self.parsed_files
+        }
+
+
+def main():
+    """Query the provider reports from the command line"""
+    parser = argparse.ArgumentParser(description="Query the LLM provider reports")
+    parser.add_argument('--data-dir', default=str(DATA_DIR))
+    parser.add_argument('--provider', help="provider key or name")
+    parser.add_argument('--model', help="exact model name or id; use --find-model for a substring search")
+    parser.add_argument('--find-model', help="list models whose name contains this text")
+    parser.add_argument('--capability', action='append', help="required capability (repeatable)")
+    deployment = parser.add_mutually_exclusive_group()
+    deployment.add_argument('--local', action='store_true', help="only providers that run locally")
+    deployment.add_argument('--cloud', action='store_true', help="only hosted providers")
+    args = parser.parse_args()
+
+    index = ProviderIndex(args.data_dir)
+    started = time.perf_counter()
+    index.load()
+    print(f"📚 Loaded {index.stats()} in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    if args.find_model:
+        for model in index.find_models(args.find_model):
+            print(f"   {model.name} ({model.provider})")
+        return
+
+    started = time.perf_counter()
+    results = index.query(provider=args.provider, model=args.model, capability=args.capability,
+                          local=True if args.local else False if args.cloud else None)
+    elapsed = (time.perf_counter() - started) * 1000
+    for provider in results:
+        print(f"🔌 {provider.name} [{provider.id}] {'/'.join(provider.deployment)}")
+        print(f"   capabilities: {', '.join(provider.capabilities) or 'none listed'}")
+    print(f"✅ {len(results)} providers in {elapsed:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
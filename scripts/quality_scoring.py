@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch Quality Scoring for Alot1z GitHub Repository Wiki System
+
+Scores a whole repository set at once. One pass over the records gathers
+the score's inputs into columns (popular language, MIT license, push age,
+stars, README size, topics, open issues, archive flag). The weights from
+the [quality_scoring] section of config.ini are then applied to every
+repository with NumPy vector operations. The arithmetic mirrors
+calculate_quality_score term by term, so batch and single scores agree
+exactly. Without NumPy the batch falls back to scoring records one by one.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence
+
+from repository_enrichment import DEFAULT_WEIGHTS, calculate_quality_score, enrichment_details, parse_timestamp, push_time
+from repository_model import Repository
+from wiki_settings import ScoringWeights
+
+try:
+    import numpy as np
+except ImportError:  # optional; batches are then scored one record at a time
+    np = None
+
+
+def _age_days(texts: List[str], now: datetime) -> 'np.ndarray':
+    """Whole days since each push time, NaN where it is unknown, as timedelta.days would count them"""
+    ages = np.full(len(texts), np.nan)
+    # GitHub's own format is parsed by NumPy in one go; anything else goes through parse_timestamp
+    standard = [len(text) == 20 and text[10] == 'T' and text[-1] == 'Z' for text in texts]
+    positions = [position for position, is_standard in enumerate(standard) if is_standard]
+    now_utc = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), 'us')
+    try:
+        pushed = np.array([texts[position][:19] for position in positions], dtype='datetime64[s]')
+        ages[positions] = (now_utc - pushed.astype('datetime64[us]')) // np.timedelta64(1, 'D')
+    except ValueError:
+        positions = []
+    parsed = set(positions)
+    for position, text in enumerate(texts):
+        if position not in parsed:
+            pushed_at = parse_timestamp(text)
+            if pushed_at is not None:
+                ages[position] = (now - pushed_at).days
+    return ages
+
+
+def score_columns(repositories: Sequence[Repository], weights: ScoringWeights, now: datetime) -> Dict[str, 'np.ndarray']:
+    """Gather the inputs of the quality score into one array per signal"""
+    count = len(repositories)
+    details = list(map(enrichment_details, repositories))
+    languages = list(map(attrgetter('language'), repositories))
+    licenses = list(map(attrgetter('license'), repositories))
+    # Languages and licenses repeat a lot, so each distinct value is tested once
+    popular_languages = set(weights.popular_languages)
+    popular = {language: language.lower() in popular_languages for language in set(languages)}
+    mit = {license_name: 'MIT' in license_name for license_name in set(licenses)}
+
+    listing_stars = np.fromiter(map(attrgetter('stars'), repositories), np.float64, count)
+    detail_stars = np.array([entry.get('stars') or 0 for entry in details], dtype=np.float64)
+    return {
+        'popular': np.fromiter(map(popular.__getitem__, languages), bool, count),
+        'mit': np.fromiter(map(mit.__getitem__, licenses), bool, count),
+        'age_days': _age_days(list(map(push_time, repositories, details)), now),
+        'stars': np.maximum(listing_stars, detail_stars),
+        'enriched': np.fromiter(map(bool, details), bool, count),
+        'readme_bytes': np.array([entry.get('readme_bytes') or 0 for entry in details], dtype=np.float64),
+        'topics': np.array([bool(repo.extra and repo.extra.get('topics')) for repo in repositories], dtype=bool),
+        'open_issues': np.array([entry.get('open_issues', 0) for entry in details], dtype=np.float64),
+        'archived': np.array([bool(entry.get('archived')) for entry in details], dtype=bool)
+    }
+
+
+def score_batch(repositories: Sequence[Repository], weights: Optional[ScoringWeights] = None,
+                now: Optional[datetime] = None) -> List[float]:
+    """Return the quality score of every repository, computed as vector operations"""
+    weights = weights or DEFAULT_WEIGHTS
+    now = now or datetime.now(timezone.utc)
+    if np is None:
+        return [calculate_quality_score(repo, now, weights) for repo in repositories]
+    if not repositories:
+        return []
+
+    columns = score_columns(repositories, weights, now)
+    stars = columns['stars']
+    age = columns['age_days']
+    enriched = columns['enriched']
+    readme_bytes = columns['readme_bytes']
+
+    # Terms are added in the same order as calculate_quality_score so the floats match exactly
+    score = np.full(len(repositories), weights.base, dtype=np.float64)
+    score += np.where(columns['popular'], weights.popular_language, 0.0)
+    score += np.where(columns['mit'], weights.mit_license, 0.0)
+    score += np.where(age <= 90, weights.pushed_within_90_days, np.where(age <= 365, weights.pushed_within_365_days, 0.0))
+    score += np.minimum(stars * 0.001 * weights.stars_per_thousand, weights.stars_cap)
+    score += np.where(enriched, np.where(readme_bytes >= weights.readme_min_bytes, weights.readme,
+                                         np.where(readme_bytes == 0, weights.missing_readme, 0.0)), 0.0)
+    score += np.where(enriched & columns['topics'], weights.topics, 0.0)
+    score += np.where(enriched & (columns['open_issues'] > 100 + stars * 0.05), weights.issue_backlog, 0.0)
+    score += np.where(enriched & columns['archived'], weights.archived, 0.0)
+    return (np.rint(np.clip(score, 0.0, 10.0) * 10) / 10).tolist()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Render Manifest for Alot1z GitHub Repository Wiki System
+
+Records a content hash of the inputs behind every generated wiki page and
+the repositories that feed it. Pages whose inputs are unchanged are not
+re-rendered, and pages whose rendered bytes match the file on disk are not
+rewritten, so a no-op update touches no files. Large pages are streamed to
+a buffered temporary file by PageWriter and only swapped into place when
+their bytes differ, and the manifest is safe to update from render workers.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize records through their to_dict() when they have one"""
+    to_dict = getattr(value, 'to_dict', None)
+    return to_dict() if to_dict is not None else str(value)
+
+
+def content_hash(value: Any) -> str:
+    """Hash any JSON-serializable value into a stable hex digest"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds the same bytes"""
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def same_bytes(first: Path, second: Path, chunk_size: int = 1 << 16) -> bool:
+    """Compare two files chunk by chunk without reading either one whole"""
+    try:
+        if first.stat().st_size != second.stat().st_size:
+            return False
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            while True:
+                chunk = a.read(chunk_size)
+                if chunk != b.read(chunk_size):
+                    return False
+                if not chunk:
+                    return True
+    except FileNotFoundError:
+        return False
+
+
+class PageWriter:
+    def __init__(self, path: Path, buffer_size: int = 1 << 16):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(f".{self.path.name}.{threading.get_ident()}.tmp")
+        self.buffer_size = buffer_size
+        self.written = False
+        self._file = None
+
+    def __enter__(self) -> 'PageWriter':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # newline='' keeps the bytes identical to write_if_changed() on every platform
+        self._file = open(self.temp_path, 'w', encoding='utf-8', newline='', buffering=self.buffer_size)
+        self.write = self._file.write
+        self.writelines = self._file.writelines
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.close()
+        if exc_type is not None or same_bytes(self.temp_path, self.path):
+            self.temp_path.unlink()
+            return False
+        os.replace(self.temp_path, self.path)
+        self.written = True
+        return False
+
+
+class RenderManifest:
+    def __init__(self, manifest_file: str, root: str):
+        self.manifest_file = Path(manifest_file)
+        self.root = Path(root)
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.rendered = 0
+        self.skipped = 0
+        self.written = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk if it exists"""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f).get('pages', {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.pages = {}
+
+    def save(self):
+        """Persist the manifest, sorted so it diffs cleanly"""
+        write_if_changed(self.manifest_file, json.dumps({'pages': self.pages}, indent=2, sort_keys=True))
+
+    def _key(self, page: Path) -> str:
+        """Return the manifest key of a page, relative to the wiki root"""
+        return Path(page).relative_to(self.root).as_posix()
+
+    def is_current(self, page: Path, inputs_hash: str) -> bool:
+        """Check whether a page on disk was rendered from the same inputs"""
+        entry = self.pages.get(self._key(page))
+        current = entry is not None and entry['inputs'] == inputs_hash and Path(page).exists()
+        if current:
+            with self._lock:
+                self.skipped += 1
+        return current
+
+    def record(self, page: Path, inputs_hash: str, repo_keys: Iterable[str], written: bool):
+        """Remember the inputs a page was rendered from"""
+        entry = {'inputs': inputs_hash, 'repositories': sorted(repo_keys)}
+        with self._lock:
+            self.pages[self._key(page)] = entry
+            self.rendered += 1
+            if written:
+                self.written += 1
+
+    def prune(self, live_pages: Iterable[Path]) -> List[str]:
+        """Forget pages that are no longer generated"""
+        live = {self._key(page) for page in live_pages}
+        stale = [page for page in self.pages if page not in live]
+        for page in stale:
+            del self.pages[page]
+        return stale
+
+    def pages_for_repository(self, repo_key: str) -> List[str]:
+        """List the pages a repository feeds"""
+        return [page for page, entry in self.pages.items() if repo_key in entry['repositories']]
+
+    def stats(self) -> Dict[str, int]:
+        """Return render/skip/write counters for reporting"""
+        return {'rendered': self.rendered, 'skipped': self.skipped, 'written': self.written}
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Recorded-Response Replay Server for Alot1z GitHub Repository Wiki System
+
+Records the HTTP exchanges of a real crawl and replays them from a local
+server, so the crawler, the auto-updater and every source backend can be
+exercised offline and deterministically. Requests are matched on method,
+path, query and JSON body. Recorded ETags are honoured with 304 responses.
+
+Usage:
+    python scripts/replay_server.py record --source rest --username Alot1z --output recording.json
+    python scripts/replay_server.py serve recording.json --port 8765
+    GITHUB_SOURCE=rest GITHUB_SOURCE_URL=http://127.0.0.1:8765 python scripts/github_crawler.py
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import json
+import threading
+import time
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fetch_engine import PageFetcher
+from repository_sources import SOURCES, create_source
+
+REPLAYED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Link', 'Retry-After',
+                    'X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset')
+
+
+def exchange_key(method: str, path: str, body: Optional[str]) -> Tuple[str, str, str]:
+    """Match requests on method, path and query, and a canonical JSON body"""
+    if body:
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True)
+        except ValueError:
+            pass
+    return method.upper(), path, body or ""
+
+
+class ResponseRecorder:
+    def __init__(self, recording_file: str):
+        self.recording_file = Path(recording_file)
+        self.exchanges: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def attach(self, session: requests.Session):
+        """Record every response the session receives"""
+        session.hooks['response'].append(self._record)
+
+    def _record(self, response: requests.Response, *args, **kwargs):
+        request = response.request
+        parts = urlsplit(request.url)
+        body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
+        exchange = {
+            'method': request.method,
+            'path': f"{parts.path}?{parts.query}" if parts.query else parts.path,
+            'body': body,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in REPLAYED_HEADERS if name in response.headers},
+            'text': response.text
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self):
+        """Write the recorded exchanges to disk"""
+        self.recording_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.recording_file, 'w', encoding='utf-8') as f:
+            json.dump({'exchanges': self.exchanges}, f, indent=2, ensure_ascii=False)
+
+
+class ReplayServer:
+    def __init__(self, exchanges: List[Dict[str, Any]], host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0):
+        # The last successful response for a request wins, like a fresh crawl would see
+        self.responses = {}
+        for exchange in exchanges:
+            if exchange['status'] != 304:
+                self.responses[exchange_key(exchange['method'], exchange['path'], exchange.get('body'))] = exchange
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.requests = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @classmethod
+    def from_file(cls, recording_file: str, **options: Any) -> 'ReplayServer':
+        """Load a recording written by ResponseRecorder"""
+        with open(recording_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['exchanges'], **options)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._replay(None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self._replay(self.rfile.read(length).decode('utf-8'))
+
+            def _replay(self, body: Optional[str]):
+                if server.latency:
+                    time.sleep(server.latency)
+                exchange = server.responses.get(exchange_key(self.command, self.path, body))
+                with server._lock:
+                    server.requests += 1
+                    server.misses += exchange is None
+                if exchange is None:
+                    self._send(404, {'Content-Type': 'application/json'}, '{"message": "Not Found (not recorded)"}')
+                    return
+
+                etag = exchange['headers'].get('ETag')
+                if etag and self.headers.get('If-None-Match') == etag:
+                    self._send(304, {'ETag': etag}, '')
+                    return
+                self._send(exchange['status'], exchange['headers'], exchange['text'])
+
+            def _send(self, status: int, headers: Dict[str, str], text: str):
+                data = text.encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def __enter__(self) -> 'ReplayServer':
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def record(kind: str, username: str, output: str, base_url: Optional[str] = None) -> int:
+    """Run a full listing through a source and record every exchange"""
+    session = requests.Session()
+    recorder = ResponseRecorder(output)
+    recorder.attach(session)
+    source = create_source(kind, username, base_url)
+    source.configure(session)
+    repositories = source.fetch_repositories(PageFetcher(session))
+    recorder.save()
+    print(f"💾 Recorded {len(recorder.exchanges)} exchanges ({len(repositories)} repositories) to {output}")
+    return len(recorder.exchanges)
+
+
+def main():
+    """Record a crawl or replay a recording"""
+    parser = argparse.ArgumentParser(description="Record and replay GitHub responses")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record')
+    record_parser.add_argument('--source', choices=sorted(SOURCES), default='rest')
+    record_parser.add_argument('--username', default='Alot1z')
+    record_parser.add_argument('--base-url')
+    record_parser.add_argument('--output', default='recording.json')
+
+    serve_parser = commands.add_parser('serve')
+    serve_parser.add_argument('recording')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(args.source, args.username, args.output, args.base_url)
+        return
+
+    with ReplayServer.from_file(args.recording, host=args.host, port=args.port, latency=args.latency) as server:
+        print(f"🔁 Replaying {len(server.responses)} responses at {server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
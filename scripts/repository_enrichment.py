@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Per-Repository Enrichment Pipeline for Alot1z GitHub Repository Wiki System
+
+Listing pages only carry a name, a description and a few counters. This
+pipeline fetches the details a listing lacks (README size, topics, open
+issues, archive and fork flags, push time and stars) and feeds them into
+the quality score, tags and purpose. Results are cached per repository and
+keyed by the push time the listing reports, so repositories that were not
+pushed since the last run are never fetched again.
+
+The pipeline runs in three stages. Planning splits cache hits from
+repositories that need fetching. Fetching runs batches on a bounded worker
+pool. Applying writes results back onto the records as batches complete.
+With a token, one GraphQL query covers a whole batch of repositories, so a
+cold cache of tens of thousands costs a few hundred requests. Without one,
+the REST API is used one repository at a time. At most twice as many
+batches as workers are in flight, so a large backlog never queues up in
+memory. The shared rate limiter paces every request.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import json
+import os
+import time
+import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from fetch_engine import PageFetcher
+from render_manifest import write_if_changed
+from repository_model import Repository
+from repository_sources import DEFAULT_API_URL, PagedSource, RestApiSource
+from repository_store import repository_key
+from wiki_settings import ScoringWeights
+
+CACHE_VERSION = 1
+GRAPHQL_BATCH_SIZE = 25
+SAVE_EVERY_BATCHES = 40
+# Records without a push time cannot be keyed by it, so their details expire instead
+UNKNOWN_PUSH_MAX_AGE_DAYS = 7
+README_NAMES = ('README.md', 'readme.md', 'README.rst', 'README')
+# Date text of the listing's <relative-time> elements, e.g. 'Oct 19, 2025'
+LISTING_DATE_FORMAT = '%b %d, %Y'
+DEFAULT_WEIGHTS = ScoringWeights()
+
+GRAPHQL_DETAILS_FRAGMENT = """
+fragment details on Repository {
+  pushedAt
+  stargazerCount
+  isArchived
+  isFork
+  issues(states: OPEN) { totalCount }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+%s
+}
+""" % '\n'.join(f'  readme{index}: object(expression: "HEAD:{name}") {{ ... on Blob {{ byteSize }} }}'
+                for index, name in enumerate(README_NAMES))
+
+
+def enrichment_details(repo: Repository) -> Dict[str, Any]:
+    """Return the enriched details attached to a record, if any"""
+    return repo.extra.get('details', {}) if repo.extra else {}
+
+
+def push_time(repo: Repository, details: Dict[str, Any]) -> str:
+    """Return the best known push time of a record: enriched, then the listing's timestamp, then its text"""
+    return details.get('pushed_at') or (repo.extra and repo.extra.get('updated_at')) or repo.last_updated
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp such as GitHub's '2025-10-01T12:00:00Z', or a listing date like 'Oct 19, 2025'"""
+    if not value or value == 'Unknown':
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = datetime.strptime(value, LISTING_DATE_FORMAT)
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def calculate_quality_score(repo: Repository, now: Optional[datetime] = None,
+                            weights: Optional[ScoringWeights] = None) -> float:
+    """Calculate a 0-10 quality score from listing metrics and any enriched details.
+
+    This is the reference for one record; quality_scoring.score_batch computes
+    the same scores for a whole repository set at once.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    details = enrichment_details(repo)
+    score = weights.base
+
+    # Language popularity bonus
+    if repo.language.lower() in weights.popular_languages:
+        score += weights.popular_language
+
+    # MIT license bonus
+    if 'MIT' in repo.license:
+        score += weights.mit_license
+
+    # Recent push bonus, from the enriched push time or the listing's update time
+    pushed = parse_timestamp(push_time(repo, details))
+    if pushed is not None:
+        age_days = ((now or datetime.now(timezone.utc)) - pushed).days
+        if age_days <= 90:
+            score += weights.pushed_within_90_days
+        elif age_days <= 365:
+            score += weights.pushed_within_365_days
+
+    # Stars bonus; listing pages can report 0 where the API knows better
+    stars = max(repo.stars, details.get('stars') or 0)
+    score += min(stars * 0.001 * weights.stars_per_thousand, weights.stars_cap)
+
+    if details:
+        # A substantial README is the best cheap signal of a documented project
+        readme_bytes = details.get('readme_bytes') or 0
+        if readme_bytes >= weights.readme_min_bytes:
+            score += weights.readme
+        elif readme_bytes == 0:
+            score += weights.missing_readme
+        if repo.extra.get('topics'):
+            score += weights.topics
+        if details.get('open_issues', 0) > 100 + stars * 0.05:
+            score += weights.issue_backlog
+        if details.get('archived'):
+            score += weights.archived
+
+    # Rounded half-to-even in tenths, exactly as the batch scorer rounds
+    return round(min(max(score, 0.0), 10.0) * 10) / 10
+
+
+def apply_details(repo: Repository, details: Dict[str, Any]) -> bool:
+    """Attach fetched details to a record, returning whether anything changed"""
+    if details.get('missing'):
+        return False
+    extra = dict(repo.extra or {})
+    attached = {key: value for key, value in details.items() if key not in ('topics', 'fork')}
+    if (extra.get('details') == attached and extra.get('topics') == details['topics']
+            and extra.get('fork') == details['fork']):
+        return False
+    # Topics and the fork flag share the keys the API listing sources already fill in
+    extra['topics'] = details['topics']
+    extra['fork'] = details['fork']
+    extra['details'] = attached
+    repo.extra = extra
+    return True
+
+
+def topic_tags(repo: Repository) -> List[str]:
+    """Return a record's GitHub topics, which are used as tags as they are"""
+    return list(repo.extra.get('topics') or ()) if repo.extra else []
+
+
+def api_url_for(source: PagedSource) -> str:
+    """Enrich through the API the source already talks to, so replayed crawls stay offline"""
+    return source.base_url if isinstance(source, RestApiSource) else DEFAULT_API_URL
+
+
+class EnrichmentCache:
+    def __init__(self, cache_file: str):
+        self.cache_file = Path(cache_file)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """Load cached details from disk, starting over on a version change"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        """Write the cache back to disk"""
+        write_if_changed(self.cache_file, json.dumps({'version': CACHE_VERSION, 'entries': self.entries},
+                                                     ensure_ascii=False, separators=(',', ':')))
+
+    def get(self, repo: Repository) -> Optional[Dict[str, Any]]:
+        """Return the cached details for a record, unless it was pushed since they were fetched"""
+        entry = self.entries.get(repository_key(repo.url))
+        if entry is None or entry['pushed_at'] != repo.last_updated:
+            return None
+        if repo.last_updated == 'Unknown':
+            age = time.time() - entry['fetched_at']
+            if age > UNKNOWN_PUSH_MAX_AGE_DAYS * 86400:
+                return None
+        return entry['details']
+
+    def store(self, repo: Repository, details: Dict[str, Any]):
+        """Cache details under the push time the listing reported"""
+        self.entries[repository_key(repo.url)] = {
+            'pushed_at': repo.last_updated,
+            'fetched_at': int(time.time()),
+            'details': details
+        }
+
+    def prune(self, live_urls: Iterable[str]) -> int:
+        """Drop the entries of repositories that are no longer tracked"""
+        live = {repository_key(url) for url in live_urls}
+        stale = [key for key in self.entries if key not in live]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+
+class RepositoryEnricher:
+    def __init__(self, fetcher: PageFetcher, cache_file: str, api_url: str = DEFAULT_API_URL,
+                 token: Optional[str] = None, batch_size: int = GRAPHQL_BATCH_SIZE):
+        self.fetcher = fetcher
+        self.cache = EnrichmentCache(cache_file)
+        self.api_url = api_url.rstrip('/')
+        self.token = token if token is not None else os.environ.get('GITHUB_TOKEN')
+        # GraphQL needs a token; the REST fallback fetches one repository per batch
+        self.batch_size = batch_size if self.token else 1
+        self.headers = {'Accept': 'application/vnd.github+json', 'X-GitHub-Api-Version': '2022-11-28'}
+        if self.token:
+            self.headers['Authorization'] = f"Bearer {self.token}"
+
+    def needs_refresh(self, repo: Repository) -> bool:
+        """Check whether a record's details are missing or older than its last push"""
+        details = self.cache.get(repo)
+        if details is None:
+            return True
+        return not details.get('missing') and enrichment_details(repo) != {
+            key: value for key, value in details.items() if key not in ('topics', 'fork')}
+
+    def enrich(self, repositories: List[Repository]) -> Dict[str, int]:
+        """Attach details to every record, fetching only those not cached for their push time"""
+        stats = {'cached': 0, 'fetched': 0, 'missing': 0, 'failed': 0, 'changed': 0}
+        pending = []
+        for repo in repositories:
+            details = self.cache.get(repo)
+            if details is None:
+                pending.append(repo)
+                continue
+            stats['cached'] += 1
+            stats['changed'] += apply_details(repo, details)
+
+        if pending:
+            print(f"🔎 Enriching {len(pending)} repositories ({stats['cached']} cached)")
+            self._fetch_all(pending, stats)
+            self.cache.save()
+        return stats
+
+    def _fetch_all(self, pending: List[Repository], stats: Dict[str, int]):
+        """Fetch batches on a bounded pool, applying each as it completes"""
+        batches = [pending[start:start + self.batch_size] for start in range(0, len(pending), self.batch_size)]
+        fetch_batch = self._fetch_graphql_batch if self.token else self._fetch_rest_batch
+        max_in_flight = 2 * self.fetcher.max_workers
+        in_flight = {}
+        completed = 0
+        next_batch = 0
+
+        with ThreadPoolExecutor(max_workers=self.fetcher.max_workers) as pool:
+            while next_batch < len(batches) or in_flight:
+                # Backpressure: only queue more work once a slot frees up
+                while next_batch < len(batches) and len(in_flight) < max_in_flight:
+                    batch = batches[next_batch]
+                    in_flight[pool.submit(fetch_batch, batch)] = batch
+                    next_batch += 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    try:
+                        results = future.result()
+                    except requests.exceptions.RequestException as e:
+                        print(f"❌ Error enriching {len(batch)} repositories: {e}")
+                        stats['failed'] += len(batch)
+                        continue
+                    for repo, details in zip(batch, results):
+                        self.cache.store(repo, details)
+                        stats['missing' if details.get('missing') else 'fetched'] += 1
+                        stats['changed'] += apply_details(repo, details)
+
+                    completed += 1
+                    if completed % SAVE_EVERY_BATCHES == 0:
+                        # Keep progress if a long cold run is interrupted
+                        self.cache.save()
+                        print(f"🔎 Enriched {completed} of {len(batches)} batches")
+
+    def _fetch_graphql_batch(self, batch: List[Repository]) -> List[Dict[str, Any]]:
+        """Fetch a whole batch of repositories with one aliased GraphQL query"""
+        variables = {}
+        selections = []
+        for index, repo in enumerate(batch):
+            owner, _, name = repository_key(repo.url).partition('/')
+            variables[f"o{index}"] = owner
+            variables[f"n{index}"] = name
+            selections.append(f"  r{index}: repository(owner: $o{index}, name: $n{index}) {{ ...details }}")
+        parameters = ', '.join(f"$o{index}: String!, $n{index}: String!" for index in range(len(batch)))
+        query = f"query({parameters}) {{\n" + '\n'.join(selections) + "\n}\n" + GRAPHQL_DETAILS_FRAGMENT
+
+        data = self.fetcher.request('POST', f"{self.api_url}/graphql", headers=self.headers,
+                                    json_body={'query': query, 'variables': variables}).json()
+        nodes = data.get('data')
+        if nodes is None:
+            # Missing repositories only null their own alias; no data at all is a real failure
+            raise requests.exceptions.RequestException(
+                '; '.join(error.get('message', 'GraphQL error') for error in data.get('errors', [])))
+        return [self._details_from_graphql(nodes.get(f"r{index}")) for index in range(len(batch))]
+
+    @staticmethod
+    def _details_from_graphql(node: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Flatten one repository node into the cached details"""
+        if node is None:
+            return {'missing': True}
+        readme_sizes = [(node.get(f"readme{index}") or {}).get('byteSize') for index in range(len(README_NAMES))]
+        return {
+            'pushed_at': node.get('pushedAt'),
+            'stars': node.get('stargazerCount') or 0,
+            'open_issues': (node.get('issues') or {}).get('totalCount', 0),
+            'readme_bytes': next((size for size in readme_sizes if size), 0),
+            'archived': bool(node.get('isArchived')),
+            'topics': [topic['topic']['name'] for topic in (node.get('repositoryTopics') or {}).get('nodes', [])],
+            'fork': bool(node.get('isFork'))
+        }
+
+    def _fetch_rest_batch(self, batch: List[Repository]) -> List[Dict[str, Any]]:
+        """Fetch repositories one by one from the REST API"""
+        results = []
+        for repo in batch:
+            key = repository_key(repo.url)
+            item = self._get_json(f"{self.api_url}/repos/{key}")
+            if item is None:
+                results.append({'missing': True})
+                continue
+            readme = self._get_json(f"{self.api_url}/repos/{key}/readme") or {}
+            results.append({
+                'pushed_at': item.get('pushed_at'),
+                'stars': item.get('stargazers_count') or 0,
+                # The REST count includes open pull requests
+                'open_issues': item.get('open_issues_count') or 0,
+                'readme_bytes': readme.get('size') or 0,
+                'archived': bool(item.get('archived')),
+                'topics': item.get('topics') or [],
+                'fork': bool(item.get('fork'))
+            })
+        return results
+
+    def _get_json(self, url: str) -> Optional[Dict[str, Any]]:
+        """GET a REST resource, treating 404 as absent"""
+        try:
+            return self.fetcher.request('GET', url, headers=self.headers).json()
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Repository Filters for Alot1z GitHub Repository Wiki System
+
+Applies the include_forks and min_stars options of config.ini's
+[crawler_settings] to each page of parsed records. It runs inside the parse
+step, so excluded repositories are dropped before any classification,
+scoring, enrichment or rendering is spent on them. Every filter counts what
+it drops so a run can report how much of the listing was excluded and why.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+from repository_model import Repository
+from wiki_settings import WikiSettings
+
+
+def is_fork(repo: Repository) -> bool:
+    """Whether the source reported the repository as a fork"""
+    return bool(repo.extra and repo.extra.get('fork'))
+
+
+def known_stars(repo: Repository) -> Optional[int]:
+    """Return the star count, preferring enriched details, or None when the listing left it out"""
+    details = repo.extra and repo.extra.get('details')
+    if details and 'stars' in details:
+        return details['stars']
+    if repo.extra and repo.extra.get('stars_unknown'):
+        return None
+    return repo.stars
+
+
+class RepositoryFilter:
+    def __init__(self, include_forks: bool = True, min_stars: int = 0):
+        self.include_forks = include_forks
+        self.min_stars = min_stars
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: WikiSettings) -> 'RepositoryFilter':
+        """Build the filter described by the crawler settings"""
+        return cls(include_forks=settings.include_forks, min_stars=settings.min_stars)
+
+    def apply(self, repositories: List[Repository]) -> List[Repository]:
+        """Return the repositories of one page that pass every filter"""
+        kept = []
+        dropped = Counter()
+        unknown = 0
+        for repo in repositories:
+            if not self.include_forks and is_fork(repo):
+                dropped['forks'] += 1
+                continue
+            if self.min_stars > 0:
+                # Decided per repository, so the result never depends on what shares its batch
+                stars = known_stars(repo)
+                if stars is None:
+                    unknown += 1
+                elif stars < self.min_stars:
+                    dropped['min_stars'] += 1
+                    continue
+            kept.append(repo)
+
+        with self._lock:
+            self.counters.update(dropped)
+            self.counters['stars_unknown'] += unknown
+        return kept
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many repositories each filter dropped"""
+        with self._lock:
+            return {
+                'forks': self.counters['forks'],
+                'min_stars': self.counters['min_stars'],
+                'stars_unknown': self.counters['stars_unknown']
+            }
+
+    def report(self) -> str:
+        """Summarize the drop counters in one line"""
+        stats = self.stats()
+        line = f"🚫 Filters dropped {stats['forks']} forks and {stats['min_stars']} repositories under {self.min_stars} stars"
+        if stats['stars_unknown']:
+            line += f" (kept {stats['stars_unknown']} without a star count)"
+        return line
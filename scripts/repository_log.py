@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Append-Only Repository Log for Alot1z GitHub Repository Wiki System
+
+The primary repository store is a newline-delimited JSON snapshot plus an
+append-only change log. Each run appends only the records it added, changed
+or removed; reads stream the snapshot line by line and overlay the log, and
+compaction periodically folds the log into a fresh snapshot. The site's
+repositories.json is exported from the store on demand.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from classifier import CATEGORIES
+from repository_model import Repository
+from repository_store import repository_key
+
+
+class RepositoryLog:
+    def __init__(self, data_dir: str, compact_ratio: float = 0.5, min_compact_entries: int = 1000):
+        self.data_dir = Path(data_dir)
+        self.snapshot_file = self.data_dir / "repositories.snapshot.ndjson"
+        self.log_file = self.data_dir / "repositories.log.ndjson"
+        self.compact_ratio = compact_ratio
+        self.min_compact_entries = min_compact_entries
+
+    def exists(self) -> bool:
+        """Check whether the store has been initialised"""
+        return self.snapshot_file.exists() or self.log_file.exists()
+
+    def _read_lines(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """Stream JSON objects from an NDJSON file, skipping a torn last line"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-append leaves at most one partial line
+                        continue
+        except FileNotFoundError:
+            return
+
+    def _pending_changes(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fold the change log into key -> latest record (None when removed)"""
+        changes = {}
+        for entry in self._read_lines(self.log_file):
+            changes[entry['key']] = entry.get('record') if entry['op'] == 'upsert' else None
+        return changes
+
+    def iter_records(self) -> Iterator[Repository]:
+        """Yield the current repositories without loading the snapshot into memory"""
+        changes = self._pending_changes()
+        for record in self._read_lines(self.snapshot_file):
+            key = repository_key(record['url'])
+            if key in changes:
+                record = changes.pop(key)
+                if record is None:
+                    continue
+            yield Repository.from_dict(record)
+
+        for record in changes.values():
+            if record is not None:
+                yield Repository.from_dict(record)
+
+    def append(self, upserts: Iterable[Repository] = (), removals: Iterable[str] = ()) -> int:
+        """Append changed and removed repositories to the log"""
+        timestamp = datetime.now().isoformat()
+        lines = []
+        for repo in upserts:
+            lines.append({'op': 'upsert', 'key': repository_key(repo.url), 'at': timestamp, 'record': repo.to_dict()})
+        for url in removals:
+            lines.append({'op': 'remove', 'key': repository_key(url), 'at': timestamp})
+        if not lines:
+            return 0
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            for line in lines:
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        return len(lines)
+
+    def write_snapshot(self, repositories: Iterable[Repository]) -> int:
+        """Replace the snapshot with the given repositories and clear the log"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.snapshot_file.with_suffix('.ndjson.tmp')
+        count = 0
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            for repo in repositories:
+                f.write(json.dumps(repo.to_dict(), ensure_ascii=False) + '\n')
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.snapshot_file)
+        if self.log_file.exists():
+            self.log_file.unlink()
+        return count
+
+    def compact(self) -> int:
+        """Fold the change log into a fresh snapshot"""
+        return self.write_snapshot(self.iter_records())
+
+    def maybe_compact(self, total_records: int) -> bool:
+        """Compact once the log has grown large relative to the dataset"""
+        entries = sum(1 for _ in self._read_lines(self.log_file))
+        if entries < max(self.min_compact_entries, total_records * self.compact_ratio):
+            return False
+        self.compact()
+        return True
+
+    def import_json(self, json_file: str) -> int:
+        """Seed the store from a repositories.json in either historical layout"""
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return self.write_snapshot(self._records_from_json(data))
+
+    @staticmethod
+    def _records_from_json(data: Any) -> List[Repository]:
+        """Extract a flat, de-duplicated repository list from either layout"""
+        if isinstance(data, list):
+            records = data
+        elif data.get('repositories'):
+            records = data['repositories']
+        else:
+            records = []
+            for category in data.get('categories', {}).values():
+                records.extend(category.get('repositories', []) if isinstance(category, dict) else category)
+
+        unique = {}
+        for repo in records:
+            unique.setdefault(repository_key(repo['url']), repo)
+        return [Repository.from_dict(repo) for repo in unique.values()]
+
+    def export_json(self, json_file: str, categorize: Callable[[Repository], str],
+                    records: Optional[Iterable[Repository]] = None) -> int:
+        """Export the store, or records already loaded from it, as the repositories.json document the site reads"""
+        categories = {category: {**info, 'repositories': []} for category, info in CATEGORIES.items()}
+        repositories = []
+        for repo in (self.iter_records() if records is None else records):
+            record = repo.to_dict()
+            categories.get(categorize(repo), categories['utilities'])['repositories'].append(record)
+            repositories.append(record)
+
+        data = {
+            'total_repositories': len(repositories),
+            'last_updated': datetime.now().isoformat(),
+            'categories': {k: v for k, v in categories.items() if v['repositories']},
+            'repositories': repositories
+        }
+
+        json_file = Path(json_file)
+        json_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return len(repositories)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Repository Record Type for Alot1z GitHub Repository Wiki System
+
+A compact, slotted record used in place of per-repository dicts by the
+crawler, the auto-updater and their helpers. Low-cardinality strings
+(language, license, purpose, update date and tags) are interned so every
+record shares one copy, and tags are kept as a sorted tuple. Records
+convert losslessly to and from the repositories.json schema; unknown keys
+are carried through in ``extra``.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+from sys import intern
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+SCHEMA_FIELDS = ('name', 'url', 'description', 'language', 'license', 'last_updated',
+                 'stars', 'tags', 'purpose', 'quality_score')
+
+
+def intern_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Normalize tags into a sorted, de-duplicated tuple of interned strings"""
+    return tuple(sorted({intern(tag) for tag in tags}))
+
+
+class Repository:
+    __slots__ = SCHEMA_FIELDS + ('extra',)
+
+    def __init__(self, url: str, name: str, description: str = "", language: str = "Unknown",
+                 license: str = "Unknown", last_updated: str = "Unknown", stars: int = 0,
+                 tags: Iterable[str] = (), purpose: str = "", quality_score: float = 0.0,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.url = url
+        self.name = name
+        self.description = description
+        self.language = intern(language)
+        self.license = intern(license)
+        self.last_updated = intern(last_updated)
+        self.stars = stars
+        self.tags = intern_tags(tags)
+        self.purpose = intern(purpose)
+        self.quality_score = quality_score
+        self.extra = extra or None
+
+    def __repr__(self) -> str:
+        return f"Repository({self.url!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Repository):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    __hash__ = None
+
+    def set_tags(self, tags: Iterable[str]):
+        """Replace the tag set"""
+        self.tags = intern_tags(tags)
+
+    def set_purpose(self, purpose: str):
+        """Replace the purpose with its interned copy"""
+        self.purpose = intern(purpose)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Repository':
+        """Build a record from a repositories.json entry"""
+        extra = {key: value for key, value in data.items() if key not in SCHEMA_FIELDS}
+        return cls(
+            url=data['url'],
+            name=data.get('name', ''),
+            description=data.get('description') or "",
+            language=data.get('language') or "Unknown",
+            license=data.get('license') or "Unknown",
+            last_updated=data.get('last_updated') or "Unknown",
+            stars=data.get('stars') or 0,
+            tags=data.get('tags') or (),
+            purpose=data.get('purpose') or "",
+            quality_score=data.get('quality_score') or 0.0,
+            extra=extra
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to a repositories.json entry"""
+        data = {
+            'name': self.name,
+            'url': self.url,
+            'description': self.description,
+            'language': self.language,
+            'license': self.license,
+            'last_updated': self.last_updated,
+            'stars': self.stars,
+            'tags': list(self.tags),
+            'purpose': self.purpose,
+            'quality_score': self.quality_score
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Repository Source Backends for Alot1z GitHub Repository Wiki System
+
+Pluggable backends that list a user's repositories for the crawler and the
+auto-updater. The listing backend scrapes the github.com repositories tab
+(30 repositories per page of HTML). The REST backend reads the starred or
+owned repositories from the GitHub API 100 at a time. The GraphQL backend
+fetches stars, pushed_at, topics and license for 100 repositories in a
+single query. Every backend takes a base URL, so it can be pointed at a
+local server that replays recorded responses. Star listings from the API
+come newest first, so fetch_until() can stop at the first page that reaches
+stars the caller already knows. Sources set ordered_by_star_time to say
+whether their listing has that order. The repositories tab and the owned
+repositories listings do not, so new entries can turn up on any page.
+Callers must read every page of those listings. default_source() therefore
+reads the configured stars tab from the REST starred listing, which keeps
+the incremental path open without a token.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import json
+import os
+import time
+import requests
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from crawl_checkpoint import CrawlCheckpoint
+from fetch_engine import PageFetcher
+from listing_parser import parse_listing_chunks, parse_listing_page
+from repository_model import Repository
+from run_metrics import RunMetrics
+from wiki_settings import WikiSettings
+
+DEFAULT_BASE_URL = "https://github.com"
+DEFAULT_API_URL = "https://api.github.com"
+API_PAGE_SIZE = 100
+LISTINGS = ('starred', 'repos')
+
+GRAPHQL_REPOSITORY_FIELDS = """
+        name
+        url
+        description
+        stargazerCount
+        pushedAt
+        isFork
+        primaryLanguage { name }
+        licenseInfo { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+"""
+
+# Starred edges carry starredAt, which incremental syncs use as their high-water mark
+GRAPHQL_CONNECTIONS = {
+    'starred': 'starredRepositories(first: $first, after: $after, orderBy: {field: STARRED_AT, direction: DESC}) '
+               '{ pageInfo { hasNextPage endCursor } edges { starredAt node { %s } } }',
+    'repos': 'repositories(first: $first, after: $after, ownerAffiliations: OWNER, '
+             'orderBy: {field: PUSHED_AT, direction: DESC}) '
+             '{ pageInfo { hasNextPage endCursor } edges { node { %s } } }'
+}
+
+GRAPHQL_QUERY = """
+query($login: String!, $first: Int!, $after: String) {
+  user(login: $login) {
+    listing: %s
+  }
+}
+"""
+
+
+def starred_at(repo: Repository) -> Optional[str]:
+    """Return when a repository was starred, if the source reported it"""
+    return repo.extra.get('starred_at') if repo.extra else None
+
+
+def _api_extra(topics: List[str], fork: bool, starred: Optional[str]) -> Dict[str, Any]:
+    """Collect the API-only fields carried through in Repository.extra"""
+    extra = {'topics': topics, 'fork': fork}
+    if starred:
+        extra['starred_at'] = starred
+    return extra
+
+
+def repository_from_rest(item: Dict[str, Any]) -> Repository:
+    """Build a record from a REST API repository object or a starred-at wrapper"""
+    starred = item.get('starred_at')
+    if 'repo' in item:
+        item = item['repo']
+    return Repository(
+        url=item['html_url'],
+        name=item['name'],
+        description=item.get('description') or "",
+        language=item.get('language') or "Unknown",
+        license=(item.get('license') or {}).get('name') or "Unknown",
+        last_updated=item.get('pushed_at') or "Unknown",
+        stars=item.get('stargazers_count') or 0,
+        extra=_api_extra(item.get('topics') or [], bool(item.get('fork')), starred)
+    )
+
+
+def repository_from_graphql(edge: Dict[str, Any]) -> Repository:
+    """Build a record from a GraphQL repository edge"""
+    node = edge['node']
+    topics = [topic['topic']['name'] for topic in (node.get('repositoryTopics') or {}).get('nodes', [])]
+    return Repository(
+        url=node['url'],
+        name=node['name'],
+        description=node.get('description') or "",
+        language=(node.get('primaryLanguage') or {}).get('name') or "Unknown",
+        license=(node.get('licenseInfo') or {}).get('name') or "Unknown",
+        last_updated=node.get('pushedAt') or "Unknown",
+        stars=node.get('stargazerCount') or 0,
+        extra=_api_extra(topics, bool(node.get('isFork')), edge.get('starredAt'))
+    )
+
+
+class PagedSource:
+    name = "paged"
+    # Whether the listing is newest star first, which fetch_until's early stop relies on
+    ordered_by_star_time = False
+
+    def __init__(self, username: str, base_url: str):
+        self.username = username
+        self.base_url = base_url.rstrip('/')
+        self.metrics: Optional[RunMetrics] = None
+
+    @property
+    def crawl_key(self) -> str:
+        """Identify the listing so checkpoints are never mixed between sources"""
+        return self.url_for_page(0)
+
+    def configure(self, session: requests.Session):
+        """Set any headers the source needs on the shared session"""
+
+    def url_for_page(self, page: int) -> str:
+        """Return the URL of a numbered listing page"""
+        raise NotImplementedError
+
+    def parse(self, text: str) -> List[Repository]:
+        """Parse the records out of one listing page"""
+        raise NotImplementedError
+
+    def parse_chunks(self, chunks: Iterable[str]) -> List[Repository]:
+        """Parse a page as it streams in; sources without an incremental parser buffer it"""
+        return self.parse(''.join(chunks))
+
+    def _timed_parse(self):
+        """Time parsing when run metrics are attached"""
+        return self.metrics.stage('parse', per_thread=True) if self.metrics is not None else nullcontext()
+
+    def _count_page(self, records: List[Repository]):
+        """Count a parsed page when run metrics are attached"""
+        if self.metrics is not None:
+            self.metrics.count('pages')
+            self.metrics.count('repositories_listed', len(records))
+
+    def parse_page(self, chunks: Iterable[str]) -> List[Repository]:
+        """Parse one streamed page, recording parse time and counts when metrics are attached"""
+        # A streamed page is parsed while it downloads, so parse wall time includes network waits
+        with self._timed_parse():
+            records = self.parse_chunks(chunks)
+        self._count_page(records)
+        return records
+
+    def fetch_repositories(self, fetcher: PageFetcher, checkpoint: Optional[CrawlCheckpoint] = None,
+                           prepare: Optional[Callable[[List[Repository]], List[Repository]]] = None) -> List[Repository]:
+        """Fetch numbered pages concurrently until the first empty one"""
+        return fetcher.fetch_pages(self.url_for_page, self.parse_page, checkpoint, stream=True, prepare=prepare)
+
+    def fetch_until(self, fetcher: PageFetcher, caught_up: Callable[[List[Repository]], bool]) -> List[Repository]:
+        """Fetch pages in order, stopping after the first page the caller has caught up with"""
+        repositories = []
+        page = 1
+        while True:
+            records = fetcher.fetch_parsed(self.url_for_page(page), self.parse_page, stream=True)
+            repositories.extend(records)
+            if not records or caught_up(records):
+                print(f"📄 Caught up after {page} page(s)")
+                return repositories
+            page += 1
+
+
+class ListingPageSource(PagedSource):
+    name = "html"
+
+    def __init__(self, username: str, base_url: str = DEFAULT_BASE_URL):
+        super().__init__(username, base_url)
+
+    def url_for_page(self, page: int) -> str:
+        return f"{self.base_url}/{self.username}?page={page}&tab=repositories"
+
+    def parse(self, text: str) -> List[Repository]:
+        return parse_listing_page(text)
+
+    def parse_chunks(self, chunks: Iterable[str]) -> List[Repository]:
+        return parse_listing_chunks(chunks)
+
+
+class RestApiSource(PagedSource):
+    name = "rest"
+
+    def __init__(self, username: str, base_url: str = DEFAULT_API_URL, listing: str = "starred",
+                 token: Optional[str] = None):
+        super().__init__(username, base_url)
+        if listing not in LISTINGS:
+            raise ValueError(f"Unknown listing {listing!r}; expected one of {LISTINGS}")
+        self.listing = listing
+        self.ordered_by_star_time = listing == 'starred'
+        self.token = token if token is not None else os.environ.get('GITHUB_TOKEN')
+
+    def configure(self, session: requests.Session):
+        # The star media type wraps each starred repository with its starred_at time
+        session.headers['Accept'] = ('application/vnd.github.star+json' if self.listing == 'starred'
+                                     else 'application/vnd.github+json')
+        session.headers['X-GitHub-Api-Version'] = '2022-11-28'
+        if self.token:
+            session.headers['Authorization'] = f"Bearer {self.token}"
+
+    def url_for_page(self, page: int) -> str:
+        if self.listing == 'starred':
+            return f"{self.base_url}/users/{self.username}/starred?per_page={API_PAGE_SIZE}&page={page}"
+        return f"{self.base_url}/users/{self.username}/repos?type=owner&per_page={API_PAGE_SIZE}&page={page}"
+
+    def parse(self, text: str) -> List[Repository]:
+        return [repository_from_rest(item) for item in json.loads(text)]
+
+
+class GraphQLSource(RestApiSource):
+    name = "graphql"
+
+    @property
+    def crawl_key(self) -> str:
+        return f"{self.base_url}/graphql#{self.username}/{self.listing}"
+
+    def configure(self, session: requests.Session):
+        super().configure(session)
+        if not self.token:
+            print("⚠️ The GraphQL API needs a token; set GITHUB_TOKEN")
+
+    def fetch_page(self, fetcher: PageFetcher, after: Optional[str]) -> Tuple[List[Repository], Dict[str, Any]]:
+        """Run the listing query for the page that follows a cursor"""
+        connection = GRAPHQL_CONNECTIONS[self.listing] % GRAPHQL_REPOSITORY_FIELDS
+        body = {
+            'query': GRAPHQL_QUERY % connection,
+            'variables': {'login': self.username, 'first': API_PAGE_SIZE, 'after': after}
+        }
+        data = fetcher.request('POST', f"{self.base_url}/graphql", json_body=body).json()
+        if data.get('errors'):
+            raise requests.exceptions.RequestException(
+                '; '.join(error.get('message', 'GraphQL error') for error in data['errors']))
+        user = (data.get('data') or {}).get('user')
+        if user is None:
+            raise requests.exceptions.RequestException(f"GitHub user {self.username!r} not found")
+        listing = user['listing']
+        with self._timed_parse():
+            records = [repository_from_graphql(edge) for edge in listing['edges']]
+        self._count_page(records)
+        return records, listing['pageInfo']
+
+    def _fetch_page_with_retries(self, fetcher: PageFetcher, page: int,
+                                 after: Optional[str]) -> Optional[Tuple[List[Repository], Dict[str, Any]]]:
+        """Fetch one cursor page, backing off between failed attempts"""
+        for attempt in range(fetcher.max_retries + 1):
+            try:
+                return self.fetch_page(fetcher, after)
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Error fetching page {page}: {e}")
+                if attempt < fetcher.max_retries:
+                    time.sleep(fetcher.retry_backoff * (2 ** attempt))
+        return None
+
+    def fetch_repositories(self, fetcher: PageFetcher, checkpoint: Optional[CrawlCheckpoint] = None,
+                           prepare: Optional[Callable[[List[Repository]], List[Repository]]] = None) -> List[Repository]:
+        """Follow the cursor page by page, resuming after the last recorded cursor"""
+        if checkpoint is None:
+            checkpoint = CrawlCheckpoint()
+
+        page = max(checkpoint.pages, default=0) + 1
+        after = checkpoint.cursors.get(page - 1)
+        while checkpoint.end_page is None:
+            result = self._fetch_page_with_retries(fetcher, page, after)
+            if result is None:
+                # Cursors only lead forward, so stop here; a rerun resumes from this page
+                checkpoint.mark_failed(page)
+                break
+
+            records, info = result
+            if not records:
+                checkpoint.mark_end(page)
+                break
+            if prepare is not None:
+                records = prepare(records)
+
+            print(f"📄 Fetched page {page} ({len(records)} repositories)")
+            checkpoint.mark_done(page, records, cursor=info['endCursor'])
+            if not info['hasNextPage']:
+                checkpoint.mark_end(page + 1)
+                break
+            page += 1
+            after = info['endCursor']
+
+        return checkpoint.records()
+
+    def fetch_until(self, fetcher: PageFetcher, caught_up: Callable[[List[Repository]], bool]) -> List[Repository]:
+        """Follow the cursor, stopping after the first page the caller has caught up with"""
+        repositories = []
+        page = 1
+        after = None
+        while True:
+            result = self._fetch_page_with_retries(fetcher, page, after)
+            if result is None:
+                raise requests.exceptions.RequestException(f"Could not fetch page {page} of the listing")
+            records, info = result
+            repositories.extend(records)
+            if not records or caught_up(records) or not info['hasNextPage']:
+                print(f"📄 Caught up after {page} page(s)")
+                return repositories
+            page += 1
+            after = info['endCursor']
+
+
+SOURCES = {source.name: source for source in (ListingPageSource, RestApiSource, GraphQLSource)}
+
+
+def default_source(settings: WikiSettings) -> str:
+    """Name the backend for the configured profile tab when GITHUB_SOURCE does not pick one"""
+    # The stars tab paginates by cursor and carries no star times; the API listing has both
+    return 'rest' if settings.repository_tab == 'stars' else 'html'
+
+
+def create_source(kind: str, username: str, base_url: Optional[str] = None, **options: Any) -> PagedSource:
+    """Build a source backend by name: 'html', 'rest' or 'graphql'"""
+    try:
+        source_class = SOURCES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown source {kind!r}; expected one of {sorted(SOURCES)}")
+    if base_url is None:
+        base_url = DEFAULT_BASE_URL if source_class is ListingPageSource else DEFAULT_API_URL
+    return source_class(username, base_url, **options)
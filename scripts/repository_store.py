@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+URL-Indexed Repository Store for Alot1z GitHub Repository Wiki System
+
+Keeps repositories in a dict keyed by a stable "owner/name" key so lookups,
+upserts and removals are O(1), and diffs a fresh crawl against the store in
+a single pass, reporting which fields changed on each record.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from repository_model import Repository
+
+SIGNIFICANT_FIELDS = ('description', 'language', 'stars')
+
+
+def repository_key(url: str) -> str:
+    """Return the stable lowercase 'owner/name' key for a repository URL"""
+    if '://' in url:
+        # Drop the scheme and host without the cost of a full urlparse
+        url = url.split('://', 1)[1].partition('/')[2]
+    return url.strip('/').lower()
+
+
+def changed_fields(current: Repository, existing: Repository,
+                   fields: Tuple[str, ...] = SIGNIFICANT_FIELDS) -> List[str]:
+    """List the fields whose values differ between two copies of a repository"""
+    return [field for field in fields if getattr(current, field) != getattr(existing, field)]
+
+
+class RepositoryDiff:
+    def __init__(self):
+        self.added: List[Repository] = []
+        self.removed: List[Repository] = []
+        self.changed: List[Tuple[Repository, List[str]]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class RepositoryStore:
+    def __init__(self, repositories: Iterable[Repository] = ()):
+        self._records: Dict[str, Repository] = {}
+        for repo in repositories:
+            self.upsert(repo)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Repository]:
+        return iter(self._records.values())
+
+    def __contains__(self, url: str) -> bool:
+        return repository_key(url) in self._records
+
+    def get(self, url: str) -> Optional[Repository]:
+        """Look up a repository by URL or key"""
+        return self._records.get(repository_key(url))
+
+    def upsert(self, repo: Repository) -> None:
+        """Add a repository or replace the stored copy in place"""
+        self._records[repository_key(repo.url)] = repo
+
+    def remove(self, url: str) -> Optional[Repository]:
+        """Remove a repository, returning the stored copy if there was one"""
+        return self._records.pop(repository_key(url), None)
+
+    def records(self) -> List[Repository]:
+        """Return all repositories in insertion order"""
+        return list(self._records.values())
+
+    def diff(self, current: Iterable[Repository],
+             fields: Tuple[str, ...] = SIGNIFICANT_FIELDS) -> RepositoryDiff:
+        """Diff a fresh crawl against the store in one pass over each side"""
+        result = RepositoryDiff()
+        seen = set()
+
+        for repo in current:
+            key = repository_key(repo.url)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            existing = self._records.get(key)
+            if existing is None:
+                result.added.append(repo)
+                continue
+
+            fields_changed = changed_fields(repo, existing, fields)
+            if fields_changed:
+                result.changed.append((repo, fields_changed))
+
+        for key, repo in self._records.items():
+            if key not in seen:
+                result.removed.append(repo)
+
+        return result
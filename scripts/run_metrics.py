@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Run Metrics and Profiling for Alot1z GitHub Repository Wiki System
+
+Records wall and CPU time for every stage of a crawler or updater run
+(fetch, parse, classify, score, diff, render, write), along with counters
+such as pages, repositories and bytes, and the hit/miss statistics of the
+caches involved. Each run is appended to a JSON metrics file that keeps a
+rolling history, so a slow day can be compared stage by stage with the days
+before it. An optional profiler captures the hot path: cProfile for the
+main thread, or a sampling profiler that sees the worker threads too.
+
+Usage:
+    python scripts/run_metrics.py data/run_metrics.json
+    python scripts/run_metrics.py data/run_metrics.json --compare 7
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_HISTORY = 60
+PROFILE_MODES = ('cprofile', 'sample')
+SAMPLE_INTERVAL = 0.005
+
+
+class RunMetrics:
+    def __init__(self, run: str, metrics_file: Optional[str] = None, history: int = DEFAULT_HISTORY):
+        self.run = run
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.history = history
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.started_at = datetime.now().isoformat()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, per_thread: bool = False) -> Iterator[None]:
+        """Time a stage; repeated entries accumulate.
+
+        Stages entered from worker threads should pass ``per_thread`` so CPU
+        time is that of the calling thread rather than of the whole process.
+        """
+        cpu_clock = time.thread_time if per_thread else time.process_time
+        wall_start = time.perf_counter()
+        cpu_start = cpu_clock()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = cpu_clock() - cpu_start
+            with self._lock:
+                entry = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                entry['calls'] += 1
+                entry['wall_seconds'] += wall
+                entry['cpu_seconds'] += cpu
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a run counter"""
+        with self._lock:
+            self.counters[name] += amount
+
+    def record(self, component: str, stats: Dict[str, Any]):
+        """Attach a component's statistics, such as a cache's hits and misses"""
+        with self._lock:
+            self.components[component] = dict(stats)
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the run so far"""
+        with self._lock:
+            stages = {name: {'calls': entry['calls'],
+                             'wall_seconds': round(entry['wall_seconds'], 4),
+                             'cpu_seconds': round(entry['cpu_seconds'], 4)}
+                      for name, entry in self.stages.items()}
+            summary = {
+                'run': self.run,
+                'started_at': self.started_at,
+                'finished_at': datetime.now().isoformat(),
+                'wall_seconds': round(time.perf_counter() - self._wall_start, 4),
+                'cpu_seconds': round(time.process_time() - self._cpu_start, 4),
+                'stages': stages,
+                'counters': dict(self.counters),
+                'components': dict(self.components)
+            }
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux and bytes on macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            summary['peak_memory_kb'] = peak // 1024 if sys.platform == 'darwin' else peak
+        return summary
+
+    def save(self) -> Dict[str, Any]:
+        """Append this run to the metrics file and print a stage breakdown"""
+        summary = self.summary()
+        if self.metrics_file is not None:
+            runs = load_runs(self.metrics_file)
+            runs.append(summary)
+            self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.metrics_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'runs': runs[-self.history:]}, indent=2, ensure_ascii=False))
+        print(format_summary(summary))
+        return summary
+
+
+def load_runs(metrics_file: Path) -> List[Dict[str, Any]]:
+    """Load the recorded run history"""
+    try:
+        with open(metrics_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get('runs', [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Render a run's stage breakdown as a small table"""
+    lines = [f"⏱️ {summary['run']} run: {summary['wall_seconds']:.2f}s wall, {summary['cpu_seconds']:.2f}s CPU"]
+    total = summary['wall_seconds'] or 1.0
+    for name, entry in sorted(summary['stages'].items(), key=lambda item: -item[1]['wall_seconds']):
+        lines.append(f"   {name:<10} {entry['wall_seconds']:>9.3f}s wall {entry['cpu_seconds']:>9.3f}s CPU "
+                     f"{100 * entry['wall_seconds'] / total:>5.1f}%  ({entry['calls']} calls)")
+    if summary['counters']:
+        lines.append('   ' + ', '.join(f"{name}={value}" for name, value in sorted(summary['counters'].items())))
+    return '\n'.join(lines)
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        """Start sampling every thread in the background"""
+        self._thread = threading.Thread(target=self._sample, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling"""
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, output: Path):
+        """Write folded stacks, the input format of flame graph tools"""
+        with open(output, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top_frames(self, limit: int = 15) -> List[tuple]:
+        """Return the innermost frames that were running most often"""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+@contextmanager
+def profiled(mode: Optional[str], output_prefix: str) -> Iterator[None]:
+    """Profile the enclosed block with cProfile or the sampling profiler, if a mode is given"""
+    if mode is None:
+        yield
+        return
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode {mode!r}; expected one of {PROFILE_MODES}")
+
+    output_prefix = Path(output_prefix)
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    if mode == 'cprofile':
+        # cProfile only sees the thread that enabled it; use 'sample' to include worker threads
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            output = output_prefix.with_suffix('.prof')
+            profiler.dump_stats(output)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(20)
+            print(report.getvalue())
+            print(f"🔬 Saved cProfile data to {output} (open with: python -m pstats {output})")
+        return
+
+    sampler = SamplingProfiler()
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        output = output_prefix.with_suffix('.folded')
+        sampler.write(output)
+        print(f"🔬 {sampler.samples} samples; busiest frames:")
+        for frame, count in sampler.top_frames():
+            print(f"   {count:>6}  {frame}")
+        print(f"🔬 Saved folded stacks to {output} (render with flamegraph.pl or speedscope)")
+
+
+def main():
+    """Show the latest run, or compare it stage by stage with earlier runs"""
+    parser = argparse.ArgumentParser(description="Show recorded run metrics")
+    parser.add_argument('metrics_file', nargs='?', default='data/run_metrics.json')
+    parser.add_argument('--run', help="only consider runs of this kind (crawler or updater)")
+    parser.add_argument('--compare', type=int, default=0, metavar='N',
+                        help="compare the latest run with the median of the N runs before it")
+    args = parser.parse_args()
+
+    runs = [run for run in load_runs(Path(args.metrics_file)) if args.run is None or run['run'] == args.run]
+    if not runs:
+        print(f"⚠️ No runs recorded in {args.metrics_file}")
+        return
+    latest = runs[-1]
+    print(format_summary(latest))
+
+    baseline = runs[-args.compare - 1:-1] if args.compare else []
+    if not baseline:
+        return
+    print(f"📈 Compared with the median of the previous {len(baseline)} runs:")
+    for name, entry in sorted(latest['stages'].items(), key=lambda item: -item[1]['wall_seconds']):
+        previous = sorted(run['stages'][name]['wall_seconds'] for run in baseline if name in run['stages'])
+        if not previous:
+            continue
+        median = previous[len(previous) // 2]
+        change = (entry['wall_seconds'] - median) / median * 100 if median else 0.0
+        marker = '🔺' if change > 25 else '  '
+        print(f"   {marker} {name:<10} {entry['wall_seconds']:>9.3f}s vs {median:.3f}s ({change:+.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
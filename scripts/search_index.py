@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Sharded Search Index Builder for Alot1z GitHub Repository Wiki System
+
+Builds a compact inverted index over repository names, descriptions, tags,
+languages, purposes and categories for the site's search page. Terms are
+weighted by the field they occur in and split into small shards by their
+first two characters, so a query downloads the manifest and one shard.
+Prefix matches are a scan of that shard's sorted terms. Display rows live
+in separate document shards. Rebuilds are incremental: only repositories
+whose indexed fields changed are re-tokenized, and only the shards they
+touch are rewritten.
+
+Usage:
+    python scripts/search_index.py --data-dir data --output static/search-index
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from classifier import RepositoryClassifier
+from render_manifest import write_if_changed
+from repository_log import RepositoryLog
+from repository_model import Repository
+from repository_store import repository_key
+
+INDEX_VERSION = 1
+FIELD_WEIGHTS = {'name': 5, 'tags': 3, 'language': 2, 'category': 2, 'purpose': 1, 'description': 1}
+DOCS_PER_SHARD = 500
+MAX_DESCRIPTION = 200
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def shard_name(term: str) -> str:
+    """Name the shard holding a term after its first two characters"""
+    prefix = term[:2]
+    return prefix if prefix.isascii() else 'x' + prefix.encode('utf-8').hex()
+
+
+def _dump(value: Any) -> str:
+    """Serialize a shard compactly and deterministically"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+class SearchIndexBuilder:
+    def __init__(self, output_dir: str, state_file: str):
+        self.output_dir = Path(output_dir)
+        self.state_file = Path(state_file)
+        self.state = self._load_state()
+
+    def _empty_state(self) -> Dict[str, Any]:
+        """Return the state of an index with no documents"""
+        return {'version': INDEX_VERSION, 'next_id': 0, 'free_ids': [], 'docs': {}, 'shards': {}}
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the per-repository index state, starting over on a version change"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._empty_state()
+        return state if state.get('version') == INDEX_VERSION else self._empty_state()
+
+    def _allocate_id(self) -> int:
+        """Reuse a freed document id, or hand out the next one"""
+        if self.state['free_ids']:
+            return self.state['free_ids'].pop()
+        doc_id = self.state['next_id']
+        self.state['next_id'] += 1
+        return doc_id
+
+    @staticmethod
+    def index_terms(repo: Repository, category: str) -> Dict[str, int]:
+        """Weight every term of a repository by the fields it appears in"""
+        fields = {
+            'name': repo.name,
+            'tags': ' '.join(repo.tags),
+            'language': repo.language if repo.language != 'Unknown' else '',
+            'category': category,
+            'purpose': repo.purpose,
+            'description': repo.description
+        }
+        terms = defaultdict(int)
+        for field, text in fields.items():
+            for token in tokenize(text):
+                terms[token] += FIELD_WEIGHTS[field]
+        return dict(terms)
+
+    @staticmethod
+    def document_row(repo: Repository, category: str) -> List[Any]:
+        """The fields the search page displays for a hit"""
+        return [repo.name, repo.url, repo.description[:MAX_DESCRIPTION], repo.language, repo.stars, category]
+
+    def _read_shard(self, path: Path) -> Dict[str, Any]:
+        """Load a shard file, treating a missing or torn one as empty"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def build(self, repositories: Iterable[Repository], categorize: Callable[[Repository], str]) -> Dict[str, int]:
+        """Bring the index up to date with the given repositories"""
+        full_rebuild = not self.state['docs']
+        docs = self.state['docs']
+        changes = {}
+        rows = {}
+        seen = set()
+
+        for repo in repositories:
+            key = repository_key(repo.url)
+            seen.add(key)
+            category = categorize(repo)
+            row = self.document_row(repo, category)
+            digest = hashlib.blake2b(repr((row, repo.tags, repo.purpose)).encode('utf-8'),
+                                     digest_size=12).hexdigest()
+            entry = docs.get(key)
+            if entry is not None and entry['hash'] == digest:
+                continue
+
+            doc_id = entry['id'] if entry is not None else self._allocate_id()
+            terms = self.index_terms(repo, category)
+            changes[doc_id] = (entry['terms'] if entry is not None else {}, terms)
+            rows[doc_id] = row
+            docs[key] = {'id': doc_id, 'hash': digest, 'terms': terms}
+
+        for key in [key for key in docs if key not in seen]:
+            entry = docs.pop(key)
+            changes[entry['id']] = (entry['terms'], {})
+            rows[entry['id']] = None
+            self.state['free_ids'].append(entry['id'])
+
+        written = self._update_term_shards(changes, full_rebuild)
+        written += self._update_doc_shards(rows, full_rebuild)
+        if full_rebuild:
+            written += self._remove_stale_shards()
+        written += self._write_manifest()
+        write_if_changed(self.state_file, json.dumps(self.state, ensure_ascii=False, separators=(',', ':')))
+        return {'documents': len(docs), 'reindexed': len(changes), 'files_written': written}
+
+    def _update_term_shards(self, changes: Dict[int, tuple], full_rebuild: bool) -> int:
+        """Patch the postings of every shard a changed repository touches"""
+        by_shard = defaultdict(dict)
+        for doc_id, (old_terms, new_terms) in changes.items():
+            for term in old_terms.keys() | new_terms.keys():
+                by_shard[shard_name(term)].setdefault(term, []).append((doc_id, new_terms.get(term)))
+
+        written = 0
+        for shard, term_changes in by_shard.items():
+            path = self.output_dir / f"terms-{shard}.json"
+            # Postings are stored as flat [id, weight, ...] lists, best match first
+            postings = {} if full_rebuild else {
+                term: dict(zip(flat[::2], flat[1::2])) for term, flat in self._read_shard(path).items()
+            }
+            for term, updates in term_changes.items():
+                entries = postings.setdefault(term, {})
+                for doc_id, weight in updates:
+                    if weight is None:
+                        entries.pop(doc_id, None)
+                    else:
+                        entries[doc_id] = weight
+                if not entries:
+                    del postings[term]
+
+            if not postings:
+                self.state['shards'].pop(shard, None)
+                if path.exists():
+                    path.unlink()
+                    written += 1
+                continue
+
+            shard_data = {}
+            for term, entries in postings.items():
+                ranked = sorted(entries.items(), key=lambda item: (-item[1], item[0]))
+                shard_data[term] = [value for pair in ranked for value in pair]
+            self.state['shards'][shard] = len(shard_data)
+            written += write_if_changed(path, _dump(shard_data))
+        return written
+
+    def _update_doc_shards(self, rows: Dict[int, Optional[List[Any]]], full_rebuild: bool) -> int:
+        """Patch the display rows of changed documents"""
+        by_shard = defaultdict(dict)
+        for doc_id, row in rows.items():
+            by_shard[doc_id // DOCS_PER_SHARD][str(doc_id)] = row
+
+        written = 0
+        for shard, shard_rows in by_shard.items():
+            path = self.output_dir / f"docs-{shard}.json"
+            documents = {} if full_rebuild else self._read_shard(path)
+            for doc_id, row in shard_rows.items():
+                if row is None:
+                    documents.pop(doc_id, None)
+                else:
+                    documents[doc_id] = row
+            if documents:
+                written += write_if_changed(path, _dump(documents))
+            elif path.exists():
+                path.unlink()
+                written += 1
+        return written
+
+    def _remove_stale_shards(self) -> int:
+        """Delete shard files left over from an index whose state was lost"""
+        live = {f"terms-{shard}.json" for shard in self.state['shards']}
+        live.update(f"docs-{entry['id'] // DOCS_PER_SHARD}.json" for entry in self.state['docs'].values())
+        stale = [path for pattern in ('terms-*.json', 'docs-*.json')
+                 for path in self.output_dir.glob(pattern) if path.name not in live]
+        for path in stale:
+            path.unlink()
+        return len(stale)
+
+    def _write_manifest(self) -> int:
+        """Write the small entry point a client loads first"""
+        doc_shards = sorted({entry['id'] // DOCS_PER_SHARD for entry in self.state['docs'].values()})
+        manifest = {
+            'version': INDEX_VERSION,
+            'total_repositories': len(self.state['docs']),
+            'field_weights': FIELD_WEIGHTS,
+            'docs_per_shard': DOCS_PER_SHARD,
+            'doc_shards': doc_shards,
+            'term_shards': self.state['shards']
+        }
+        return int(write_if_changed(self.output_dir / "manifest.json", json.dumps(manifest, indent=2, sort_keys=True)))
+
+
+def main():
+    """Build or refresh the search index from the repository store"""
+    parser = argparse.ArgumentParser(description="Build the sharded search index")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--output', default='static/search-index')
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    log = RepositoryLog(data_dir)
+    if not log.exists():
+        log.import_json(data_dir / "repositories.json")
+
+    classifier = RepositoryClassifier()
+    builder = SearchIndexBuilder(args.output, data_dir / "search_index_state.json")
+    stats = builder.build(log.iter_records(), lambda repo: classifier.classify(repo).category)
+    print(f"🔍 Indexed {stats['documents']} repositories "
+          f"({stats['reindexed']} re-indexed, {stats['files_written']} files written)")
+
+
+if __name__ == "__main__":
+    main()
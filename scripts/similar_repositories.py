@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Similar Repositories Index for Alot1z GitHub Repository Wiki System
+
+Precomputes the top-k most similar repositories of every repository for
+the wiki's category pages and the site. Each repository becomes a sparse
+TF-IDF vector over hashed tokens of its name, description, tags, language
+and category, and similarity is the cosine between vectors. Neighbours are
+found through an inverted index: candidates come from the postings of the
+rarer features a repository has, and only those candidates are scored
+exactly. No pass over all pairs is ever made.
+
+Updates are incremental. IDF weights are frozen when the index is built and
+only refreshed once the collection has grown or shrunk by half, so vectors
+of unchanged repositories stay valid. A run recomputes the lists of added
+and changed repositories, inserts them into the lists of their neighbours
+where they displace a weaker entry, and fully recomputes only the lists
+that named a removed or changed repository. Lists are written to small
+JSON shards keyed by a hash of the repository key, and only shards whose
+lists changed are rewritten.
+
+Usage:
+    python scripts/similar_repositories.py --data-dir data --output static/similar
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import zlib
+from collections import defaultdict
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from classifier import RepositoryClassifier
+from render_manifest import write_if_changed
+from repository_log import RepositoryLog
+from repository_model import Repository
+from repository_store import repository_key
+from search_index import tokenize
+
+INDEX_VERSION = 2
+DEFAULT_NEIGHBOURS = 5
+FIELD_WEIGHTS = {'name': 3, 'tags': 2, 'category': 2, 'language': 1, 'description': 1}
+FEATURE_BITS = 20
+# Features shared by more repositories than this are too common to propose candidates,
+# though they still count towards the exact similarity of the candidates found
+MAX_CANDIDATE_POSTINGS = 150
+CANDIDATES = 50
+MIN_SIMILARITY = 0.05
+# Refresh the frozen IDF weights once the collection size drifts this far from when they were computed
+IDF_REFRESH_DRIFT = 0.5
+
+
+def feature_id(token: str) -> int:
+    """Hash a token into the feature space; crc32 is stable across runs, unlike hash()"""
+    return zlib.crc32(token.encode('utf-8')) & ((1 << FEATURE_BITS) - 1)
+
+
+def list_shard(key: str) -> str:
+    """Name the shard holding a repository's list after the first two hex digits of its key's SHA-256.
+
+    Hashing the whole key spreads one owner's repositories over all 256
+    shards. The site finds a list with the same digest from crypto.subtle.
+    """
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:2]
+
+
+class SimilarityIndex:
+    def __init__(self, output_dir: str, state_file: str, neighbours: int = DEFAULT_NEIGHBOURS):
+        self.output_dir = Path(output_dir)
+        self.state_file = Path(state_file)
+        self.neighbours = neighbours
+        self.state = self._load_state()
+        # Vectors and postings are derived from the state and kept warm between builds
+        self._vectors: Optional[Dict[str, Dict[int, float]]] = None
+        self._postings: Dict[int, Set[str]] = defaultdict(set)
+        self._listed_by: Dict[str, Set[str]] = defaultdict(set)
+
+    def _empty_state(self) -> Dict[str, Any]:
+        """Return the state of an index with no repositories"""
+        return {'version': INDEX_VERSION, 'neighbours': self.neighbours, 'idf': {}, 'idf_default': 1.0,
+                'idf_documents': 0, 'docs': {}}
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the per-repository state, starting over on a version or list length change"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._empty_state()
+        if state.get('version') != INDEX_VERSION or state.get('neighbours') != self.neighbours:
+            return self._empty_state()
+        return state
+
+    @staticmethod
+    def term_frequencies(repo: Repository, category: str) -> Dict[int, int]:
+        """Weight every hashed token of a repository by the fields it appears in"""
+        fields = {
+            'name': repo.name,
+            'tags': ' '.join(repo.tags),
+            'category': category,
+            'language': repo.language if repo.language != 'Unknown' else '',
+            'description': repo.description
+        }
+        frequencies = defaultdict(int)
+        for field, text in fields.items():
+            for token in tokenize(text):
+                frequencies[feature_id(token)] += FIELD_WEIGHTS[field]
+        return dict(frequencies)
+
+    def _vector(self, frequencies: Dict[str, int]) -> Dict[int, float]:
+        """Turn stored term frequencies into an L2-normalized TF-IDF vector"""
+        idf = self.state['idf']
+        default = self.state['idf_default']
+        vector = {int(feature): (1.0 + math.log(count)) * idf.get(feature, default)
+                  for feature, count in frequencies.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        return {feature: weight / norm for feature, weight in vector.items()}
+
+    def _refresh_idf(self):
+        """Recompute the IDF weights from the current collection"""
+        docs = self.state['docs']
+        frequencies = defaultdict(int)
+        for entry in docs.values():
+            for feature in entry['tf']:
+                frequencies[feature] += 1
+        total = len(docs)
+        self.state['idf'] = {feature: math.log((1 + total) / (1 + count)) + 1.0
+                             for feature, count in frequencies.items()}
+        self.state['idf_default'] = math.log(1 + total) + 1.0
+        self.state['idf_documents'] = total
+
+    def _load_vectors(self):
+        """Derive every vector, the postings and the reverse neighbour map from the state"""
+        self._vectors = {}
+        self._postings = defaultdict(set)
+        self._listed_by = defaultdict(set)
+        for key, entry in self.state['docs'].items():
+            self._add_vector(key, entry['tf'])
+            for neighbour, _ in entry['neighbours']:
+                self._listed_by[neighbour].add(key)
+
+    def _add_vector(self, key: str, frequencies: Dict[str, int]):
+        """Index a repository's vector"""
+        vector = self._vector(frequencies)
+        self._vectors[key] = vector
+        for feature in vector:
+            self._postings[feature].add(key)
+
+    def _remove_vector(self, key: str):
+        """Drop a repository's vector from the postings"""
+        for feature in self._vectors.pop(key, {}):
+            posting = self._postings[feature]
+            posting.discard(key)
+            if not posting:
+                del self._postings[feature]
+
+    def _set_neighbours(self, key: str, neighbours: List[List[Any]]):
+        """Replace a repository's list, keeping the reverse map in step"""
+        entry = self.state['docs'][key]
+        for neighbour, _ in entry['neighbours']:
+            self._listed_by[neighbour].discard(key)
+        for neighbour, _ in neighbours:
+            self._listed_by[neighbour].add(key)
+        entry['neighbours'] = neighbours
+
+    def _candidates(self, key: str) -> List[Tuple[str, float]]:
+        """Find the repositories sharing the rarer features of a repository, with their exact similarity"""
+        vector = self._vectors[key]
+        scores = defaultdict(float)
+        common = []
+        for feature, weight in vector.items():
+            posting = self._postings[feature]
+            if len(posting) > MAX_CANDIDATE_POSTINGS:
+                common.append(feature)
+                continue
+            for other in posting:
+                scores[other] += weight * self._vectors[other][feature]
+        scores.pop(key, None)
+
+        # A repository described only by common words still needs some candidates
+        common.sort(key=lambda feature: len(self._postings[feature]))
+        while common and len(scores) <= self.neighbours:
+            feature = common.pop(0)
+            for other in self._postings[feature]:
+                if other != key:
+                    scores[other] += vector[feature] * self._vectors[other][feature]
+
+        # Common features do not propose candidates but still count towards the shortlist's similarity
+        shortlist = heapq.nlargest(CANDIDATES, scores.items(), key=itemgetter(1))
+        return [(other, score + sum(vector[feature] * self._vectors[other].get(feature, 0.0) for feature in common))
+                for other, score in shortlist]
+
+    def _top(self, scored: Iterable[Tuple[str, float]]) -> List[List[Any]]:
+        """Keep the best neighbours, breaking ties by key so lists are stable"""
+        ranked = sorted(((round(score, 4), other) for other, score in scored if score >= MIN_SIMILARITY),
+                        key=lambda item: (-item[0], item[1]))
+        return [[other, score] for score, other in ranked[:self.neighbours]]
+
+    def neighbours_of(self, url: str) -> List[Tuple[str, float]]:
+        """Return the precomputed (key, similarity) neighbours of a repository"""
+        entry = self.state['docs'].get(repository_key(url))
+        return [tuple(pair) for pair in entry['neighbours']] if entry else []
+
+    def build(self, repositories: Iterable[Repository], categorize: Callable[[Repository], str]) -> Dict[str, int]:
+        """Bring the neighbour lists up to date with the given repositories"""
+        docs = self.state['docs']
+        changed = []
+        seen = set()
+        for repo in repositories:
+            key = repository_key(repo.url)
+            seen.add(key)
+            category = categorize(repo)
+            digest = hashlib.blake2b(repr((repo.name, repo.description, repo.tags, repo.language, category)).encode('utf-8'),
+                                     digest_size=12).hexdigest()
+            entry = docs.get(key)
+            if entry is not None and entry['hash'] == digest:
+                continue
+            frequencies = {str(feature): count for feature, count in self.term_frequencies(repo, category).items()}
+            if entry is None:
+                docs[key] = entry = {'hash': digest, 'tf': frequencies, 'neighbours': []}
+            else:
+                entry.update(hash=digest, tf=frequencies)
+            changed.append(key)
+        removed = [key for key in docs if key not in seen]
+        changed_keys = set(changed)
+
+        drift = abs(len(seen) - self.state['idf_documents']) / max(self.state['idf_documents'], 1)
+        full_rebuild = self.state['idf_documents'] == 0 or drift >= IDF_REFRESH_DRIFT
+        removed_lists = {key: docs.pop(key)['neighbours'] for key in removed}
+
+        touched: Set[str] = set()
+        if full_rebuild:
+            self._refresh_idf()
+            self._load_vectors()
+            dirty = set(docs)
+        else:
+            if self._vectors is None:
+                self._load_vectors()
+            # Lists naming a removed or changed repository may now hold the wrong members
+            stale = set()
+            for key, neighbours in removed_lists.items():
+                self._remove_vector(key)
+                stale.update(self._listed_by.pop(key, ()))
+                for neighbour, _ in neighbours:
+                    self._listed_by[neighbour].discard(key)
+            for key in changed:
+                self._remove_vector(key)
+                stale.update(self._listed_by.get(key, ()))
+                self._add_vector(key, docs[key]['tf'])
+            dirty = changed_keys | (stale & docs.keys())
+
+        displaced = 0
+        for key in sorted(dirty):
+            scored = self._candidates(key)
+            neighbours = self._top(scored)
+            if neighbours != docs[key]['neighbours']:
+                self._set_neighbours(key, neighbours)
+                touched.add(key)
+            if full_rebuild or key not in changed_keys:
+                continue
+            # A new or changed repository joins the lists it now outranks
+            for other, score in scored:
+                if other in dirty or score < MIN_SIMILARITY:
+                    continue
+                current = docs[other]['neighbours']
+                merged = self._top([(name, value) for name, value in current if name != key] + [(key, score)])
+                if merged != current:
+                    self._set_neighbours(other, merged)
+                    touched.add(other)
+                    displaced += 1
+
+        written = self._write_shards(touched | removed_lists.keys(), full_rebuild)
+        write_if_changed(self.state_file, json.dumps(self.state, ensure_ascii=False, separators=(',', ':')))
+        return {'documents': len(docs), 'recomputed': len(dirty), 'displaced': displaced,
+                'files_written': written, 'full_rebuild': int(full_rebuild)}
+
+    def _write_shards(self, keys: Set[str], full_rebuild: bool) -> int:
+        """Rewrite the shards holding the given repositories' lists"""
+        shards = {list_shard(key) for key in keys}
+        if not shards and not full_rebuild:
+            return 0
+        by_shard = defaultdict(dict)
+        for key, entry in self.state['docs'].items():
+            shard = list_shard(key)
+            if full_rebuild or shard in shards:
+                by_shard[shard][key] = entry['neighbours']
+
+        written = 0
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for shard in shards | set(by_shard):
+            path = self.output_dir / f"similar-{shard}.json"
+            lists = by_shard.get(shard)
+            if lists:
+                written += write_if_changed(path, json.dumps(lists, ensure_ascii=False, separators=(',', ':'),
+                                                             sort_keys=True))
+            elif path.exists():
+                path.unlink()
+                written += 1
+        if full_rebuild:
+            for path in self.output_dir.glob('similar-*.json'):
+                if path.stem[len('similar-'):] not in by_shard:
+                    path.unlink()
+                    written += 1
+        return written
+
+    def stats(self) -> Dict[str, int]:
+        """Describe the index"""
+        return {'documents': len(self.state['docs']), 'features': len(self.state['idf']),
+                'idf_documents': self.state['idf_documents']}
+
+
+def main():
+    """Build or refresh the similar repositories index from the repository store"""
+    parser = argparse.ArgumentParser(description="Build the similar repositories index")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--output', default='static/similar')
+    parser.add_argument('--neighbours', type=int, default=DEFAULT_NEIGHBOURS)
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    log = RepositoryLog(data_dir)
+    if not log.exists():
+        log.import_json(data_dir / "repositories.json")
+
+    classifier = RepositoryClassifier()
+    index = SimilarityIndex(args.output, data_dir / "similar_index_state.json", args.neighbours)
+    stats = index.build(log.iter_records(), lambda repo: classifier.classify(repo).category)
+    print(f"🧭 Similar repositories for {stats['documents']} repositories "
+          f"({stats['recomputed']} lists recomputed, {stats['displaced']} displaced, "
+          f"{stats['files_written']} files written)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Star History Store for Alot1z GitHub Repository Wiki System
+
+Keeps an append-only time series of every repository's star count, one
+sample per run, so trends survive the snapshot being overwritten. The store
+is columnar: each sample is a row of int32 star counts in column order,
+appended to one binary file, with a small index of (timestamp, offset,
+length) per sample. Repositories get a fixed column the first time they are
+seen, so rows only grow. Reads are memory-mapped and touch only the rows a
+query needs: star velocity and acceleration over a window need just the
+latest sample and the ones a window and two windows earlier, whatever the
+history length. With NumPy installed they are computed as vector operations
+across every repository at once; without it a plain-array fallback gives
+the same results more slowly.
+
+Usage:
+    python scripts/star_history.py data/star_history --window 7 --limit 20
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import argparse
+import heapq
+import mmap
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from repository_model import Repository
+from repository_store import repository_key
+
+try:
+    import numpy as np
+except ImportError:  # optional; trend queries fall back to the array module
+    np = None
+
+MISSING = -1
+SECONDS_PER_DAY = 86400
+DEFAULT_WINDOW_DAYS = 7
+INDEX_FIELDS = 3  # timestamp, offset and length of each sample row
+BIG_ENDIAN = sys.byteorder == 'big'
+
+
+class Trend(NamedTuple):
+    key: str
+    stars: int
+    gain: int
+    velocity: float
+    acceleration: Optional[float]
+
+
+def _read_array(path: Path, typecode: str) -> array:
+    """Read a little-endian binary file into an array"""
+    values = array(typecode)
+    try:
+        values.frombytes(path.read_bytes())
+    except FileNotFoundError:
+        return values
+    if BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _to_bytes(values: array) -> bytes:
+    """Serialize an array as little-endian bytes"""
+    if BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class StarHistory:
+    def __init__(self, history_dir: str):
+        self.history_dir = Path(history_dir)
+        self.keys_file = self.history_dir / "keys.txt"
+        self.samples_file = self.history_dir / "stars.i32"
+        self.index_file = self.history_dir / "samples.i64"
+        self._keys: Optional[List[str]] = None
+        self._columns: Optional[Dict[str, int]] = None
+
+    def _load_keys(self) -> List[str]:
+        """Load the repository keys in column order on first use"""
+        if self._keys is None:
+            try:
+                with open(self.keys_file, 'r', encoding='utf-8') as f:
+                    self._keys = f.read().splitlines()
+            except FileNotFoundError:
+                self._keys = []
+        return self._keys
+
+    def _column_map(self) -> Dict[str, int]:
+        """Map repository keys to columns; only recording and single-repository reads need it"""
+        if self._columns is None:
+            self._columns = {key: column for column, key in enumerate(self._load_keys())}
+        return self._columns
+
+    def column(self, url: str) -> Optional[int]:
+        """Return a repository's column, or None if it has never been sampled"""
+        return self._column_map().get(repository_key(url))
+
+    def _index(self) -> List[Tuple[int, int, int]]:
+        """Read the (timestamp, offset, length) of every sample"""
+        raw = _read_array(self.index_file, 'q')
+        count = len(raw) // INDEX_FIELDS
+        return [tuple(raw[i * INDEX_FIELDS:(i + 1) * INDEX_FIELDS]) for i in range(count)]
+
+    def __len__(self) -> int:
+        """Number of samples recorded"""
+        try:
+            return self.index_file.stat().st_size // (8 * INDEX_FIELDS)
+        except FileNotFoundError:
+            return 0
+
+    def record(self, repositories: Iterable[Repository], timestamp: Optional[float] = None) -> int:
+        """Append a sample of every repository's star count, returning the number of columns.
+
+        A second sample on the same UTC day replaces the first, so the daemon's
+        frequent polls still leave one sample per day. A timestamp older than
+        the latest sample, from clock skew or a restored data directory, is
+        moved up to the latest one instead of failing the run.
+        """
+        timestamp = int(timestamp if timestamp is not None else time.time())
+        index = self._index()
+        if index and timestamp < index[-1][0]:
+            print(f"⚠️ Star sample at {timestamp} is older than the latest one at {index[-1][0]}; "
+                  f"recording it as the latest")
+            timestamp = index[-1][0]
+        keys = self._load_keys()
+        columns = self._column_map()
+        new_keys = []
+        stars = {}
+        for repo in repositories:
+            key = repository_key(repo.url)
+            if key not in columns:
+                columns[key] = len(keys)
+                keys.append(key)
+                new_keys.append(key)
+            stars[columns[key]] = repo.stars
+
+        row = array('i', [MISSING]) * len(keys)
+        for column, count in stars.items():
+            row[column] = count
+
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        if new_keys:
+            with open(self.keys_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"{key}\n" for key in new_keys))
+
+        if index and index[-1][0] // SECONDS_PER_DAY == timestamp // SECONDS_PER_DAY:
+            index.pop()
+        offset = index[-1][1] + index[-1][2] if index else 0
+
+        # Rows are written before the index entry that points at them, so a crash leaves
+        # at most an unreferenced tail that the next append overwrites
+        with open(self.samples_file, 'a+b') as f:
+            f.truncate(offset * row.itemsize)
+            f.write(_to_bytes(row))
+        index.append((timestamp, offset, len(row)))
+        with open(self.index_file, 'r+b' if self.index_file.exists() else 'wb') as f:
+            f.truncate((len(index) - 1) * 8 * INDEX_FIELDS)
+            f.seek(0, 2)
+            f.write(_to_bytes(array('q', index[-1])))
+        return len(keys)
+
+    def _rows(self, positions: List[int]) -> List[Any]:
+        """Read whole sample rows from the memory-mapped file, padded to the widest of them"""
+        index = self._index()
+        width = max(index[position][2] for position in positions)
+        if np is not None:
+            samples = np.memmap(self.samples_file, dtype='<i4', mode='r')
+            rows = []
+            for position in positions:
+                _, offset, length = index[position]
+                row = np.full(width, MISSING, dtype=np.int64)
+                row[:length] = samples[offset:offset + length]
+                rows.append(row)
+            return rows
+
+        rows = []
+        with open(self.samples_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for position in positions:
+                _, offset, length = index[position]
+                row = array('i')
+                row.frombytes(mapped[offset * 4:(offset + length) * 4])
+                if BIG_ENDIAN:
+                    row.byteswap()
+                row.extend([MISSING] * (width - length))
+                rows.append(row)
+        return rows
+
+    def series(self, url: str) -> List[Tuple[datetime, int]]:
+        """Return one repository's recorded (time, stars) samples"""
+        column = self.column(url)
+        if column is None:
+            return []
+        points = []
+        with open(self.samples_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for timestamp, offset, length in self._index():
+                if column < length:
+                    value = int.from_bytes(mapped[(offset + column) * 4:(offset + column + 1) * 4], 'little', signed=True)
+                    if value != MISSING:
+                        points.append((datetime.fromtimestamp(timestamp, timezone.utc), value))
+        return points
+
+    def trending(self, limit: int = 10, window_days: float = DEFAULT_WINDOW_DAYS) -> List[Trend]:
+        """Rank repositories by stars gained over the window, with velocity and acceleration.
+
+        Velocity is stars per day across the window; acceleration is the change
+        in velocity from the window before, per day. Repositories without a
+        sample at the start of the window are not ranked.
+        """
+        index = self._index()
+        if len(index) < 2:
+            return []
+        times = [entry[0] for entry in index]
+        window = window_days * SECONDS_PER_DAY
+        latest = len(index) - 1
+        # With less history than one window, measure across whatever there is
+        past = min(max(bisect_right(times, times[latest] - window) - 1, 0), latest - 1)
+        previous = bisect_right(times, times[past] - window) - 1
+        elapsed = (times[latest] - times[past]) / SECONDS_PER_DAY
+        previous_elapsed = (times[past] - times[previous]) / SECONDS_PER_DAY if 0 <= previous < past else 0
+
+        positions = [latest, past] + ([previous] if previous_elapsed else [])
+        rows = self._rows(positions)
+        keys = self._load_keys()
+        if np is not None:
+            return self._rank_vectorized(rows, keys, limit, elapsed, previous_elapsed)
+        return self._rank_arrays(rows, keys, limit, elapsed, previous_elapsed)
+
+    def _rank_vectorized(self, rows: List[Any], keys: List[str], limit: int, elapsed: float,
+                         previous_elapsed: float) -> List[Trend]:
+        """Compute every repository's gain at once and pick the top ones with a partial sort"""
+        now, past = rows[0], rows[1]
+        gain = np.where((now >= 0) & (past >= 0), now - past, 0)
+        count = min(limit, int((gain > 0).sum()))
+        if count == 0:
+            return []
+        top = np.argpartition(-gain, count - 1)[:count]
+        top = top[np.lexsort((top, -gain[top]))]
+        acceleration = None
+        if previous_elapsed:
+            earlier = rows[2]
+            previous_velocity = np.where(earlier >= 0, (past - earlier) / previous_elapsed, np.nan)
+            acceleration = (gain / elapsed - previous_velocity) / elapsed
+        return [Trend(keys[i], int(now[i]), int(gain[i]), float(gain[i] / elapsed),
+                      None if acceleration is None or np.isnan(acceleration[i]) else float(acceleration[i]))
+                for i in top]
+
+    def _rank_arrays(self, rows: List[array], keys: List[str], limit: int, elapsed: float,
+                     previous_elapsed: float) -> List[Trend]:
+        """Fallback ranking over plain arrays"""
+        now, past = rows[0], rows[1]
+        earlier = rows[2] if previous_elapsed else None
+        gains = ((new - old, column) for column, (new, old) in enumerate(zip(now, past)) if new >= 0 and old >= 0)
+        top = heapq.nsmallest(limit, ((-gain, column) for gain, column in gains if gain > 0))
+        trends = []
+        for negative_gain, column in top:
+            gain = -negative_gain
+            acceleration = None
+            if earlier is not None and earlier[column] >= 0:
+                previous_velocity = (past[column] - earlier[column]) / previous_elapsed
+                acceleration = (gain / elapsed - previous_velocity) / elapsed
+            trends.append(Trend(keys[column], now[column], gain, gain / elapsed, acceleration))
+        return trends
+
+    def stats(self) -> Dict[str, Any]:
+        """Describe the store"""
+        index = self._index()
+        return {
+            'samples': len(index),
+            'repositories': len(self._load_keys()),
+            'bytes': self.samples_file.stat().st_size if self.samples_file.exists() else 0,
+            'first_sample': datetime.fromtimestamp(index[0][0], timezone.utc).isoformat() if index else None,
+            'last_sample': datetime.fromtimestamp(index[-1][0], timezone.utc).isoformat() if index else None,
+            'backend': 'numpy' if np is not None else 'array'
+        }
+
+
+def main():
+    """Print the repositories trending in the recorded star history"""
+    parser = argparse.ArgumentParser(description="Show trending repositories from the star history")
+    parser.add_argument('history_dir', nargs='?', default='data/star_history')
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW_DAYS, help="window in days")
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    history = StarHistory(args.history_dir)
+    print(f"📈 {history.stats()}")
+    started = time.perf_counter()
+    trends = history.trending(args.limit, args.window)
+    elapsed = (time.perf_counter() - started) * 1000
+    for trend in trends:
+        acceleration = f"{trend.acceleration:+.2f}" if trend.acceleration is not None else "n/a"
+        print(f"   {trend.key:<50} +{trend.gain:<6} {trend.velocity:8.2f}/day  accel {acceleration}")
+    print(f"✅ {len(trends)} trending repositories in {elapsed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Quality Scoring Tests for Alot1z GitHub Repository Wiki System
+
+Checks that repositories parsed from the HTML repositories tab get the
+recency bonus, both from the machine-readable time of the listing and from
+its display date, and that the batch scorer agrees with the single-record
+scorer.
+
+Usage:
+    python -m pytest scripts/test_quality_scoring.py
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from listing_parser import parse_listing_page
+from quality_scoring import score_batch
+from repository_enrichment import calculate_quality_score, parse_timestamp
+from repository_model import Repository
+
+NOW = datetime(2025, 10, 25, 12, 0, tzinfo=timezone.utc)
+
+
+def listing_item(name: str, updated: datetime) -> str:
+    """Render one repository item the way the repositories tab does"""
+    return f"""
+    <li class="col-12 public source" itemprop="owns">
+      <h3><a href="/Alot1z/{name}" itemprop="name codeRepository">{name}</a></h3>
+      <p itemprop="description">A small tool</p>
+      <span itemprop="programmingLanguage">Rust</span>
+      <a href="/Alot1z/{name}/stargazers">12</a>
+      Updated <relative-time datetime="{updated:%Y-%m-%dT%H:%M:%SZ}" class="no-wrap">{updated:%b %d, %Y}</relative-time>
+    </li>"""
+
+
+class HtmlListingRecencyTest(unittest.TestCase):
+    def test_recent_push_scores_the_recency_bonus(self):
+        """A repository updated six days ago gets the 90-day bonus"""
+        recent, = parse_listing_page(f"<ul>{listing_item('recent', NOW - timedelta(days=6))}</ul>")
+        stale, = parse_listing_page(f"<ul>{listing_item('stale', NOW - timedelta(days=800))}</ul>")
+        self.assertEqual(recent.last_updated, (NOW - timedelta(days=6)).strftime('%b %d, %Y'))
+        self.assertEqual(calculate_quality_score(recent, NOW) - calculate_quality_score(stale, NOW), 0.5)
+
+    def test_display_date_alone_still_scores(self):
+        """Records stored before the timestamp was captured fall back to the display date"""
+        repo = Repository("https://github.com/Alot1z/old", "old", language="Rust",
+                          last_updated=(NOW - timedelta(days=6)).strftime('%b %d, %Y'))
+        self.assertEqual(parse_timestamp(repo.last_updated).date(), (NOW - timedelta(days=6)).date())
+        undated = Repository("https://github.com/Alot1z/undated", "undated", language="Rust")
+        self.assertEqual(calculate_quality_score(repo, NOW) - calculate_quality_score(undated, NOW), 0.5)
+
+    def test_batch_matches_single_scores(self):
+        """The batch scorer reads the same push times as the single-record scorer"""
+        html = "<ul>" + "".join(listing_item(f"repo-{days}", NOW - timedelta(days=days))
+                                for days in (1, 60, 200, 500)) + "</ul>"
+        repositories = parse_listing_page(html)
+        self.assertEqual(score_batch(repositories, now=NOW),
+                         [calculate_quality_score(repo, NOW) for repo in repositories])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Watch Daemon for Alot1z GitHub Repository Wiki System
+
+Runs the auto-updater as a long-lived asyncio service. The repository store,
+the rendered fragments and the HTTP session stay warm in memory between
+polls, so each poll is one incremental sync request. Polling is adaptive:
+the interval doubles after every poll that finds nothing and snaps back to
+the minimum when something changes. Bursts of changes are debounced into a
+single wiki regeneration. Every poll and regeneration is saved as a run of
+its own in the metrics file. A small local HTTP endpoint reports health,
+poll/regeneration latencies and the metrics of the latest of each for
+monitoring.
+
+Usage:
+    python scripts/auto_updater.py --daemon --status-port 8766
+    curl http://127.0.0.1:8766/status
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import asyncio
+import json
+import math
+import signal
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MIN_INTERVAL = 300.0
+DEFAULT_MAX_INTERVAL = 3600.0
+BACKOFF_FACTOR = 2.0
+DEFAULT_DEBOUNCE = 60.0
+UNHEALTHY_AFTER_FAILURES = 3
+LATENCY_WINDOW = 100
+
+
+class LatencyStats:
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float):
+        """Record one measurement"""
+        self.samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the recent measurements in milliseconds"""
+        if not self.samples:
+            return {'count': 0}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return {
+            'count': self.count,
+            'last_ms': round(self.samples[-1] * 1000, 1),
+            'mean_ms': round(sum(ordered) / len(ordered) * 1000, 1),
+            'p50_ms': round(ordered[len(ordered) // 2] * 1000, 1),
+            'p95_ms': round(p95 * 1000, 1),
+            'max_ms': round(ordered[-1] * 1000, 1)
+        }
+
+
+class UpdateDaemon:
+    def __init__(self, updater: Any, min_interval: float = DEFAULT_MIN_INTERVAL,
+                 max_interval: float = DEFAULT_MAX_INTERVAL, debounce: float = DEFAULT_DEBOUNCE,
+                 max_delay: Optional[float] = None, status_host: str = '127.0.0.1',
+                 status_port: Optional[int] = 8766):
+        self.updater = updater
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.debounce = debounce
+        # A steady trickle of changes must not postpone regeneration forever
+        self.max_delay = max_delay if max_delay is not None else debounce * 5
+        self.status_host = status_host
+        self.status_port = status_port
+        self.interval = min_interval
+        self.latency = {'poll': LatencyStats(), 'regenerate': LatencyStats()}
+        self.started_at = None
+        self.startup_seconds = None
+        self.polls = 0
+        self.changes_seen = 0
+        self.pending_changes = 0
+        self.regenerations = 0
+        self.consecutive_failures = 0
+        self.last_poll_at = None
+        self.last_change_at = None
+        self.last_regeneration_at = None
+        self.last_error = None
+        self.warmed_up = False
+        self.last_poll_metrics = None
+        self.last_regeneration_metrics = None
+        self.next_poll_at = None
+        # The updater is not thread-safe, so every blocking step runs on one worker thread
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='updater')
+        self._stop = None
+        self._wake = None
+        self._regeneration = None
+        self._first_pending = None
+        self._latest_pending = None
+        self._server = None
+        self._started_clock = 0.0
+
+    async def _run_blocking(self, function: Callable, *args: Any) -> Any:
+        """Run an updater step on the worker thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._worker, function, *args)
+
+    def _warm_up(self) -> int:
+        """Load the store and catch up with the listing, as a scheduled update does"""
+        self.updater.run_scheduled_update()
+        self.warmed_up = True
+        return 0
+
+    def _poll_once(self) -> int:
+        """Check for updates, apply them to the warm store and return how many repositories changed"""
+        # Each poll is its own run in the metrics file, so counters do not pile up over the daemon's lifetime
+        self.updater.start_metrics()
+        try:
+            updates = self.updater.check_for_updates()
+            changed = 0
+            if self.updater.apply_updates(updates):
+                changed = (len(updates['new_repositories']) + len(updates['updated_repositories']) +
+                           len(updates['removed_repositories']))
+            self.updater.save_sync_state()
+            return changed
+        finally:
+            self.last_poll_metrics = self.updater.save_metrics()
+
+    def _regenerate_once(self):
+        """Regenerate the wiki as a run of its own in the metrics file"""
+        self.updater.start_metrics()
+        try:
+            self.updater.regenerate_wiki_pages()
+        finally:
+            self.last_regeneration_metrics = self.updater.save_metrics()
+
+    async def _poll_forever(self):
+        """Poll on an adaptive schedule until asked to stop"""
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                # A failed warm-up is retried on the poll schedule until the store is loaded
+                changed = await self._run_blocking(self._poll_once if self.warmed_up else self._warm_up)
+            except Exception as e:
+                # Anything a poll raises, from network errors to malformed data, must not end the daemon
+                self._record_failure('Poll', e)
+                changed = 0
+            else:
+                self.consecutive_failures = 0
+            self.latency['poll'].add(time.perf_counter() - started)
+            self.polls += 1
+            self.last_poll_at = datetime.now().isoformat()
+
+            if changed:
+                self.interval = self.min_interval
+                self._note_changes(changed)
+            else:
+                # Failures back off too, so an outage is not hammered at the minimum interval
+                self.interval = min(self.interval * BACKOFF_FACTOR, self.max_interval)
+
+            self.next_poll_at = time.time() + self.interval
+            print(f"💤 Next poll in {self.interval:.0f}s")
+            await self._sleep(self.interval)
+
+    def _record_failure(self, step: str, error: Exception):
+        """Count a failed step and remember its error for the status endpoint"""
+        self.consecutive_failures += 1
+        self.last_error = f"{datetime.now().isoformat()}: {error}"
+        print(f"❌ {step} failed ({self.consecutive_failures} in a row): {error}")
+
+    async def _sleep(self, seconds: float):
+        """Sleep until the next poll, waking early on shutdown or a requested poll"""
+        self._wake.clear()
+        waiters = [asyncio.ensure_future(self._stop.wait()), asyncio.ensure_future(self._wake.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    def _note_changes(self, count: int):
+        """Queue a regeneration for a batch of changes, debouncing bursts"""
+        now = time.monotonic()
+        self.changes_seen += count
+        self.pending_changes += count
+        self.last_change_at = datetime.now().isoformat()
+        self._latest_pending = now
+        if self._first_pending is None:
+            self._first_pending = now
+        if self._regeneration is None or self._regeneration.done():
+            self._regeneration = asyncio.ensure_future(self._regenerate_when_quiet())
+
+    async def _regenerate_when_quiet(self):
+        """Regenerate once changes have stopped arriving for the debounce period"""
+        while not self._stop.is_set():
+            now = time.monotonic()
+            quiet_at = self._latest_pending + self.debounce
+            deadline = min(quiet_at, self._first_pending + self.max_delay)
+            if now >= deadline:
+                break
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=deadline - now)
+            except asyncio.TimeoutError:
+                pass
+        await self._regenerate()
+
+    async def _regenerate(self):
+        """Regenerate the wiki for every change queued so far"""
+        if not self.pending_changes:
+            return
+        batch = self.pending_changes
+        self.pending_changes = 0
+        self._first_pending = None
+        print(f"🔄 Regenerating after {batch} change(s)")
+        started = time.perf_counter()
+        try:
+            await self._run_blocking(self._regenerate_once)
+        except Exception as e:
+            # Keep the changes queued so the next burst retries them
+            self.pending_changes += batch
+            self._first_pending = time.monotonic()
+            self.last_error = f"{datetime.now().isoformat()}: {e}"
+            print(f"❌ Regeneration failed: {e}")
+            return
+        self.latency['regenerate'].add(time.perf_counter() - started)
+        self.regenerations += 1
+        self.last_regeneration_at = datetime.now().isoformat()
+
+    def healthy(self) -> bool:
+        """A daemon is healthy until several polls in a row have failed"""
+        return self.consecutive_failures < UNHEALTHY_AFTER_FAILURES
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the daemon's state for the status endpoint"""
+        return {
+            'status': 'ok' if self.healthy() else 'failing',
+            'started_at': self.started_at,
+            'uptime_seconds': round(time.time() - self._started_clock, 1) if self.started_at else 0,
+            'startup_seconds': self.startup_seconds,
+            'repositories': len(self.updater.repositories),
+            'polls': self.polls,
+            'poll_interval_seconds': self.interval,
+            'next_poll_in_seconds': round(max(0.0, self.next_poll_at - time.time()), 1) if self.next_poll_at else None,
+            'last_poll_at': self.last_poll_at,
+            'consecutive_failures': self.consecutive_failures,
+            'last_error': self.last_error,
+            'changes_seen': self.changes_seen,
+            'pending_changes': self.pending_changes,
+            'last_change_at': self.last_change_at,
+            'regenerations': self.regenerations,
+            'last_regeneration_at': self.last_regeneration_at,
+            'high_water_mark': self.updater.sync_state.get('high_water_mark'),
+            'last_full_sync': self.updater.sync_state.get('last_full_sync'),
+            'fragments': self.updater.fragments.stats(),
+            'last_poll_metrics': self.last_poll_metrics,
+            'last_regeneration_metrics': self.last_regeneration_metrics,
+            'latency': {stage: stats.summary() for stage, stats in self.latency.items()}
+        }
+
+    async def _handle_status(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer GET /health and GET /status; POST /poll wakes the poller early"""
+        try:
+            request_line = (await asyncio.wait_for(reader.readline(), timeout=5)).decode('latin-1').split()
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b'\r\n', b'\n', b''):
+                pass
+        except (asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+
+        method, path = (request_line + ['', ''])[:2]
+        path = path.split('?', 1)[0]
+        if method == 'GET' and path == '/health':
+            code, body = (200, {'status': 'ok'}) if self.healthy() else (503, {'status': 'failing'})
+        elif method == 'GET' and path in ('/', '/status'):
+            code, body = 200, self.status()
+        elif method == 'POST' and path == '/poll':
+            self._wake.set()
+            code, body = 202, {'status': 'polling'}
+        else:
+            code, body = 404, {'error': 'not found'}
+
+        data = json.dumps(body, indent=2).encode('utf-8')
+        reason = {200: 'OK', 202: 'Accepted', 404: 'Not Found', 503: 'Service Unavailable'}[code]
+        writer.write(f"HTTP/1.1 {code} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode('latin-1') + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    def stop(self):
+        """Ask the daemon to finish its current step and exit"""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self):
+        """Warm up the updater, then poll and serve status until stopped"""
+        self._stop = asyncio.Event()
+        self._wake = asyncio.Event()
+        self.started_at = datetime.now().isoformat()
+        self._started_clock = time.time()
+
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops have no signal handlers; Ctrl+C still interrupts asyncio.run
+                pass
+
+        try:
+            if self.status_port is not None:
+                self._server = await asyncio.start_server(self._handle_status, self.status_host, self.status_port)
+                host, port = self._server.sockets[0].getsockname()[:2]
+                self.status_port = port
+                print(f"🩺 Status endpoint at http://{host}:{port}/status")
+
+            print("🚀 Warming up: loading the repository store")
+            started = time.perf_counter()
+            try:
+                await self._run_blocking(self._warm_up)
+            except Exception as e:
+                self._record_failure('Warm-up', e)
+                self.interval = min(self.interval * BACKOFF_FACTOR, self.max_interval)
+            else:
+                self.startup_seconds = round(time.perf_counter() - started, 3)
+            self.last_poll_at = datetime.now().isoformat()
+            self.next_poll_at = time.time() + self.interval
+            await self._sleep(self.interval)
+
+            await self._poll_forever()
+        finally:
+            # Flush changes that were still waiting out their debounce period
+            if self._regeneration is not None:
+                await self._regeneration
+            await self._regenerate()
+            if self._server is not None:
+                self._server.close()
+                await self._server.wait_closed()
+            self._worker.shutdown(wait=True)
+            print(f"👋 Daemon stopped after {self.polls} polls and {self.regenerations} regenerations")
+
+
+def run_daemon(updater: Any, **options: Any):
+    """Run an UpdateDaemon until interrupted"""
+    daemon = UpdateDaemon(updater, **options)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        pass
+    return daemon
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Wiki Settings Loader for Alot1z GitHub Repository Wiki System
+
+Reads the options in config.ini that the Python scripts honour, with the
+same defaults the file ships with, so a missing file or key never stops a
+run. Values are parsed once into an immutable settings record.
+
+Author: Generated for Alot1z GitHub Repository Wiki System
+License: MIT License
+"""
+
+import configparser
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+CONFIG_FILE = Path(__file__).resolve().parent.parent / "config.ini"
+
+
+class ScoringWeights(NamedTuple):
+    base: float = 5.0
+    popular_language: float = 1.0
+    popular_languages: Tuple[str, ...] = ('python', 'javascript', 'typescript', 'go', 'rust', 'java', 'c#', 'swift')
+    mit_license: float = 1.0
+    pushed_within_90_days: float = 0.5
+    pushed_within_365_days: float = 0.25
+    stars_per_thousand: float = 1.0
+    stars_cap: float = 1.0
+    readme: float = 0.5
+    readme_min_bytes: float = 2000
+    missing_readme: float = -0.5
+    topics: float = 0.25
+    issue_backlog: float = -0.5
+    archived: float = -1.5
+
+
+class WikiSettings(NamedTuple):
+    max_repositories_per_category: int = 50
+    include_forks: bool = False
+    min_stars: int = 1
+    scoring: ScoringWeights = ScoringWeights()
+    recommendations_engine: bool = True
+    # The profile tab named by main_repository_path: 'stars' or 'repositories'
+    repository_tab: str = 'stars'
+
+
+def load_settings(config_file: Optional[str] = None) -> WikiSettings:
+    """Load settings from config.ini, falling back to defaults for anything missing or malformed"""
+    parser = configparser.ConfigParser()
+    parser.read(config_file or CONFIG_FILE, encoding='utf-8')
+    defaults = WikiSettings()
+
+    def read(getter: Callable[..., Any], option: str, section: str = 'crawler_settings',
+             fallback: Any = None) -> Any:
+        fallback = getattr(defaults, option) if fallback is None else fallback
+        try:
+            return getter(section, option, fallback=fallback)
+        except ValueError:
+            print(f"⚠️ Ignoring malformed {option} in config.ini; using {fallback}")
+            return fallback
+
+    weights = ScoringWeights()
+    languages = parser.get('quality_scoring', 'popular_languages', fallback=None)
+    scoring = weights._replace(
+        popular_languages=(tuple(language.strip().lower() for language in languages.split(',') if language.strip())
+                           if languages is not None else weights.popular_languages),
+        **{field: read(parser.getfloat, field, 'quality_scoring', getattr(weights, field))
+           for field in ScoringWeights._fields if field != 'popular_languages'}
+    )
+
+    main_path = parser.get('repositories', 'main_repository_path', fallback='')
+    tab = parse_qs(urlsplit(main_path).query).get('tab', [defaults.repository_tab])[0]
+
+    return WikiSettings(
+        max_repositories_per_category=max(1, read(parser.getint, 'max_repositories_per_category')),
+        include_forks=read(parser.getboolean, 'include_forks'),
+        min_stars=max(0, read(parser.getint, 'min_stars')),
+        scoring=scoring,
+        recommendations_engine=read(parser.getboolean, 'recommendations_engine', 'advanced_features'),
+        repository_tab=tab
+    )